@@ -0,0 +1,81 @@
+"""
+Cost and size of ``diff_blocks`` patches for a few edits to a large document.
+
+Compares with the baseline of dumping both revisions with ``blocks_to_dict``
+and comparing the dicts, which only says *whether* something changed, and
+with storing the new revision as JSON.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_block_diff.py [--blocks N]
+"""
+
+import argparse
+import json
+import time
+
+from blocknote.converter import (
+    apply_patch,
+    blocks_to_dict,
+    diff_blocks,
+    dict_to_blocks,
+)
+from blocknote.schema import Block, InlineContent
+
+
+def build_document(count):
+    """Return ``count`` lists of three paragraphs."""
+    return [
+        Block(
+            id=f"l{i}",
+            type="bulletListItem",
+            children=[
+                Block(
+                    id=f"l{i}-{j}",
+                    type="paragraph",
+                    content=[
+                        InlineContent(
+                            type="text", text=f"Item {j} of list {i} " * 4
+                        )
+                    ],
+                )
+                for j in range(3)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    old = build_document(args.blocks)
+    new = dict_to_blocks(blocks_to_dict(old))
+    new[5].children[1].content[0].text += " edited"
+    new.insert(10, new.pop(args.blocks - 1))
+    new[20].children.append(new[30].children.pop())
+    del new[40]
+
+    _, dump_s = timed(lambda: blocks_to_dict(old) == blocks_to_dict(new))
+    ops, diff_s = timed(lambda: diff_blocks(old, new))
+    payload = json.dumps(ops, separators=(",", ":"))
+    document = json.dumps(blocks_to_dict(new), separators=(",", ":"))
+    _, apply_s = timed(lambda: apply_patch(old, json.loads(payload)))
+    assert blocks_to_dict(old) == blocks_to_dict(new)
+
+    print(f"{4 * args.blocks} blocks, {len(ops)} ops")
+    print(f"  dump + compare dicts  {dump_s * 1e3:8.1f} ms")
+    print(f"  diff_blocks           {diff_s * 1e3:8.1f} ms")
+    print(f"  apply_patch           {apply_s * 1e3:8.1f} ms")
+    print(f"  patch JSON {len(payload):,} bytes, document {len(document):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Throughput of the block ID generators in ``blocknote.converter.block_ids``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_block_ids.py [--ids N]
+"""
+
+import argparse
+import time
+
+from blocknote.converter.block_ids import (
+    content_hash_ids,
+    counter_ids,
+    uuid4_ids,
+    uuid7_ids,
+)
+from blocknote.schema import InlineContent
+
+FACTORIES = {
+    "uuid4_ids()": uuid4_ids(),
+    "counter_ids()": counter_ids(),
+    "counter_ids('doc-')": counter_ids(prefix="doc-"),
+    "uuid7_ids()": uuid7_ids(),
+    "content_hash_ids()": content_hash_ids(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ids", type=int, default=100_000)
+    args = parser.parse_args()
+
+    content = [InlineContent(type="text", text="A typical paragraph of text.")]
+    baseline = None
+    for name, factory in FACTORIES.items():
+        next_id = factory()
+        start = time.perf_counter()
+        for _ in range(args.ids):
+            next_id("paragraph", {}, content)
+        elapsed = time.perf_counter() - start
+        per_id_ns = elapsed / args.ids * 1e9
+        baseline = baseline or per_id_ns
+        print(f"{name:22} {per_id_ns:8.0f} ns/id  ({baseline / per_id_ns:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
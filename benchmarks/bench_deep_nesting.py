@@ -0,0 +1,81 @@
+"""
+Time per block to convert a single chain of nested blocks of growing depth.
+
+Each level holds one paragraph whose only child is the next level, the
+shape of a pathologically nested paste. Constant time per block across
+depths shows the converters scale linearly with nesting. ``from_json``
+rejects documents nested more than about 2,000 levels deep, so it is
+only timed up to ``--json-depth`` levels.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_deep_nesting.py [--depths N ...]
+"""
+
+import argparse
+import time
+
+from blocknote.converter import (
+    blocks_from_json,
+    blocks_to_dict,
+    blocks_to_json,
+    dict_to_blocks,
+)
+
+
+def build_chain(depth):
+    """Return one block dict with ``depth - 1`` levels of descendants."""
+    root = block = {"id": "0", "type": "paragraph", "content": "level 0"}
+    for level in range(1, depth):
+        child = {"id": str(level), "type": "paragraph", "content": "x"}
+        block["children"] = [child]
+        block = child
+    return [root]
+
+
+def timed(fn, repeat=3):
+    """Best of ``repeat`` runs of ``fn()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--json-depth",
+        type=int,
+        default=1_000,
+        help="deepest chain timed with blocks_from_json",
+    )
+    args = parser.parse_args()
+
+    names = ["validate", "trusted", "to_dict", "to_json", "from_json"]
+    print("microseconds per block")
+    print(f"{'depth':>8}" + "".join(f"{name:>11}" for name in names))
+    for depth in args.depths:
+        data = build_chain(depth)
+        blocks = dict_to_blocks(data)
+        payload = blocks_to_json(blocks)
+        timings = [
+            timed(lambda: dict_to_blocks(data)),
+            timed(lambda: dict_to_blocks(data, trusted=True)),
+            timed(lambda: blocks_to_dict(blocks)),
+            timed(lambda: blocks_to_json(blocks)),
+        ]
+        if depth <= args.json_depth:
+            timings.append(timed(lambda: blocks_from_json(payload)))
+        print(
+            f"{depth:>8}"
+            + "".join(f"{seconds / depth * 1e6:>11.2f}" for seconds in timings)
+            + (f"{'-':>11}" if depth > args.json_depth else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
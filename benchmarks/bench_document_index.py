@@ -0,0 +1,77 @@
+"""
+Block lookups by ID: recursive scan of the block list versus ``Document``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_document_index.py [--blocks N]
+"""
+
+import argparse
+import random
+import time
+
+from blocknote.converter import Document
+from blocknote.schema import Block, InlineContent
+
+
+def build_document(count):
+    """Return ``count`` lists of three paragraphs."""
+    return [
+        Block(
+            id=f"l{i}",
+            type="bulletListItem",
+            children=[
+                Block(
+                    id=f"l{i}-{j}",
+                    type="paragraph",
+                    content=[InlineContent(type="text", text=f"Item {j}")],
+                )
+                for j in range(3)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def find(blocks, block_id):
+    """Recursive scan, as callers did before ``Document``."""
+    for block in blocks:
+        if block.id == block_id:
+            return block
+        found = find(block.children, block_id)
+        if found is not None:
+            return found
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    args = parser.parse_args()
+
+    blocks = build_document(args.blocks)
+    rng = random.Random(0)
+    ids = [
+        f"l{rng.randrange(args.blocks)}-{rng.randrange(3)}"
+        for _ in range(args.lookups)
+    ]
+
+    start = time.perf_counter()
+    for block_id in ids:
+        find(blocks, block_id)
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    document = Document(blocks)
+    for block_id in ids:
+        document.get(block_id)
+        document.parent(block_id)
+    indexed = time.perf_counter() - start
+
+    print(f"{4 * args.blocks} blocks, {args.lookups} lookups")
+    print(f"  recursive scan          {scan * 1e3:8.1f} ms")
+    print(f"  Document (incl. index)  {indexed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
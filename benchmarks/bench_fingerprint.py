@@ -0,0 +1,86 @@
+"""
+Time to fingerprint a document cold, unchanged and after a one-block edit.
+
+Compares ``document_fingerprint`` with hashing a full ``blocks_to_dict``
+dump, the only way to compare documents before fingerprints existed.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_fingerprint.py [--blocks N]
+"""
+
+import argparse
+import hashlib
+import json
+import time
+
+from blocknote.converter import blocks_to_dict, document_fingerprint
+from blocknote.converter.fingerprint import _memoized_digest
+from blocknote.schema import Block, InlineContent
+
+
+def build_document(count):
+    """Return ``count`` list items, each with two styled children."""
+    return [
+        Block(
+            id=f"l{i}",
+            type="bulletListItem",
+            content=[InlineContent(type="text", text=f"Item {i}")],
+            children=[
+                Block(
+                    id=f"l{i}-{j}",
+                    type="paragraph",
+                    content=[
+                        InlineContent(
+                            type="text",
+                            text=f"Child {j} of {i} ",
+                            styles={"bold": j == 0},
+                        ),
+                        InlineContent(type="text", text="with text " * 5),
+                    ],
+                )
+                for j in range(2)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def dump_digest(blocks):
+    payload = json.dumps(blocks_to_dict(blocks), sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+
+def timed(fn, repeat=1):
+    """Best of ``repeat`` runs of ``fn()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    blocks = build_document(args.blocks)
+    _memoized_digest.cache_clear()
+    print(f"{args.blocks} top-level blocks, {3 * args.blocks} in total")
+    dump = timed(lambda: dump_digest(blocks), repeat=3)
+    print(f"  dict dump + hash     {dump:.3f} s")
+    cold = timed(lambda: document_fingerprint(blocks))
+    print(f"  fingerprint, cold    {cold:.3f} s")
+    warm = timed(lambda: document_fingerprint(blocks), repeat=3)
+    print(f"  fingerprint, warm    {warm:.3f} s")
+
+    edited = float("inf")
+    for edit in range(3):
+        blocks[edit * 100].children[1].content[0].text = f"Edited {edit}"
+        edited = min(edited, timed(lambda: document_fingerprint(blocks)))
+    print(f"  fingerprint, 1 edit  {edited:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
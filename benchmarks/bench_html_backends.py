@@ -0,0 +1,113 @@
+"""
+Throughput of ``html_to_blocks`` with the stdlib and lxml backends.
+
+Two documents are parsed: an export rendered by ``blocks_to_html`` and
+a Word-style paste with nested spans. "tokenize" is the parser alone
+(``html.parser.HTMLParser`` without handlers versus building the lxml
+tree); "html_to_blocks" includes building and validating the blocks,
+which both backends share.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_html_backends.py [--count N]
+"""
+
+import argparse
+import time
+from html.parser import HTMLParser
+
+from blocknote.converter import blocks_to_html
+from blocknote.converter.block_ids import counter_ids
+from blocknote.converter.html_to_blocknote import LXML_AVAILABLE, html_to_blocks
+from blocknote.schema import Block, InlineContent
+
+
+def build_export(count):
+    """HTML rendered from headings, styled paragraphs and list items."""
+    blocks = []
+    for i in range(count):
+        content = [
+            InlineContent(type="text", text=f"Paragraph {i} with ", styles={}),
+            InlineContent(type="text", text="bold", styles={"bold": True}),
+            InlineContent(
+                type="text",
+                text=" & coloured text",
+                styles={"textColor": "red", "italic": True},
+            ),
+        ]
+        block_type = ("heading", "paragraph", "bulletListItem")[i % 3]
+        props = {"level": 2} if block_type == "heading" else {}
+        blocks.append(
+            Block(id=str(i), type=block_type, props=props, content=content)
+        )
+    return blocks_to_html(blocks)
+
+
+def build_paste(count):
+    """Word-style paragraphs: spans within spans around short runs."""
+    return "".join(
+        f'<p class=MsoNormal><span lang=EN-US style="color: #333333">'
+        f"<span>Item {i} </span><b><span>bold</span></b><span> and "
+        f'</span><span style="background-color: yellow"><i>marked</i>'
+        f"</span><o:p>&nbsp;</o:p></span></p>\n"
+        for i in range(count)
+    )
+
+
+def timed(fn, repeat=3):
+    """Best of ``repeat`` runs of ``fn()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def tokenize_stdlib(html):
+    parser = HTMLParser()
+    parser.feed(html)
+    parser.close()
+
+
+def tokenize_lxml(html):
+    from lxml import etree
+
+    etree.fromstring(html, etree.HTMLParser(huge_tree=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+    if not LXML_AVAILABLE:
+        parser.exit(1, "lxml is not installed: pip install lxml\n")
+
+    print("MB/s (higher is better)")
+    print(
+        f"{'document':>10}{'MB':>7}{'tokenize':>20}"
+        f"{'html_to_blocks':>20}{'speedup':>9}"
+    )
+    print(f"{'':>17}{'stdlib':>10}{'lxml':>10}{'stdlib':>10}{'lxml':>10}")
+    for name, html in (
+        ("export", build_export(args.count)),
+        ("paste", build_paste(args.count)),
+    ):
+        assert html_to_blocks(html, counter_ids(), backend="lxml") == (
+            html_to_blocks(html, counter_ids(), backend="stdlib")
+        )
+        size = len(html.encode("utf-8")) / 1e6
+        timings = [
+            timed(lambda: tokenize_stdlib(html)),
+            timed(lambda: tokenize_lxml(html)),
+            timed(lambda: html_to_blocks(html, backend="stdlib")),
+            timed(lambda: html_to_blocks(html, backend="lxml")),
+        ]
+        print(
+            f"{name:>10}{size:>7.1f}"
+            + "".join(f"{size / seconds:>10.1f}" for seconds in timings)
+            + f"{timings[2] / timings[3]:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
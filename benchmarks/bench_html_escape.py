@@ -0,0 +1,100 @@
+"""
+Throughput of HTML escaping and unescaping strategies.
+
+Compares the chained ``str.replace`` calls used previously, a precompiled
+``str.translate`` table with and without a regex fast path, and
+``html.escape`` (used by ``_escape_html``) on mostly-ASCII prose,
+code-heavy text and CJK text. The unescape section compares the previous
+replace chain with ``_unescape_html``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_html_escape.py
+"""
+
+import html
+import re
+import timeit
+
+from blocknote.converter.html_to_blocknote import _unescape_html
+
+CORPORA = {
+    "prose": (
+        "The committee reviewed the quarterly figures and agreed to revisit "
+        "the budget next month. "
+    ),
+    "code": 'if (a < b && c > d) { s = "x"; t = \'y\'; } ',
+    "cjk": "日本語のテキストです。中文文本内容。한국어 텍스트. ",
+}
+RUN_LENGTHS = (16, 256, 4096)
+
+_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+_NEEDS_ESCAPE = re.compile("[&<>\"']").search
+
+
+def replace_chain(text: str) -> str:
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+    )
+
+
+def translate(text: str) -> str:
+    return text.translate(_TABLE)
+
+
+def translate_fast_path(text: str) -> str:
+    return text.translate(_TABLE) if _NEEDS_ESCAPE(text) else text
+
+
+def unescape_chain(text: str) -> str:
+    return (
+        text.replace("&amp;", "&")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+        .replace("&#x27;", "'")
+    )
+
+
+ESCAPERS = {
+    "replace chain": replace_chain,
+    "translate": translate,
+    "translate+fast": translate_fast_path,
+    "html.escape": html.escape,
+}
+UNESCAPERS = {"replace chain": unescape_chain, "_unescape_html": _unescape_html}
+
+
+def best_ns(fn, text: str, number: int = 1_000) -> float:
+    """Best per-call time in nanoseconds over a few repeats."""
+    return min(timeit.repeat(lambda: fn(text), number=number, repeat=3)) / (
+        number / 1e9
+    )
+
+
+def report(title: str, functions) -> None:
+    print(title)
+    for corpus, sample in CORPORA.items():
+        for length in RUN_LENGTHS:
+            text = (sample * (length // len(sample) + 1))[:length]
+            if functions is UNESCAPERS:
+                text = html.escape(text)
+            timings = "  ".join(
+                f"{name} {best_ns(fn, text):9.0f} ns"
+                for name, fn in functions.items()
+            )
+            print(f"  {corpus:6} {length:5} chars  {timings}")
+
+
+def main():
+    report("escape", ESCAPERS)
+    report("unescape", UNESCAPERS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Import-time benchmark for ``blocknote.converter``.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the
+cumulative import time of the converter package, plus whether an import
+of WeasyPrint was attempted. Importing the converters must not load the PDF backend;
+that only happens on first access to ``blocks_to_pdf``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import blocknote.converter": "import blocknote.converter",
+    "first access to blocks_to_pdf": (
+        "import blocknote.converter as c; c.blocks_to_pdf"
+    ),
+}
+
+
+def measure(statement: str):
+    """Return (cumulative microseconds, imported module names)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules.add(name)
+        if name == "blocknote.converter":
+            total_us = int(cumulative)
+    return total_us, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for label, statement in SCENARIOS.items():
+        timings = []
+        modules = set()
+        for _ in range(args.runs):
+            elapsed, modules = measure(statement)
+            timings.append(elapsed)
+        attempted = "yes" if "weasyprint" in modules else "no"
+        print(
+            f"{label:32} median {statistics.median(timings) / 1000:8.2f} ms"
+            f"  weasyprint imported: {attempted}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Autosave re-rendering: ``blocks_to_html`` versus ``IncrementalRenderer``.
+
+A document is rendered once, then a handful of blocks are edited, moved or
+inserted and it is rendered again, as on every autosave.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_incremental.py [--blocks N]
+"""
+
+import argparse
+import time
+
+from blocknote.converter import IncrementalRenderer, blocks_to_html
+from blocknote.schema import Block, InlineContent
+
+
+def build_document(count):
+    """Return ``count`` lists of three styled items."""
+    return [
+        Block(
+            id=f"l{i}",
+            type="bulletListItem",
+            children=[
+                Block(
+                    id=f"l{i}-{j}",
+                    type="paragraph",
+                    content=[
+                        InlineContent(type="text", text=f"Item {j} of {i} "),
+                        InlineContent(
+                            type="text", text="styled", styles={"bold": True}
+                        ),
+                    ],
+                )
+                for j in range(3)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def edit(blocks, revision):
+    """Edit one block, move one and insert one; return the edited ID."""
+    edited = blocks[revision * 7]
+    edited.children[0].content[0].text = f"Edit {revision}"
+    blocks.insert(0, blocks.pop(revision * 13 + 1))
+    blocks.insert(
+        revision,
+        Block(
+            id=f"new{revision}",
+            type="paragraph",
+            content=[InlineContent(type="text", text="Inserted")],
+        ),
+    )
+    return [edited.id]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--saves", type=int, default=5)
+    args = parser.parse_args()
+
+    blocks = build_document(args.blocks)
+    detecting = IncrementalRenderer()
+    hinted = IncrementalRenderer()
+    detecting.render(blocks)
+    hinted.render(blocks)
+    print(f"{args.blocks} blocks, {args.saves} saves")
+
+    totals = {"blocks_to_html": 0.0, "detect changes": 0.0, "changed=": 0.0}
+    for revision in range(args.saves):
+        changed = edit(blocks, revision)
+
+        start = time.perf_counter()
+        expected = blocks_to_html(blocks)
+        totals["blocks_to_html"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = detecting.render(blocks)
+        totals["detect changes"] += time.perf_counter() - start
+        assert result.html == expected
+
+        start = time.perf_counter()
+        result = hinted.render(blocks, changed=changed)
+        totals["changed="] += time.perf_counter() - start
+        assert result.html == expected
+
+    for name, total in totals.items():
+        print(f"  {name:16} {total / args.saves * 1e3:8.1f} ms/save")
+    print(f"  last save: {result.rendered} rendered, {len(result.patches)} patches")
+
+
+if __name__ == "__main__":
+    main()
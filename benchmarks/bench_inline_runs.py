@@ -0,0 +1,80 @@
+"""
+Runs removed by ``normalize_runs`` and what it saves downstream.
+
+A CMS export is parsed with ``merge_runs=False``, so every text callback
+or inline token is its own run, then normalized. The table shows the
+runs before and after, the JSON size and the best-of-N time to render
+the blocks to HTML either way.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_inline_runs.py [--count N]
+"""
+
+import argparse
+import time
+
+from blocknote.converter import (
+    blocks_to_html,
+    blocks_to_json,
+    html_to_blocks,
+    markdown_to_blocks,
+    normalize_runs,
+)
+
+
+def build_html(count):
+    """Paragraphs whose text is split by entities, comments and tags."""
+    return "".join(
+        f"<p>Item {i} &amp; more<!-- note --> text, <b>bold</b>"
+        f"<b> still bold</b> and <i></i>a tail</p>"
+        for i in range(count)
+    )
+
+
+def build_markdown(count):
+    """Paragraphs with code spans and escapes between plain text."""
+    return "\n\n".join(
+        f"Item {i} uses `code` and \\*stars\\* and *a* *b*"
+        for i in range(count)
+    )
+
+
+def timed(fn, repeat=5):
+    """Best of ``repeat`` runs of ``fn()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name, blocks):
+    before_json = len(blocks_to_json(blocks))
+    before_html = timed(lambda: blocks_to_html(blocks))
+    stats = normalize_runs(blocks)
+    after_json = len(blocks_to_json(blocks))
+    after_html = timed(lambda: blocks_to_html(blocks))
+    print(
+        f"{name:>8}  runs {stats.remaining + stats.removed:>7}"
+        f" -> {stats.remaining:>7} ({stats.merged} merged,"
+        f" {stats.dropped} dropped)"
+        f"  json {before_json / 1e3:8.1f} -> {after_json / 1e3:8.1f} kB"
+        f"  html {before_html * 1e3:7.2f} -> {after_html * 1e3:7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=5_000)
+    args = parser.parse_args()
+
+    report("html", html_to_blocks(build_html(args.count), merge_runs=False))
+    report(
+        "markdown",
+        markdown_to_blocks(build_markdown(args.count), merge_runs=False),
+    )
+
+
+if __name__ == "__main__":
+    main()
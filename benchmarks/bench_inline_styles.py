@@ -0,0 +1,89 @@
+"""
+Rendering cost of styled inline runs with memoized style plans.
+
+Compares the previous one-wrapper-at-a-time approach with the memoized
+opening/closing tag plan used by ``blocks_to_html`` on runs that reuse a
+handful of style combinations, with and without plain runs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_inline_styles.py [--runs N]
+"""
+
+import argparse
+import itertools
+import time
+
+from blocknote.converter.blocknote_to_html import (
+    _escape_html,
+    _extract_content_html,
+)
+from blocknote.schema import InlineContent
+
+STYLED = [
+    {"bold": True},
+    {"italic": True},
+    {"bold": True, "italic": True},
+    {"code": True},
+    {"underline": True, "textColor": "red"},
+    {"bold": True, "backgroundColor": "yellow"},
+]
+MIXES = {
+    "all runs styled": STYLED,
+    "70% plain runs": [{}] * 14 + STYLED,
+}
+
+
+def legacy_extract_content_html(content) -> str:
+    """The previous implementation, re-wrapping once per style."""
+    result_parts = []
+    for item in content:
+        text = _escape_html(item.text)
+        if item.styles.get("bold"):
+            text = f"<strong>{text}</strong>"
+        if item.styles.get("italic"):
+            text = f"<em>{text}</em>"
+        if item.styles.get("underline"):
+            text = f"<u>{text}</u>"
+        if item.styles.get("strike"):
+            text = f"<s>{text}</s>"
+        if item.styles.get("code"):
+            text = f"<code>{text}</code>"
+        if "backgroundColor" in item.styles:
+            bg_color = item.styles["backgroundColor"]
+            text = f'<span style="background-color: {bg_color}">{text}</span>'
+        if "textColor" in item.styles:
+            color = item.styles["textColor"]
+            text = f'<span style="color: {color}">{text}</span>'
+        result_parts.append(text)
+    return "".join(result_parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for mix, combinations in MIXES.items():
+        styles = itertools.cycle(combinations)
+        content = [
+            InlineContent(
+                type="text", text=f"run {i} ", styles=dict(next(styles))
+            )
+            for i in range(args.runs)
+        ]
+        assert legacy_extract_content_html(content) == _extract_content_html(
+            content
+        )
+
+        for name, fn in [
+            ("per-style wrapping", legacy_extract_content_html),
+            ("memoized style plan", _extract_content_html),
+        ]:
+            start = time.perf_counter()
+            fn(content)
+            elapsed = time.perf_counter() - start
+            print(f"{mix:16} {name:20} {elapsed / args.runs * 1e9:8.0f} ns/run")
+
+
+if __name__ == "__main__":
+    main()
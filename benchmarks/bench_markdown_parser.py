@@ -0,0 +1,67 @@
+"""
+Cost of building a MarkdownIt parser per call versus reusing one.
+
+Compares a fresh ``MarkdownIt()`` per conversion (the previous behaviour of
+``markdown_to_blocks``) with the shared parser of ``MarkdownConverter`` on
+1-line, 1 KB and 1 MB inputs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_markdown_parser.py
+"""
+
+import timeit
+
+from blocknote.converter.block_ids import uuid4_ids
+from blocknote.converter.md_to_blocknote import (
+    MarkdownConverter,
+    _tokens_to_blocks,
+    markdown_to_blocks,
+)
+from markdown_it import MarkdownIt
+
+SECTION = (
+    "## Section\n\n"
+    "Some **bold** text and *italic* text in a paragraph.\n\n"
+    "> A quoted line.\n\n"
+    "- item one\n- item two\n\n"
+)
+
+
+def make_input(size: int) -> str:
+    """Repeat a representative section until ``size`` characters."""
+    return (SECTION * (size // len(SECTION) + 1))[:size]
+
+
+def fresh_parser(markdown: str):
+    """Previous behaviour: build a new parser for every call."""
+    return _tokens_to_blocks(MarkdownIt().parse(markdown), uuid4_ids()())
+
+
+def main():
+    converter = MarkdownConverter()
+    inputs = {
+        "1 line": "A short **comment**.",
+        "1 KB": make_input(1024),
+        "1 MB": make_input(1024 * 1024),
+    }
+    for label, markdown in inputs.items():
+        number = 1 if len(markdown) > 100_000 else 500
+        timings = {
+            "fresh MarkdownIt": lambda: fresh_parser(markdown),
+            "markdown_to_blocks": lambda: markdown_to_blocks(markdown),
+            "MarkdownConverter": lambda: converter.convert(markdown),
+        }
+        results = {
+            name: min(timeit.repeat(fn, number=number, repeat=3)) / number
+            for name, fn in timings.items()
+        }
+        baseline = results["fresh MarkdownIt"]
+        for name, seconds in results.items():
+            print(
+                f"{label:7} {name:20} {seconds * 1e6:12.1f} us"
+                f"  ({baseline / seconds:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Throughput of ``render_pdfs`` for a nightly-export style batch.
+
+Compares a single reused ``PdfRenderer`` in this process with the process
+pool at several worker counts. Requires the ``pdf`` extra.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_pdf_batch.py [--documents N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from blocknote.converter import PDF_AVAILABLE
+from blocknote.schema import Block
+
+
+def make_document(index: int, paragraphs: int = 50):
+    """Build one document of ``paragraphs`` paragraphs."""
+    return [
+        Block(id=f"{index}-{i}", type="paragraph", content=f"Paragraph {i}")
+        for i in range(paragraphs)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=40)
+    args = parser.parse_args()
+
+    if not PDF_AVAILABLE:
+        raise SystemExit("WeasyPrint is not installed: pip install '.[pdf]'")
+
+    from blocknote.converter import PdfRenderer, render_pdfs
+
+    documents = [(f"doc-{i}", make_document(i)) for i in range(args.documents)]
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        renderer = PdfRenderer()
+        start = time.perf_counter()
+        for name, blocks in documents:
+            renderer.render(
+                blocks,
+                output_path=os.path.join(output_dir, f"{name}.pdf"),
+                return_bytes=False,
+            )
+        elapsed = time.perf_counter() - start
+        print(f"in-process      {args.documents / elapsed:8.2f} docs/s")
+
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            start = time.perf_counter()
+            results = list(render_pdfs(documents, output_dir, workers=workers))
+            elapsed = time.perf_counter() - start
+            failed = sum(not r.ok for r in results)
+            print(
+                f"workers={workers:<3}     {args.documents / elapsed:8.2f} docs/s"
+                f"  failed: {failed}"
+            )
+
+
+if __name__ == "__main__":
+    main()
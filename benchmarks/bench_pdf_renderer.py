@@ -0,0 +1,73 @@
+"""
+Per-call cost of ``blocks_to_pdf`` versus a reused ``PdfRenderer``.
+
+``blocks_to_pdf`` creates a font configuration and parses its stylesheets
+on every call; ``PdfRenderer`` does that once. Requires the ``pdf`` extra.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_pdf_renderer.py [--calls N]
+"""
+
+import argparse
+import time
+
+from blocknote.converter import PDF_AVAILABLE
+from blocknote.schema import Block, InlineContent
+
+CSS_STRING = "h1 { color: #1a5276; } p { text-align: justify; }"
+
+
+def make_blocks(paragraphs: int):
+    """Build a small document with a heading and styled paragraphs."""
+    blocks = [Block(id="h", type="heading", props={"level": 1}, content="Report")]
+    for i in range(paragraphs):
+        blocks.append(
+            Block(
+                id=str(i),
+                type="paragraph",
+                content=[
+                    InlineContent(type="text", text="Paragraph text "),
+                    InlineContent(
+                        type="text", text=str(i), styles={"bold": True}
+                    ),
+                ],
+            )
+        )
+    return blocks
+
+
+def per_call(fn, calls: int) -> float:
+    """Return the mean wall time of ``fn`` in milliseconds."""
+    fn()  # warm up imports and caches
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    if not PDF_AVAILABLE:
+        raise SystemExit("WeasyPrint is not installed: pip install '.[pdf]'")
+
+    from blocknote.converter import PdfRenderer, blocks_to_pdf
+
+    renderer = PdfRenderer(css_string=CSS_STRING)
+    for paragraphs in (1, 20, 200):
+        blocks = make_blocks(paragraphs)
+        function_ms = per_call(
+            lambda: blocks_to_pdf(blocks, css_string=CSS_STRING), args.calls
+        )
+        renderer_ms = per_call(lambda: renderer.render(blocks), args.calls)
+        print(
+            f"{paragraphs:4} paragraphs  blocks_to_pdf {function_ms:8.2f} ms"
+            f"  PdfRenderer.render {renderer_ms:8.2f} ms"
+            f"  ({function_ms / renderer_ms:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Rendering time of ``blocks_to_html`` with and without a ``RenderCache``.
+
+Each document is rendered cold (empty cache), warm (unchanged) and after
+editing one block, which is the autosave pattern the cache targets. Building
+a key costs about as much as the built-in renderers, which only format a
+few strings, so the second run registers a slower paragraph renderer
+standing in for syntax highlighting or math typesetting.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_render_cache.py [--blocks N]
+"""
+
+import argparse
+import re
+import time
+
+from blocknote.converter import (
+    RenderCache,
+    blocks_to_html,
+    register_html_renderer,
+)
+from blocknote.converter.blocknote_to_html import _render_paragraph_html
+from blocknote.schema import Block, InlineContent
+
+
+def build_document(count):
+    """Return ``count`` headings, styled paragraphs and lists."""
+    blocks = []
+    for i in range(count):
+        if i % 10 == 0:
+            blocks.append(
+                Block(
+                    id=f"h{i}",
+                    type="heading",
+                    props={"level": 2},
+                    content=[InlineContent(type="text", text=f"Section {i}")],
+                )
+            )
+        else:
+            blocks.append(
+                Block(
+                    id=f"p{i}",
+                    type="paragraph",
+                    content=[
+                        InlineContent(type="text", text="Some <text> & "),
+                        InlineContent(
+                            type="text",
+                            text=f"run {i}",
+                            styles={"bold": True, "textColor": "red"},
+                        ),
+                        InlineContent(type="text", text=" more text " * 5),
+                    ],
+                )
+            )
+    return blocks
+
+
+def highlighted_paragraph(block):
+    """Paragraph renderer that wraps every word in a span."""
+    html = _render_paragraph_html(block)
+    return re.sub(r"\b(\w+)\b", r'<span class="w">\1</span>', html)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(blocks, label):
+    cache = RenderCache(max_entries=2 * len(blocks))
+    uncached = timed(lambda: blocks_to_html(blocks))
+    cold = timed(lambda: blocks_to_html(blocks, cache=cache))
+    warm = timed(lambda: blocks_to_html(blocks, cache=cache))
+    blocks[len(blocks) // 2].content[0].text = "Edited <text> & "
+    edited = timed(lambda: blocks_to_html(blocks, cache=cache))
+
+    print(f"{len(blocks)} blocks, {label}")
+    print(f"  no cache      {uncached * 1e3:8.1f} ms")
+    print(f"  cold cache    {cold * 1e3:8.1f} ms")
+    print(f"  warm cache    {warm * 1e3:8.1f} ms")
+    print(f"  one edit      {edited * 1e3:8.1f} ms")
+    print(f"  {cache.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    run(build_document(args.blocks), "built-in renderers")
+    previous = register_html_renderer("paragraph", highlighted_paragraph)
+    try:
+        run(build_document(args.blocks), "highlighting paragraph renderer")
+    finally:
+        register_html_renderer("paragraph", previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Peak memory of ``html_to_blocks`` versus ``iter_html_blocks`` on a file.
+
+The HTML export is written to a temporary file first. The batch parser
+reads the whole file and returns every block; the incremental parser
+reads it in chunks and each block is dropped once it has been counted,
+as an importer storing blocks one by one would.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_streaming_html_import.py
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from blocknote.converter import html_to_blocks, iter_html_blocks
+
+
+def write_export(path: str, count: int) -> None:
+    """Write ``count`` styled paragraphs and list items to ``path``."""
+    with open(path, "w", encoding="utf-8") as fp:
+        for i in range(count):
+            fp.write(
+                f"<p>Paragraph <strong>{i}</strong> of an old CMS export</p>"
+                f"<ul><li>Item {i}</li></ul>\n"
+            )
+
+
+def measure(fn):
+    """Return (result, peak traced bytes, seconds) of ``fn()``."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def batch(path: str) -> int:
+    with open(path, encoding="utf-8") as fp:
+        return len(html_to_blocks(fp.read()))
+
+
+def incremental(path: str) -> int:
+    with open(path, encoding="utf-8") as fp:
+        return sum(1 for _ in iter_html_blocks(fp))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "export.html")
+        for count in (1_000, 10_000, 30_000):
+            write_export(path, count)
+            size = os.path.getsize(path) / 1e6
+            blocks, batch_peak, batch_s = measure(lambda: batch(path))
+            streamed, stream_peak, stream_s = measure(
+                lambda: incremental(path)
+            )
+            assert blocks == streamed
+            print(
+                f"{size:6.1f} MB, {blocks:>7} blocks  html_to_blocks"
+                f" {batch_peak / 1e6:8.2f} MB {batch_s:6.2f} s"
+                f"  iter_html_blocks {stream_peak / 1e6:8.2f} MB"
+                f" {stream_s:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Peak memory of ``blocks_to_markdown`` versus ``write_blocks_markdown``.
+
+Blocks are produced lazily so that only the renderer's own memory is
+measured. The batch renderer grows with the document; the streaming writer
+stays flat at roughly one chunk.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_streaming_markdown.py
+"""
+
+import io
+import time
+import tracemalloc
+
+from blocknote.converter import blocks_to_markdown, write_blocks_markdown
+from blocknote.schema import Block, InlineContent
+
+
+class NullSink(io.TextIOBase):
+    """Text sink that discards everything, like a network upload."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+def generate_blocks(count: int):
+    """Yield ``count`` styled paragraphs without keeping them."""
+    for i in range(count):
+        yield Block(
+            id=str(i),
+            type="paragraph",
+            content=[
+                InlineContent(type="text", text="Paragraph number "),
+                InlineContent(type="text", text=str(i), styles={"bold": True}),
+            ],
+        )
+
+
+def measure(fn):
+    """Return (peak traced bytes, seconds) of ``fn()``."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    for count in (1_000, 10_000, 100_000):
+        batch_peak, batch_s = measure(
+            lambda: blocks_to_markdown(list(generate_blocks(count)))
+        )
+        stream_peak, stream_s = measure(
+            lambda: write_blocks_markdown(generate_blocks(count), NullSink())
+        )
+        print(
+            f"{count:>7} blocks  blocks_to_markdown {batch_peak / 1e6:8.2f} MB"
+            f" {batch_s:6.2f} s  write_blocks_markdown"
+            f" {stream_peak / 1e6:8.2f} MB {stream_s:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
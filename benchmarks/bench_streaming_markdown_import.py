@@ -0,0 +1,75 @@
+"""
+Peak memory of ``markdown_to_blocks`` versus ``iter_markdown_blocks``.
+
+The Markdown archive is written to a temporary file first. The batch
+parser reads the whole file, tokenizes it at once and returns every
+block; the incremental parser parses it section by section and each
+block is dropped once it has been counted, as an importer storing
+blocks one by one would.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_streaming_markdown_import.py
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from blocknote.converter import iter_markdown_blocks, markdown_to_blocks
+
+
+def write_archive(path: str, count: int) -> None:
+    """Write ``count`` sections of headings, paragraphs, lists and code."""
+    with open(path, "w", encoding="utf-8") as fp:
+        for i in range(count):
+            fp.write(
+                f"## Entry {i}\n\n"
+                f"Imported *text* of entry **{i}** from the archive.\n\n"
+                "- first\n- second\n\n"
+                "```\nexample code\n```\n\n"
+            )
+
+
+def measure(fn):
+    """Return (result, peak traced bytes, seconds) of ``fn()``."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def batch(path: str) -> int:
+    with open(path, encoding="utf-8") as fp:
+        return len(markdown_to_blocks(fp.read()))
+
+
+def incremental(path: str) -> int:
+    with open(path, encoding="utf-8") as fp:
+        return sum(1 for _ in iter_markdown_blocks(fp))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "archive.md")
+        for count in (1_000, 10_000):
+            write_archive(path, count)
+            size = os.path.getsize(path) / 1e6
+            blocks, batch_peak, batch_s = measure(lambda: batch(path))
+            streamed, stream_peak, stream_s = measure(
+                lambda: incremental(path)
+            )
+            assert blocks == streamed
+            print(
+                f"{size:6.1f} MB, {blocks:>7} blocks  markdown_to_blocks"
+                f" {batch_peak / 1e6:8.2f} MB {batch_s:6.2f} s"
+                f"  iter_markdown_blocks {stream_peak / 1e6:8.2f} MB"
+                f" {stream_s:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
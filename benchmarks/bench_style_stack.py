@@ -0,0 +1,96 @@
+"""
+Parse time of deeply nested span soup with pre-merged style snapshots.
+
+Pasted Word and Google Docs HTML wraps text in many nested ``<span>``s,
+most of them without styles. The previous parser merged every open
+style dict on each text callback, O(depth) per run; the snapshot stack
+styles a run with its top entry. Both parse the same documents, and
+their blocks are checked to be equal.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_style_stack.py [--depths N ...]
+"""
+
+import argparse
+import time
+
+from blocknote.converter.block_ids import counter_ids
+from blocknote.converter.html_to_blocknote import BlockNoteHTMLParser
+from blocknote.schema import InlineContent
+
+SPANS = [
+    '<span style="color: #333333">',
+    "<span>",
+    '<span style="background-color: white">',
+    "<b>",
+    "<span>",
+    "<i>",
+]
+
+
+class LegacyParser(BlockNoteHTMLParser):
+    """The previous approach: raw styles per tag, merged on every run."""
+
+    def _push_styles(self, styles):
+        self.style_stack.append(styles)
+
+    def handle_data(self, data):
+        if self.current_block is not None and data:
+            combined_styles = {}
+            for style_dict in self.style_stack:
+                combined_styles.update(style_dict)
+            self.current_block["content"].append(
+                InlineContent(type="text", text=data, styles=combined_styles)
+            )
+
+
+def build_soup(depth, paragraphs=20):
+    """Paragraphs of ``depth`` nested tags with text at every level."""
+    opening, closing = [], []
+    for level in range(depth):
+        tag = SPANS[level % len(SPANS)]
+        opening.append(f"{tag}w{level} ")
+        closing.append(f"</{tag[1:].split()[0].rstrip('>')}>t ")
+    body = "".join(opening) + "".join(reversed(closing))
+    return f"<p>{body}</p>" * paragraphs
+
+
+def parse(parser_class, html):
+    parser = parser_class(counter_ids(), merge_runs=False)
+    parser.feed(html)
+    return parser.get_blocks()
+
+
+def timed(fn, repeat=5):
+    """Best of ``repeat`` runs of ``fn()``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[10, 100, 1_000]
+    )
+    args = parser.parse_args()
+
+    print("microseconds per run")
+    print(f"{'depth':>8}{'merged':>11}{'snapshot':>11}{'speedup':>9}")
+    for depth in args.depths:
+        html = build_soup(depth)
+        runs = sum(len(block.content) for block in parse(LegacyParser, html))
+        assert parse(LegacyParser, html) == parse(BlockNoteHTMLParser, html)
+        legacy = timed(lambda: parse(LegacyParser, html))
+        current = timed(lambda: parse(BlockNoteHTMLParser, html))
+        print(
+            f"{depth:>8}{legacy / runs * 1e6:>11.2f}"
+            f"{current / runs * 1e6:>11.2f}{legacy / current:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,115 @@
-from .blocknote_to_dict import blocks_to_dict
-from .blocknote_to_html import blocks_to_html
-from .blocknote_to_md import blocks_to_markdown
-from .dict_to_blocknote import dict_to_blocks
-from .html_to_blocknote import html_to_blocks
-from .md_to_blocknote import markdown_to_blocks
+from importlib import import_module
+from importlib.util import find_spec
+
+from .blocknote_to_dict import blocks_to_dict, blocks_to_json
+from .blocknote_to_html import (
+    blocks_to_html,
+    iter_blocks_html,
+    register_html_renderer,
+    write_blocks_html,
+)
+from .blocknote_to_md import (
+    blocks_to_markdown,
+    iter_blocks_markdown,
+    register_markdown_renderer,
+    write_blocks_markdown,
+)
+from .dict_to_blocknote import blocks_from_json, dict_to_blocks
+from .html_to_blocknote import html_to_blocks, iter_html_blocks
+from .inline_runs import RunStats, normalize_runs
+from .md_to_blocknote import (
+    MarkdownConverter,
+    iter_markdown_blocks,
+    markdown_to_blocks,
+)
 
 __all__ = [
     "dict_to_blocks",
+    "blocks_from_json",
     "markdown_to_blocks",
+    "iter_markdown_blocks",
+    "MarkdownConverter",
     "html_to_blocks",
+    "iter_html_blocks",
     "blocks_to_markdown",
+    "iter_blocks_markdown",
+    "write_blocks_markdown",
+    "register_markdown_renderer",
     "blocks_to_dict",
+    "blocks_to_json",
     "blocks_to_html",
+    "iter_blocks_html",
+    "write_blocks_html",
+    "register_html_renderer",
+    "IncrementalRenderer",
+    "IncrementalResult",
+    "FragmentPatch",
+    "uuid4_ids",
+    "uuid7_ids",
+    "counter_ids",
+    "content_hash_ids",
+    "Document",
+    "diff_blocks",
+    "apply_patch",
+    "Op",
+    "normalize_runs",
+    "RunStats",
+    "block_fingerprint",
+    "document_fingerprint",
+    "RenderCache",
+    "CacheBackend",
+    "CacheStats",
+    "SqliteCacheBackend",
 ]
 
-try:
-    from .blocknote_to_pdf import blocks_to_pdf, blocks_to_pdf_with_template
-except ImportError:
-    PDF_AVAILABLE = False
-else:
-    PDF_AVAILABLE = True
-    __all__ += ["blocks_to_pdf", "blocks_to_pdf_with_template"]
+# Features that most callers of the converters never use are imported on
+# first attribute access, so ``import blocknote.converter`` does not pay
+# for them (the render cache alone pulls in sqlite3). Maps each name to
+# its module.
+_LAZY_EXPORTS = {
+    "uuid4_ids": "block_ids",
+    "uuid7_ids": "block_ids",
+    "counter_ids": "block_ids",
+    "content_hash_ids": "block_ids",
+    "Document": "document",
+    "diff_blocks": "block_diff",
+    "apply_patch": "block_diff",
+    "Op": "block_diff",
+    "IncrementalRenderer": "incremental",
+    "IncrementalResult": "incremental",
+    "FragmentPatch": "incremental",
+    "block_fingerprint": "fingerprint",
+    "document_fingerprint": "fingerprint",
+    "RenderCache": "render_cache",
+    "CacheBackend": "render_cache",
+    "CacheStats": "render_cache",
+    "SqliteCacheBackend": "render_cache",
+}
+
+# WeasyPrint (and Pango through cffi) is slow to import and memory hungry,
+# so the PDF converters are lazy too.
+PDF_AVAILABLE = find_spec("weasyprint") is not None
+
+_LAZY_PDF_EXPORTS = (
+    "blocks_to_pdf",
+    "blocks_to_pdf_with_template",
+    "PdfRenderer",
+    "PdfResult",
+    "render_pdfs",
+)
+_LAZY_EXPORTS.update(dict.fromkeys(_LAZY_PDF_EXPORTS, "blocknote_to_pdf"))
+
+# As before the exports became lazy, ``import *`` only offers the PDF
+# converters when WeasyPrint is installed; doing so resolves them, and so
+# imports WeasyPrint, at that point.
+if PDF_AVAILABLE:
+    __all__ += _LAZY_PDF_EXPORTS
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
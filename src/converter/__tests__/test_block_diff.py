@@ -0,0 +1,211 @@
+import json
+import random
+
+import pytest
+from blocknote.converter.block_diff import Op, apply_patch, diff_blocks
+from blocknote.converter.blocknote_to_dict import blocks_to_dict, blocks_to_json
+from blocknote.converter.dict_to_blocknote import dict_to_blocks
+from blocknote.schema import Block, InlineContent
+
+
+def _paragraph(block_id, text, children=(), **styles):
+    return Block(
+        id=block_id,
+        type="paragraph",
+        content=[InlineContent(type="text", text=text, styles=styles)],
+        children=list(children),
+    )
+
+
+def _copy(blocks):
+    return dict_to_blocks(blocks_to_dict(blocks))
+
+
+def _roundtrip(old, new):
+    """Diff, encode to JSON, decode and apply to a copy of ``old``."""
+    ops = diff_blocks(old, new)
+    patched = apply_patch(_copy(old), json.loads(json.dumps(ops)))
+    assert blocks_to_dict(patched) == blocks_to_dict(new)
+    return ops
+
+
+def test_identical_documents_have_no_ops():
+    """Test that diffing a document with itself yields an empty patch."""
+    blocks = [_paragraph("a", "A", [_paragraph("b", "B")])]
+    assert diff_blocks(blocks, _copy(blocks)) == []
+
+
+def test_text_edit_is_a_splice():
+    """Test that an edit inside a run is encoded as a small splice."""
+    old = [_paragraph("p", "The quick brown fox")]
+    new = [_paragraph("p", "The quick red fox")]
+    ops = _roundtrip(old, new)
+    assert ops == [Op("text", "p", value=[0, 10, 5, "red"])]
+    assert json.dumps(ops) == '[["text", "p", null, null, [0, 10, 5, "red"]]]'
+
+
+def test_style_change_is_a_content_update():
+    """Test that changed styles replace the block's content."""
+    old = [_paragraph("p", "Text")]
+    new = [_paragraph("p", "Text", bold=True)]
+    ops = _roundtrip(old, new)
+    assert [op.op for op in ops] == ["update"]
+    assert ops[0].value["content"][0]["styles"] == {"bold": True}
+
+
+def test_type_and_props_update():
+    """Test that type and props changes are reported as updates."""
+    old = [Block(id="h", type="heading", props={"level": 1})]
+    new = [Block(id="h", type="quote", props={"level": 2})]
+    ops = _roundtrip(old, new)
+    assert ops == [
+        Op("update", "h", value={"type": "quote", "props": {"level": 2}})
+    ]
+
+
+def test_single_move_among_siblings():
+    """Test that moving one block reports one move, not a shift of all."""
+    old = [_paragraph(str(i), str(i)) for i in range(10)]
+    new = _copy(old)
+    new.insert(2, new.pop(8))
+    ops = _roundtrip(old, new)
+    assert ops == [Op("move", "8", None, "1")]
+
+
+def test_move_between_parents():
+    """Test that re-parenting keeps the block and its children."""
+    old = [
+        _paragraph("a", "A", [_paragraph("c", "C", [_paragraph("d", "D")])]),
+        _paragraph("b", "B"),
+    ]
+    new = [
+        _paragraph("a", "A"),
+        _paragraph("b", "B", [_paragraph("c", "C", [_paragraph("d", "D")])]),
+    ]
+    assert _roundtrip(old, new) == [Op("move", "c", "b", None)]
+
+
+def test_removed_parent_with_surviving_child():
+    """Test that a child is moved out before its parent is removed."""
+    old = [_paragraph("a", "A", [_paragraph("b", "B")])]
+    new = [_paragraph("b", "B")]
+    assert _roundtrip(old, new) == [
+        Op("move", "b", None, None),
+        Op("remove", "a"),
+    ]
+
+
+def test_new_parent_adopts_existing_block():
+    """Test inserting a parent around an existing block."""
+    old = [_paragraph("b", "B")]
+    new = [_paragraph("a", "A", [_paragraph("b", "B"), _paragraph("c", "C")])]
+    ops = _roundtrip(old, new)
+    assert [op.op for op in ops] == ["insert", "move", "insert"]
+    assert "children" not in ops[0].value
+
+
+def test_swap_nesting():
+    """Test turning a parent into the child of its own child."""
+    old = [_paragraph("a", "A", [_paragraph("b", "B")])]
+    new = [_paragraph("b", "B", [_paragraph("a", "A")])]
+    _roundtrip(old, new)
+
+
+def _random_tree(rng, ids, depth=0):
+    blocks = []
+    for _ in range(rng.randint(0, 4 if depth < 3 else 0)):
+        block_id = str(next(ids))
+        blocks.append(
+            _paragraph(
+                block_id,
+                rng.choice(["alpha", "beta", "gamma delta"]),
+                _random_tree(rng, ids, depth + 1),
+            )
+        )
+    return blocks
+
+
+def _all_blocks(blocks):
+    for block in blocks:
+        yield block
+        yield from _all_blocks(block.children)
+
+
+def _mutate(rng, blocks, ids):
+    for _ in range(rng.randint(1, 8)):
+        everything = list(_all_blocks(blocks))
+        lists = [blocks] + [block.children for block in everything]
+        action = rng.choice(["insert", "remove", "move", "text", "style"])
+        if action == "insert" or not everything:
+            target = rng.choice(lists)
+            target.insert(
+                rng.randint(0, len(target)),
+                _paragraph(str(next(ids)), "new", _random_tree(rng, ids, 2)),
+            )
+        elif action == "remove":
+            target = rng.choice([lst for lst in lists if lst])
+            target.pop(rng.randrange(len(target)))
+        elif action == "move":
+            source = rng.choice([lst for lst in lists if lst])
+            block = source.pop(rng.randrange(len(source)))
+            inside = {id(b.children) for b in _all_blocks([block])}
+            targets = [lst for lst in lists if id(lst) not in inside]
+            target = rng.choice(targets)
+            target.insert(rng.randint(0, len(target)), block)
+        elif action == "text":
+            block = rng.choice(everything)
+            block.content[0].text += rng.choice([" more", "!", ""])
+        else:
+            block = rng.choice(everything)
+            block.content[0].styles["bold"] = rng.random() < 0.5
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_roundtrip(seed):
+    """Test random tree edits: applying the JSON patch reproduces new."""
+    rng = random.Random(seed)
+    ids = iter(range(10**6))
+    old = _random_tree(rng, ids)
+    new = _copy(old)
+    _mutate(rng, new, ids)
+    _roundtrip(old, new)
+
+
+def test_apply_patch_errors():
+    """Test that malformed ops and unknown IDs raise ValueError."""
+    blocks = [_paragraph("a", "A")]
+    with pytest.raises(ValueError, match="op at index 0"):
+        apply_patch(blocks, [Op("remove", "missing")])
+    with pytest.raises(ValueError, match="unknown op"):
+        apply_patch(blocks, [["rename", "a"]])
+    with pytest.raises(ValueError, match="Duplicate block id"):
+        apply_patch(
+            blocks, [Op("insert", "a", value={"id": "a", "type": "paragraph"})]
+        )
+    table = [Block(id="t", type="table", content="raw")]
+    with pytest.raises(ValueError, match="has no content runs"):
+        apply_patch(table, [Op("text", "t", value=[0, 0, 0, "x"])])
+
+
+def test_diff_input_validation():
+    """Test that invalid revisions are rejected."""
+    with pytest.raises(TypeError, match="old blocks must be a list"):
+        diff_blocks("old", [])
+    with pytest.raises(TypeError, match="new blocks must be a Block"):
+        diff_blocks([], [{"id": "a"}])
+    with pytest.raises(ValueError, match="Duplicate block id 'a'"):
+        diff_blocks([], [_paragraph("a", "A", [_paragraph("a", "A")])])
+
+
+def test_insert_deeply_nested_subtree():
+    """Test that inserting a subtree deeper than the recursion limit works."""
+    root = block = _paragraph("d0", "0")
+    for level in range(1, 5_000):
+        child = _paragraph(f"d{level}", str(level))
+        block.children.append(child)
+        block = child
+    old = [_paragraph("a", "A")]
+    ops = diff_blocks(old, old + [root])
+    assert [op.op for op in ops] == ["insert"]
+    patched = apply_patch(_copy(old), ops)
+    assert blocks_to_json(patched) == blocks_to_json(old + [root])
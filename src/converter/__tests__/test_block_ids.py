@@ -0,0 +1,109 @@
+import re
+import sys
+import threading
+import uuid
+
+import pytest
+from blocknote.converter.block_ids import (
+    content_hash_ids,
+    counter_ids,
+    uuid4_ids,
+    uuid7_ids,
+)
+from blocknote.schema import InlineContent
+
+
+def _generate(factory, count):
+    """Generate ``count`` IDs for identical paragraphs from one document."""
+    next_id = factory()
+    content = [InlineContent(type="text", text="Same")]
+    return [next_id("paragraph", {}, content) for _ in range(count)]
+
+
+def test_uuid4_ids():
+    """Test that the default generator returns unique UUID4 strings."""
+    ids = _generate(uuid4_ids(), 50)
+    assert len(set(ids)) == 50
+    assert all(uuid.UUID(value).version == 4 for value in ids)
+
+
+@pytest.mark.parametrize(
+    "factory,expected",
+    [
+        (counter_ids(), ["1", "2", "3"]),
+        (counter_ids(prefix="doc-"), ["doc-1", "doc-2", "doc-3"]),
+        (counter_ids(prefix="b", start=0), ["b0", "b1", "b2"]),
+    ],
+)
+def test_counter_ids(factory, expected):
+    """Test that counters are sequential and restart per document."""
+    assert _generate(factory, 3) == expected
+    assert _generate(factory, 3) == expected
+
+
+def test_uuid7_ids_are_valid_and_ordered():
+    """Test that UUID7 IDs are unique, versioned and time ordered."""
+    ids = _generate(uuid7_ids(batch_size=4), 5000)
+    parsed = [uuid.UUID(value) for value in ids]
+
+    assert len(set(ids)) == len(ids)
+    assert all(value.version == 7 for value in parsed)
+    assert all(value.variant == uuid.RFC_4122 for value in parsed)
+    assert ids == sorted(ids)
+
+
+def test_uuid7_ids_unique_across_threads():
+    """Test that threads sharing a factory never produce the same ID."""
+    factory = uuid7_ids(batch_size=2)
+    results = []
+
+    def work():
+        results.append(_generate(factory, 5000))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    ids = [value for chunk in results for value in chunk]
+    assert len(ids) == 40_000
+    assert len(set(ids)) == len(ids)
+
+
+def test_uuid7_ids_invalid_batch_size():
+    """Test that an empty batch is rejected."""
+    with pytest.raises(ValueError, match="batch_size"):
+        uuid7_ids(batch_size=0)
+
+
+def test_content_hash_ids_are_deterministic():
+    """Test that content hashes repeat across documents but not within."""
+    factory = content_hash_ids()
+    first = _generate(factory, 3)
+
+    assert first == _generate(factory, 3)
+    assert re.fullmatch(r"[0-9a-f]{16}", first[0])
+    assert first[1:] == [f"{first[0]}-2", f"{first[0]}-3"]
+
+
+def test_content_hash_ids_depend_on_block():
+    """Test that type, props and styles all change the digest."""
+    next_id = content_hash_ids(length=32)()
+    text = [InlineContent(type="text", text="Text")]
+    bold = [InlineContent(type="text", text="Text", styles={"bold": True})]
+
+    ids = {
+        next_id("paragraph", {}, text),
+        next_id("quote", {}, text),
+        next_id("heading", {"level": 1}, text),
+        next_id("heading", {"level": 2}, text),
+        next_id("paragraph", {}, bold),
+    }
+    assert len(ids) == 5
+    assert all(len(value) == 32 for value in ids)
@@ -1,5 +1,5 @@
 import pytest
-from blocknote.converter.blocknote_to_dict import blocks_to_dict
+from blocknote.converter.blocknote_to_dict import blocks_to_dict, blocks_to_json
 from blocknote.schema import Block, InlineContent
 
 
@@ -182,3 +182,93 @@ def test_blocks_to_dict_roundtrip():
         result_dict[0]["content"][1]["styles"]
         == original_dict[0]["content"][1]["styles"]
     )
+
+
+def test_blocks_to_json_matches_blocks_to_dict(nested_blocks, sample_blocks):
+    """Test that JSON output matches the dict representation."""
+    import json
+
+    blocks = sample_blocks + nested_blocks
+    result = blocks_to_json(blocks)
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == blocks_to_dict(blocks)
+
+
+def test_blocks_to_json_roundtrip(nested_blocks):
+    """Test that blocks -> JSON -> blocks preserves the tree."""
+    from blocknote.converter.dict_to_blocknote import blocks_from_json
+
+    assert blocks_from_json(blocks_to_json(nested_blocks)) == nested_blocks
+
+
+@pytest.mark.parametrize(
+    "invalid_input,expected_error",
+    [
+        ("not a list", "Input must be a list of Block objects"),
+        ([{"id": "1"}], "Item at index 0 must be a Block object"),
+    ],
+)
+def test_blocks_to_json_validation_errors(invalid_input, expected_error):
+    """Test that invalid input raises TypeError."""
+    with pytest.raises(TypeError, match=expected_error):
+        blocks_to_json(invalid_input)
+
+
+def _nested_blocks(depth):
+    """A chain of paragraphs, each the only child of the previous one."""
+    root = block = Block(id="0", type="paragraph", content="level 0")
+    for level in range(1, depth):
+        child = Block(id=str(level), type="paragraph", content=f"level {level}")
+        block.children.append(child)
+        block = child
+    return [root]
+
+
+@pytest.mark.parametrize("depth", [1_000, 10_000, 100_000])
+def test_blocks_to_dict_deep_nesting(depth):
+    """Test that nesting depth is not limited by the recursion limit."""
+    result = blocks_to_dict(_nested_blocks(depth))
+    levels = 0
+    node = result[0]
+    while node["children"]:
+        node = node["children"][0]
+        levels += 1
+    assert levels == depth - 1
+    assert node["id"] == str(depth - 1)
+    assert node["content"][0]["text"] == f"level {depth - 1}"
+
+
+@pytest.mark.parametrize("depth", [1_000, 10_000, 100_000])
+def test_blocks_to_json_deep_nesting(depth):
+    """Test that deep trees serialize to the same JSON as shallow ones."""
+    data = blocks_to_json(_nested_blocks(depth))
+    assert data.startswith(b'[{"id":"0","type":"paragraph"')
+    assert data.endswith(b'"children":[]}' + b"]}" * (depth - 1) + b"]")
+    assert data.count(b'"children":[') == depth
+
+
+def test_blocks_to_json_deep_matches_adapter_output(nested_blocks):
+    """Test that the deep path serializes each block like the adapter."""
+    shallow = blocks_to_json(nested_blocks)
+    data = blocks_to_json(nested_blocks + _nested_blocks(2_000))
+    assert data.startswith(shallow[:-1] + b",")
+
+
+@pytest.mark.parametrize("convert", [blocks_to_dict, blocks_to_json])
+def test_max_depth(convert):
+    """Test that max_depth rejects deeper trees and accepts the limit."""
+    blocks = _nested_blocks(5)
+    convert(blocks, max_depth=5)
+    with pytest.raises(ValueError, match="nested deeper than max_depth=4"):
+        convert(blocks, max_depth=4)
+    with pytest.raises(ValueError, match="max_depth must be at least 1"):
+        convert(blocks, max_depth=0)
+
+
+@pytest.mark.parametrize("convert", [blocks_to_dict, blocks_to_json])
+def test_max_depth_one(convert, sample_blocks):
+    """Test that max_depth=1 accepts flat documents."""
+    convert(sample_blocks, max_depth=1)
+    with pytest.raises(ValueError, match="nested deeper than max_depth=1"):
+        convert(_nested_blocks(2), max_depth=1)
@@ -1,5 +1,10 @@
 import pytest
-from blocknote.converter.blocknote_to_html import blocks_to_html
+from blocknote.converter.blocknote_to_html import (
+    blocks_to_html,
+    iter_blocks_html,
+    register_html_renderer,
+    write_blocks_html,
+)
 from blocknote.schema import Block, InlineContent
 
 
@@ -290,3 +295,187 @@ def test_blocks_to_html_validation_errors(invalid_input, expected_error):
     """Test that invalid inputs raise appropriate errors."""
     with pytest.raises((TypeError, ValueError), match=expected_error):
         blocks_to_html(invalid_input)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 64 * 1024])
+def test_iter_blocks_html_matches_blocks_to_html(
+    sample_blocks, list_blocks, styled_blocks, chunk_size
+):
+    """Test that streamed chunks join to the batch output."""
+    blocks = sample_blocks + list_blocks + styled_blocks
+    chunks = list(iter_blocks_html(blocks, chunk_size=chunk_size))
+
+    assert "".join(chunks) == blocks_to_html(blocks)
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+
+
+def test_iter_blocks_html_is_lazy(sample_blocks):
+    """Test that blocks are pulled from the input only as needed."""
+    pulled = []
+
+    def generate():
+        for block in sample_blocks * 100:
+            pulled.append(block)
+            yield block
+
+    chunks = iter_blocks_html(generate(), chunk_size=1)
+    assert pulled == []
+    next(chunks)
+    assert len(pulled) == 1
+
+
+def test_write_blocks_html(sample_blocks):
+    """Test writing HTML to a text file object."""
+    import io
+
+    buffer = io.StringIO()
+    write_blocks_html(sample_blocks, buffer, chunk_size=8)
+    assert buffer.getvalue() == blocks_to_html(sample_blocks)
+
+
+@pytest.mark.parametrize(
+    "invalid_input,chunk_size,expected_error",
+    [
+        ("not blocks", 10, "Input must be an iterable"),
+        (123, 10, "Input must be an iterable"),
+        ([], 0, "chunk_size must be at least 1"),
+    ],
+)
+def test_iter_blocks_html_validation_errors(
+    invalid_input, chunk_size, expected_error
+):
+    """Test that invalid arguments are rejected before streaming."""
+    with pytest.raises((TypeError, ValueError), match=expected_error):
+        iter_blocks_html(invalid_input, chunk_size=chunk_size)
+
+
+def test_iter_blocks_html_invalid_block():
+    """Test that invalid blocks raise while streaming."""
+    with pytest.raises(ValueError, match="index 0"):
+        list(iter_blocks_html([{"not": "a block"}]))
+
+
+def test_register_html_renderer_custom_type():
+    """Test rendering a custom block type through the registry."""
+    from blocknote.converter.dict_to_blocknote import dict_to_blocks
+
+    blocks = dict_to_blocks(
+        [{"id": "1", "type": "callout", "content": "Heads up"}], trusted=True
+    )
+    assert blocks_to_html(blocks) == (
+        '<div class="blocknote-callout">Heads up</div>'
+    )
+
+    previous = register_html_renderer(
+        "callout",
+        lambda block: f"<aside>{block.content[0].text}</aside>",
+    )
+    try:
+        assert previous is None
+        assert blocks_to_html(blocks) == "<aside>Heads up</aside>"
+    finally:
+        assert register_html_renderer("callout", previous) is not None
+
+    assert blocks_to_html(blocks) == (
+        '<div class="blocknote-callout">Heads up</div>'
+    )
+    assert register_html_renderer("callout", None) is None
+
+
+def test_register_html_renderer_override_builtin(sample_blocks):
+    """Test overriding and restoring a built-in renderer."""
+    from blocknote.schema import BlockType
+
+    previous = register_html_renderer(
+        BlockType.PARAGRAPH, lambda block: "<p>replaced</p>"
+    )
+    try:
+        assert blocks_to_html(sample_blocks).endswith("<p>replaced</p>")
+    finally:
+        register_html_renderer("paragraph", previous)
+
+    assert blocks_to_html(sample_blocks).endswith(
+        "<p>This is a paragraph.</p>"
+    )
+
+
+def _legacy_styled_html(text, styles):
+    """Reference implementation: wrap the run one style at a time."""
+    if styles.get("bold"):
+        text = f"<strong>{text}</strong>"
+    if styles.get("italic"):
+        text = f"<em>{text}</em>"
+    if styles.get("underline"):
+        text = f"<u>{text}</u>"
+    if styles.get("strike"):
+        text = f"<s>{text}</s>"
+    if styles.get("code"):
+        text = f"<code>{text}</code>"
+    if "backgroundColor" in styles:
+        bg = styles["backgroundColor"]
+        text = f'<span style="background-color: {bg}">{text}</span>'
+    if "textColor" in styles:
+        text = f'<span style="color: {styles["textColor"]}">{text}</span>'
+    return text
+
+
+def test_blocks_to_html_style_plans_match_nested_wrapping():
+    """Test every style combination against one-at-a-time wrapping."""
+    from itertools import product
+
+    flags = ["bold", "italic", "underline", "strike", "code"]
+    for enabled in product([False, True], repeat=len(flags)):
+        for colors in [{}, {"textColor": "red"}, {"backgroundColor": "blue"}]:
+            styles = {f: True for f, on in zip(flags, enabled) if on}
+            styles.update(colors)
+            block = Block(
+                id="1",
+                type="paragraph",
+                content=[InlineContent(type="text", text="x", styles=styles)],
+            )
+            expected = f"<p>{_legacy_styled_html('x', styles)}</p>"
+            assert blocks_to_html([block]) == expected
+
+
+def test_blocks_to_html_unhashable_style_value():
+    """Test that unhashable style values bypass the plan cache."""
+    block = Block(
+        id="1",
+        type="paragraph",
+        content=[
+            InlineContent(
+                type="text", text="x", styles={"bold": True, "meta": [1]}
+            )
+        ],
+    )
+    assert blocks_to_html([block]) == "<p><strong>x</strong></p>"
+
+
+@pytest.mark.parametrize("depth", [1_000, 10_000, 100_000])
+def test_blocks_to_html_deep_nesting(depth):
+    """Test that deeply nested blocks render without recursion errors."""
+    root = block = Block(id="0", type="paragraph", content="level 0")
+    for level in range(1, depth):
+        child = Block(id=str(level), type="paragraph", content="x")
+        block.children.append(child)
+        block = child
+    assert blocks_to_html([root]) == "<p>level 0</p>"
+
+
+def test_blocks_to_html_equal_style_values_of_other_classes():
+    """Test that 1, 1.0 and True do not share a cached style plan."""
+    for style, css in (("textColor", "color"), ("backgroundColor", "background-color")):
+        rendered = []
+        for value in (True, 1, 1.0):
+            block = Block(
+                id="1",
+                type="paragraph",
+                content=[
+                    InlineContent(type="text", text="x", styles={style: value})
+                ],
+            )
+            rendered.append(blocks_to_html([block]))
+        assert rendered == [
+            f'<p><span style="{css}: {value}">x</span></p>'
+            for value in ("True", "1", "1.0")
+        ]
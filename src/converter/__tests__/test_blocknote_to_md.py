@@ -1,5 +1,10 @@
 import pytest
-from blocknote.converter.blocknote_to_md import blocks_to_markdown
+from blocknote.converter.blocknote_to_md import (
+    blocks_to_markdown,
+    iter_blocks_markdown,
+    register_markdown_renderer,
+    write_blocks_markdown,
+)
 from blocknote.schema import Block, InlineContent
 
 
@@ -170,3 +175,97 @@ def test_blocks_to_markdown_validation_errors(invalid_input, expected_error):
     """Test that invalid inputs raise appropriate errors."""
     with pytest.raises((TypeError, ValueError), match=expected_error):
         blocks_to_markdown(invalid_input)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_blocks_markdown_matches_blocks_to_markdown(
+    sample_blocks, list_blocks, chunk_size
+):
+    """Test that streamed chunks join to the batch output."""
+    blocks = sample_blocks + list_blocks
+    chunks = list(iter_blocks_markdown(blocks, chunk_size=chunk_size))
+
+    assert "".join(chunks) == blocks_to_markdown(blocks)
+    assert all(len(chunk) >= chunk_size for chunk in chunks[:-1])
+
+
+def test_iter_blocks_markdown_skips_empty_blocks(sample_blocks):
+    """Test that unsupported blocks add no separators, as in batch mode."""
+    blocks = [Block(id="t", type="table", content=[])] + sample_blocks
+    assert "".join(iter_blocks_markdown(blocks)) == blocks_to_markdown(blocks)
+
+
+def test_write_blocks_markdown(sample_blocks, list_blocks):
+    """Test writing Markdown to a text file object."""
+    import io
+
+    buffer = io.StringIO()
+    write_blocks_markdown(iter(sample_blocks + list_blocks), buffer)
+    assert buffer.getvalue() == blocks_to_markdown(sample_blocks + list_blocks)
+
+
+@pytest.mark.parametrize(
+    "invalid_input,expected_error",
+    [
+        ("not blocks", "Input must be an iterable"),
+        ([{"not": "a block"}], "must be a Block object"),
+    ],
+)
+def test_iter_blocks_markdown_validation_errors(invalid_input, expected_error):
+    """Test that invalid inputs raise appropriate errors."""
+    with pytest.raises((TypeError, ValueError), match=expected_error):
+        list(iter_blocks_markdown(invalid_input))
+
+
+def test_register_markdown_renderer(sample_blocks):
+    """Test adding and overriding Markdown renderers."""
+    quote = Block(id="q", type="quote", content="Quoted")
+    assert blocks_to_markdown([quote]) == ""
+
+    previous_quote = register_markdown_renderer(
+        "quote", lambda block: f"> {block.content[0].text}"
+    )
+    previous_paragraph = register_markdown_renderer(
+        "paragraph", lambda block: "replaced"
+    )
+    try:
+        assert previous_quote is None
+        assert blocks_to_markdown([quote] + sample_blocks) == (
+            "> Quoted\n\n# Main Title\n\nreplaced"
+        )
+    finally:
+        register_markdown_renderer("quote", previous_quote)
+        register_markdown_renderer("paragraph", previous_paragraph)
+
+    assert blocks_to_markdown([quote]) == ""
+
+
+@pytest.mark.parametrize(
+    "styles,expected",
+    [
+        ({}, "text"),
+        ({"bold": True}, "**text**"),
+        ({"italic": True}, "*text*"),
+        ({"bold": True, "italic": True}, "***text***"),
+        ({"bold": False, "underline": True}, "text"),
+    ],
+)
+def test_blocks_to_markdown_inline_styles(styles, expected):
+    """Test emphasis markers for each bold/italic combination."""
+    block = Block(
+        id="1",
+        type="paragraph",
+        content=[InlineContent(type="text", text="text", styles=styles)],
+    )
+    assert blocks_to_markdown([block]) == expected
+
+
+@pytest.mark.parametrize("depth", [1_000, 10_000, 100_000])
+def test_blocks_to_markdown_deep_nesting(depth):
+    """Test that deeply nested blocks render without recursion errors."""
+    root = block = Block(id="0", type="paragraph", content="level 0")
+    for level in range(1, depth):
+        child = Block(id=str(level), type="paragraph", content="x")
+        block.children.append(child)
+        block = child
+    assert blocks_to_markdown([root]) == "level 0"
@@ -1,4 +1,7 @@
+import io
 import os
+import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -7,9 +10,11 @@ from blocknote.schema import Block, BlockType, InlineContent, InlineContentType
 try:
     from converter.blocknote_to_pdf import (
         WEASYPRINT_AVAILABLE,
+        PdfRenderer,
         _create_html_document,
         blocks_to_pdf,
         blocks_to_pdf_with_template,
+        render_pdfs,
     )
 except ImportError:
     WEASYPRINT_AVAILABLE = False
@@ -246,6 +251,48 @@ class TestBlocknoteToPdf:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_save_pdf_without_returning_bytes(self):
+        """Test streaming the PDF to a file without returning bytes."""
+        blocks = [
+            Block(
+                id="1",
+                type=BlockType.PARAGRAPH,
+                content=[
+                    InlineContent(type=InlineContentType.TEXT, text="Stream")
+                ],
+            )
+        ]
+
+        with tempfile.NamedTemporaryFile(
+            suffix=".pdf", delete=False
+        ) as tmp_file:
+            tmp_path = tmp_file.name
+
+        try:
+            result = blocks_to_pdf(
+                blocks, output_path=tmp_path, return_bytes=False
+            )
+
+            assert result is None
+            with open(tmp_path, "rb") as f:
+                assert f.read().startswith(b"%PDF-")
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def test_save_pdf_to_file_object(self):
+        """Test writing the PDF to a binary file object."""
+        buffer = io.BytesIO()
+        pdf_bytes = blocks_to_pdf([], output_path=buffer)
+
+        assert buffer.getvalue() == pdf_bytes
+        assert pdf_bytes.startswith(b"%PDF-")
+
+    def test_return_bytes_false_requires_output_path(self):
+        """Test that discarding the PDF without a target is rejected."""
+        with pytest.raises(ValueError, match="requires an output_path"):
+            blocks_to_pdf([], return_bytes=False)
+
     def test_custom_css_styling(self):
         """Test PDF generation with custom CSS."""
         blocks = [
@@ -427,6 +474,147 @@ class TestBlocknoteToPdf:
         with pytest.raises(FileNotFoundError, match="Template file not found"):
             blocks_to_pdf_with_template(blocks, "/nonexistent/template.html")
 
+    def test_pdf_renderer_reuse(self):
+        """Test that one renderer can render several documents."""
+        renderer = PdfRenderer(
+            css_string="p { color: red; }", page_size="letter", margin="1in"
+        )
+        blocks = [
+            Block(
+                id="1",
+                type=BlockType.PARAGRAPH,
+                content=[
+                    InlineContent(type=InlineContentType.TEXT, text="Reuse")
+                ],
+            )
+        ]
+
+        for _ in range(3):
+            pdf_bytes = renderer.render(blocks)
+            assert pdf_bytes.startswith(b"%PDF-")
+        assert renderer.render([]).startswith(b"%PDF-")
+
+    def test_pdf_renderer_with_template(self):
+        """Test that a renderer keeps its parsed template."""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".html", delete=False
+        ) as tmp_template:
+            tmp_template.write(
+                "<html><body><h1>{{title}}</h1>{{content}}</body></html>"
+            )
+            template_path = tmp_template.name
+
+        try:
+            renderer = PdfRenderer(
+                template_path=template_path,
+                template_variables={"title": "Report"},
+            )
+            os.unlink(template_path)
+
+            pdf_bytes = renderer.render(
+                [Block(id="1", type=BlockType.PARAGRAPH, content="Body")]
+            )
+            assert pdf_bytes.startswith(b"%PDF-")
+        finally:
+            if os.path.exists(template_path):
+                os.unlink(template_path)
+
+    def test_pdf_renderer_invalid_input(self):
+        """Test renderer error handling."""
+        with pytest.raises(FileNotFoundError, match="Template file not found"):
+            PdfRenderer(template_path="/nonexistent/template.html")
+
+        with pytest.raises(
+            TypeError, match="Input must be a list of Block objects"
+        ):
+            PdfRenderer().render("not a list")
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_render_pdfs_batch(self, ordered):
+        """Test rendering a batch of documents in worker processes."""
+        documents = [
+            (
+                f"doc-{i}",
+                [Block(id=str(i), type=BlockType.PARAGRAPH, content=f"#{i}")],
+            )
+            for i in range(4)
+        ]
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            results = list(
+                render_pdfs(
+                    documents, output_dir, workers=2, ordered=ordered
+                )
+            )
+
+            assert sorted(r.position for r in results) == [0, 1, 2, 3]
+            if ordered:
+                assert [r.name for r in results] == [
+                    name for name, _ in documents
+                ]
+            for result in results:
+                assert result.ok, result.error
+                assert result.seconds >= 0
+                with open(result.output_path, "rb") as f:
+                    assert f.read().startswith(b"%PDF-")
+
+    def test_render_pdfs_deep_document(self, tmp_path):
+        """Test that workers load documents nested past pydantic's limit."""
+        root = block = Block(id="0", type=BlockType.PARAGRAPH, content="0")
+        for level in range(1, 200):
+            child = Block(id=str(level), type=BlockType.PARAGRAPH, content="x")
+            block.children = [child]
+            block = child
+
+        (result,) = render_pdfs({"deep": [root]}, str(tmp_path), workers=1)
+
+        assert result.ok, result.error
+        with open(result.output_path, "rb") as f:
+            assert f.read().startswith(b"%PDF-")
+
+    def test_render_pdfs_rejects_documents_individually(self, tmp_path):
+        """Test that bad names and blocks fail without stopping the batch."""
+        blocks = [Block(id="1", type=BlockType.PARAGRAPH, content="x")]
+        outside = tmp_path / "outside"
+        output_dir = tmp_path / "out"
+        documents = [
+            ("../outside", blocks),
+            (str(tmp_path / "absolute"), blocks),
+            ("ok", blocks),
+            ("ok", blocks),
+            ("not-a-list", "blocks"),
+        ]
+
+        results = list(render_pdfs(documents, str(output_dir), workers=1))
+
+        assert [r.ok for r in results] == [False, False, True, False, False]
+        assert "Invalid document name" in results[0].error
+        assert "Invalid document name" in results[1].error
+        assert "Duplicate document name" in results[3].error
+        assert "list of Block objects" in results[4].error
+        assert not outside.with_suffix(".pdf").exists()
+        assert not (tmp_path / "absolute.pdf").exists()
+        assert os.listdir(output_dir) == ["ok.pdf"]
+
+    def test_render_pdfs_checks_renderer_options(self, tmp_path):
+        """Test that bad renderer options fail before the pool starts."""
+        documents = {"a": [Block(id="1", type=BlockType.PARAGRAPH)]}
+        output_dir = str(tmp_path / "out")
+
+        with pytest.raises(ValueError, match="does not accept font_config"):
+            render_pdfs(documents, output_dir, font_config=object())
+        with pytest.raises(FileNotFoundError):
+            render_pdfs(
+                documents, output_dir, template_path=str(tmp_path / "no.html")
+            )
+        with pytest.raises(ValueError, match="must be picklable"):
+            render_pdfs(
+                documents, output_dir, template_variables={"x": lambda: 1}
+            )
+        with pytest.raises(TypeError):
+            render_pdfs(documents, output_dir, page_sise="A5")
+        assert not os.path.exists(output_dir)
+
     def test_complex_document_structure(self):
         """Test PDF generation with a complex document structure."""
         blocks = [
@@ -536,4 +724,115 @@ class TestBlocknoteToPdfWithoutWeasyPrint:
 
     def test_import_error_without_weasyprint(self):
         """Test that an error is raised when WeasyPrint is unavailable."""
-        pass
+        from blocknote.converter import blocks_to_pdf
+
+        with pytest.raises(ImportError, match="WeasyPrint is required"):
+            blocks_to_pdf([])
+
+    def test_pdf_renderer_without_weasyprint(self):
+        """Test that the renderer cannot be built without WeasyPrint."""
+        from blocknote.converter import PdfRenderer
+
+        with pytest.raises(ImportError, match="WeasyPrint is required"):
+            PdfRenderer()
+
+    def test_render_pdfs_without_weasyprint(self, tmp_path):
+        """Test that batch rendering fails before starting any workers."""
+        from blocknote.converter import render_pdfs
+
+        with pytest.raises(ImportError, match="WeasyPrint is required"):
+            render_pdfs({}, str(tmp_path))
+
+
+def test_converter_import_does_not_load_weasyprint():
+    """Test that importing the converters defers PDF and optional modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import blocknote.converter"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+    }
+
+    assert "blocknote.converter" in imported
+    assert "blocknote.converter.blocknote_to_pdf" not in imported
+    assert "weasyprint" not in imported
+    for module in [
+        "block_diff",
+        "document",
+        "incremental",
+        "fingerprint",
+        "render_cache",
+    ]:
+        assert f"blocknote.converter.{module}" not in imported
+    assert "sqlite3" not in imported
+
+
+def test_lazy_exports_resolve():
+    """Test that every lazily exported name resolves from its module."""
+    import importlib
+
+    import blocknote.converter as converter
+
+    for name, module_name in converter._LAZY_EXPORTS.items():
+        if module_name == "blocknote_to_pdf":
+            continue
+        module = importlib.import_module(f"blocknote.converter.{module_name}")
+        assert getattr(converter, name) is getattr(module, name)
+        assert name in converter.__all__
+
+
+def test_pdf_converters_resolve_lazily():
+    """Test that the PDF converters are importable from the package."""
+    import blocknote.converter as converter
+
+    assert ("blocks_to_pdf" in converter.__all__) == converter.PDF_AVAILABLE
+    assert callable(converter.blocks_to_pdf)
+    assert callable(converter.blocks_to_pdf_with_template)
+    with pytest.raises(AttributeError):
+        converter.blocks_to_docx
+
+
+def test_pdf_converters_star_import():
+    """Test that ``import *`` skips the PDF converters without WeasyPrint."""
+    code = (
+        "import sys\n"
+        "from blocknote.converter import *\n"
+        "from blocknote.converter import PDF_AVAILABLE\n"
+        "assert ('blocks_to_pdf' in globals()) == PDF_AVAILABLE\n"
+        "assert PDF_AVAILABLE or 'weasyprint' not in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        check=True,
+    )
+
+
+def test_pdf_job_validates_names_and_blocks():
+    """Test that batch jobs fail on unsafe names, duplicates and bad blocks."""
+    from blocknote.converter.blocknote_to_pdf import PdfResult, _pdf_job
+
+    blocks = [Block(id="1", type=BlockType.PARAGRAPH, content="x")]
+    seen = set()
+    job = _pdf_job(0, "report", blocks, "out", seen)
+    assert job[:2] == (0, "report")
+    assert job[3] == os.path.join("out", "report.pdf")
+
+    for index, (name, value, error) in enumerate(
+        [
+            ("../up", blocks, "Invalid document name"),
+            ("a/b", blocks, "Invalid document name"),
+            (os.path.abspath("abs"), blocks, "Invalid document name"),
+            ("report", blocks, "Duplicate document name"),
+            ("other", "not a list", "list of Block objects"),
+        ],
+        start=1,
+    ):
+        result = _pdf_job(index, name, value, "out", seen)
+        assert isinstance(result, PdfResult)
+        assert (result.position, result.ok) == (index, False)
+        assert error in result.error
@@ -1,5 +1,11 @@
+import sys
+
 import pytest
-from blocknote.converter.dict_to_blocknote import dict_to_blocks
+from blocknote.converter.blocknote_to_dict import blocks_to_json
+from blocknote.converter.dict_to_blocknote import (
+    blocks_from_json,
+    dict_to_blocks,
+)
 from blocknote.schema import Block, InlineContent
 
 
@@ -116,3 +122,253 @@ def test_dict_to_blocks_new_block_types(block_type, content, expected_valid):
     else:
         with pytest.raises(ValueError):
             dict_to_blocks(data)
+
+
+def test_dict_to_blocks_trusted_matches_validated():
+    """Test that trusted construction builds the same tree as validation."""
+    data = [
+        {
+            "id": "1",
+            "type": "bulletListItem",
+            "props": {"textColor": "red"},
+            "content": [
+                {"type": "text", "text": "Item", "styles": {"bold": True}}
+            ],
+            "children": [
+                {"id": "2", "type": "paragraph", "content": "Nested"},
+            ],
+        },
+        {"id": "3", "type": "table", "content": []},
+    ]
+    trusted = dict_to_blocks(data, trusted=True)
+    validated = dict_to_blocks(data)
+
+    assert [b.model_dump() for b in trusted] == [
+        b.model_dump() for b in validated
+    ]
+    assert isinstance(trusted[0].children[0], Block)
+    assert isinstance(trusted[0].children[0].content[0], InlineContent)
+
+
+def test_dict_to_blocks_trusted_skips_validation():
+    """Test that trusted mode does not validate the block type."""
+    blocks = dict_to_blocks([{"id": "1", "type": "custom"}], trusted=True)
+    assert blocks[0].type == "custom"
+    assert blocks[0].content == []
+    assert blocks[0].children == []
+
+
+@pytest.mark.parametrize("block_type", ["paragraph", "table"])
+def test_dict_to_blocks_trusted_checks_content_type(block_type):
+    """Test that trusted content must be a str, a list or None."""
+    blocks = dict_to_blocks(
+        [{"id": "1", "type": block_type, "content": None}], trusted=True
+    )
+    assert blocks[0].content == []
+
+    data = [
+        {
+            "id": "1",
+            "type": "paragraph",
+            "children": [
+                {"id": "2", "type": block_type, "content": {"rows": []}}
+            ],
+        }
+    ]
+    with pytest.raises(ValueError, match="Invalid content type for block '2'"):
+        dict_to_blocks(data, trusted=True)
+
+
+def test_dict_to_blocks_trusted_copies_props_and_styles():
+    """Test that editing trusted blocks leaves the input dicts alone."""
+    data = [
+        {
+            "id": "1",
+            "type": "paragraph",
+            "props": {"textColor": "red"},
+            "content": [{"type": "text", "text": "x", "styles": {"bold": 1}}],
+        }
+    ]
+    block = dict_to_blocks(data, trusted=True)[0]
+    block.props["textColor"] = "blue"
+    block.content[0].styles["bold"] = 0
+
+    assert data[0]["props"] == {"textColor": "red"}
+    assert data[0]["content"][0]["styles"] == {"bold": 1}
+
+
+def test_dict_to_blocks_trusted_sets_given_fields():
+    """Test that trusted blocks record their fields as set."""
+    data = [
+        {
+            "id": "1",
+            "type": "bulletListItem",
+            "content": [{"type": "text", "text": "Item", "styles": {}}],
+            "children": [{"id": "2", "type": "paragraph", "content": "x"}],
+        }
+    ]
+    block = dict_to_blocks(data, trusted=True)[0]
+
+    assert block.model_fields_set == {
+        "id",
+        "type",
+        "props",
+        "content",
+        "children",
+    }
+    assert block.content[0].model_fields_set == {"type", "text", "styles"}
+    assert block == dict_to_blocks(data)[0]
+
+
+def test_dict_to_blocks_nested_children():
+    """Test that nested children are validated into Block objects."""
+    data = [
+        {
+            "id": "1",
+            "type": "bulletListItem",
+            "content": "Parent",
+            "children": [
+                {"id": "2", "type": "paragraph", "content": "Child"},
+            ],
+        }
+    ]
+    blocks = dict_to_blocks(data)
+    child = blocks[0].children[0]
+    assert isinstance(child, Block)
+    assert isinstance(child.content[0], InlineContent)
+    assert child.content[0].text == "Child"
+
+
+def test_dict_to_blocks_non_dict_item():
+    """Test that non-dict items are rejected with their index."""
+    with pytest.raises(ValueError, match="Item at index 1 must be a dict"):
+        dict_to_blocks([{"id": "1", "type": "paragraph"}, "not a dict"])
+
+
+def test_blocks_from_json_matches_dict_to_blocks(sample_block_data):
+    """Test that JSON ingest produces the same blocks as dict ingest."""
+    import json
+
+    payload = json.dumps(sample_block_data)
+    from_bytes = blocks_from_json(payload.encode("utf-8"))
+    from_str = blocks_from_json(payload)
+
+    expected = dict_to_blocks(sample_block_data)
+    assert from_bytes == expected
+    assert from_str == expected
+
+
+def test_blocks_from_json_string_content():
+    """Test that string content is normalized to InlineContent."""
+    blocks = blocks_from_json(
+        b'[{"id": "1", "type": "heading", "props": {"level": 2},'
+        b' "content": "Title"}]'
+    )
+    assert blocks[0].props == {"level": 2}
+    assert isinstance(blocks[0].content[0], InlineContent)
+    assert blocks[0].content[0].text == "Title"
+
+
+@pytest.mark.parametrize(
+    "invalid_input,expected_error,error_type",
+    [
+        (b"not json", "Failed to convert JSON to blocks", ValueError),
+        (b'[{"id": "1", "type": "invalid"}]', "type", ValueError),
+        ([{"id": "1", "type": "paragraph"}], "JSON bytes or str", TypeError),
+    ],
+)
+def test_blocks_from_json_errors(invalid_input, expected_error, error_type):
+    """Test that invalid JSON input raises appropriate errors."""
+    with pytest.raises(error_type, match=expected_error):
+        blocks_from_json(invalid_input)
+
+
+def _nested_dicts(depth):
+    """A chain of paragraph dicts, each the only child of the previous one."""
+    root = block = {"id": "0", "type": "paragraph", "content": "level 0"}
+    for level in range(1, depth):
+        child = {"id": str(level), "type": "paragraph", "content": "x"}
+        block["children"] = [child]
+        block = child
+    return [root]
+
+
+def _depth(blocks):
+    levels = 1
+    block = blocks[0]
+    while block.children:
+        block = block.children[0]
+        levels += 1
+    return levels
+
+
+@pytest.mark.parametrize("depth", [1_000, 10_000, 100_000])
+@pytest.mark.parametrize("trusted", [False, True])
+def test_dict_to_blocks_deep_nesting(depth, trusted):
+    """Test that nesting depth is not limited by the recursion limit."""
+    blocks = dict_to_blocks(_nested_dicts(depth), trusted=trusted)
+    assert _depth(blocks) == depth
+    assert blocks[0].content[0].text == "level 0"
+
+
+def test_dict_to_blocks_deep_invalid_block():
+    """Test that errors in deep trees name the block instead of the dict."""
+    data = _nested_dicts(2_000)
+    block = data[0]
+    for _ in range(1_500):
+        block = block["children"][0]
+    block["type"] = "invalid"
+    with pytest.raises(ValueError, match="Block id: '1500'") as excinfo:
+        dict_to_blocks(data)
+    assert len(str(excinfo.value)) < 200
+
+
+@pytest.mark.parametrize("depth", [100, 1_000, 1_900])
+def test_blocks_from_json_deep_nesting(depth):
+    """Test that JSON nested beyond the parser limits still loads."""
+    data = blocks_to_json(dict_to_blocks(_nested_dicts(depth))).decode()
+    blocks = blocks_from_json(data)
+    assert _depth(blocks) == depth
+    assert _depth(blocks_from_json(data.encode())) == depth
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '[{"id": "0", "type": "paragraph", "children": [' * 1_000 + "]",
+        '[{"id": "0", "type": "paragraph", "children": [1,]}' * 1_000,
+    ],
+)
+def test_blocks_from_json_deep_malformed(data):
+    """Test that malformed deep JSON is rejected."""
+    with pytest.raises(ValueError, match="Failed to convert JSON to blocks"):
+        blocks_from_json(data)
+
+
+def test_blocks_from_json_too_deep():
+    """Test that JSON past the raised recursion limit is rejected."""
+    limit = sys.getrecursionlimit()
+    data = blocks_to_json(dict_to_blocks(_nested_dicts(10_000)))
+
+    with pytest.raises(ValueError, match="nested too deeply to parse"):
+        blocks_from_json(data)
+    assert sys.getrecursionlimit() == limit
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_dict_to_blocks_max_depth(trusted):
+    """Test that max_depth is checked before blocks are built."""
+    data = _nested_dicts(5)
+    assert _depth(dict_to_blocks(data, trusted=trusted, max_depth=5)) == 5
+    with pytest.raises(ValueError, match="nested deeper than max_depth=4"):
+        dict_to_blocks(data, trusted=trusted, max_depth=4)
+
+
+def test_blocks_from_json_max_depth():
+    """Test that max_depth applies to shallow and deep JSON alike."""
+    for depth in (5, 1_000):
+        data = blocks_to_json(dict_to_blocks(_nested_dicts(depth)))
+        with pytest.raises(ValueError, match="max_depth=4"):
+            blocks_from_json(data, max_depth=4)
+    with pytest.raises(ValueError, match="max_depth must be at least 1"):
+        blocks_from_json("[]", max_depth=0)
@@ -0,0 +1,172 @@
+import pytest
+from blocknote.converter.blocknote_to_html import blocks_to_html
+from blocknote.converter.blocknote_to_md import blocks_to_markdown
+from blocknote.converter.document import Document
+from blocknote.schema import Block, InlineContent
+
+
+def _paragraph(block_id, text="", children=()):
+    return Block(
+        id=block_id,
+        type="paragraph",
+        content=[InlineContent(type="text", text=text or block_id)],
+        children=list(children),
+    )
+
+
+def _document():
+    """a(b, c(d)), e"""
+    return Document(
+        [
+            _paragraph(
+                "a",
+                children=[
+                    _paragraph("b"),
+                    _paragraph("c", children=[_paragraph("d")]),
+                ],
+            ),
+            _paragraph("e"),
+        ]
+    )
+
+
+def test_lookups():
+    """Test get, parent, siblings, path and membership."""
+    document = _document()
+    assert document.get("d").content[0].text == "d"
+    assert document.parent("d").id == "c"
+    assert document.parent("a") is None
+    assert [b.id for b in document.siblings("c")] == ["b", "c"]
+    assert document.path("d") == (0, 1, 0)
+    assert document.path("e") == (1,)
+    assert "d" in document and "z" not in document
+    assert len(document) == 2
+    assert [b.id for b in document] == ["a", "e"]
+
+
+def test_missing_block():
+    """Test that unknown IDs raise KeyError."""
+    with pytest.raises(KeyError, match="No block with id 'z'"):
+        _document().get("z")
+
+
+def test_traversal_orders():
+    """Test depth-first and breadth-first iteration."""
+    document = _document()
+    assert [b.id for b in document.iter_depth_first()] == list("abcde")
+    assert [b.id for b in document.iter_breadth_first()] == list("aebcd")
+
+
+def test_deep_traversal_does_not_recurse():
+    """Test indexing and walking a tree deeper than the recursion limit."""
+    root = leaf = _paragraph("0")
+    for i in range(1, 5000):
+        child = _paragraph(str(i))
+        leaf.children.append(child)
+        leaf = child
+    document = Document([root])
+    assert document.parent("4999").id == "4998"
+    assert len(document.path("4999")) == 5000
+    assert sum(1 for _ in document.iter_depth_first()) == 5000
+    assert sum(1 for _ in document.iter_breadth_first()) == 5000
+
+
+def test_insert_keeps_index():
+    """Test inserting blocks and dicts at positions and under parents."""
+    document = _document()
+    document.get("a")  # build the index
+    document.insert(_paragraph("x", children=[_paragraph("y")]), "c", 0)
+    document.insert({"id": "z", "type": "paragraph", "content": "Z"})
+    assert document.path("y") == (0, 1, 0, 0)
+    assert document.parent("x").id == "c"
+    assert document.path("z") == (2,)
+    assert document.get("z").content[0].text == "Z"
+
+    with pytest.raises(ValueError, match="Duplicate block id 'b'"):
+        document.insert(_paragraph("b"))
+    with pytest.raises(KeyError):
+        document.insert(_paragraph("w"), "missing")
+
+
+def test_move_keeps_index():
+    """Test moving a subtree to another parent and position."""
+    document = _document()
+    document.move("c", None, 0)
+    assert [b.id for b in document] == ["c", "a", "e"]
+    assert document.parent("c") is None
+    assert document.path("d") == (0, 0)
+    assert [b.id for b in document.get("a").children] == ["b"]
+
+    document.move("a", "e")
+    assert document.path("b") == (1, 0, 0)
+
+    with pytest.raises(ValueError, match="own subtree"):
+        document.move("e", "b")
+
+
+def test_delete_keeps_index():
+    """Test that deleting a block removes its subtree from the index."""
+    document = _document()
+    removed = document.delete("c")
+    assert removed.id == "c"
+    assert "c" not in document and "d" not in document
+    assert [b.id for b in document.iter_depth_first()] == ["a", "b", "e"]
+
+
+def test_update():
+    """Test updating type, props and content."""
+    document = _document()
+    document.update("b", type="heading", props={"level": 2}, content="Title")
+    assert blocks_to_markdown([document.get("b")]) == "## Title"
+    document.update("b", content=[InlineContent(type="text", text="New")])
+    assert document.get("b").content[0].text == "New"
+    with pytest.raises(ValueError, match="children"):
+        document.update("b", children=[])
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"type": "no-such-type"},
+        {"props": ["level", 2]},
+        {"content": 42},
+        {"type": "paragraph", "content": [{"text": "missing type"}]},
+    ],
+)
+def test_update_validates(fields):
+    """Test that invalid values are rejected and leave the block alone."""
+    document = _document()
+    before = document.get("b").model_copy(deep=True)
+    with pytest.raises(ValueError):
+        document.update("b", **fields)
+    assert document.get("b") == before
+
+
+def test_reindex_after_direct_changes():
+    """Test that reindex() picks up edits made to the lists directly."""
+    document = _document()
+    document.get("a")
+    document.blocks.append(_paragraph("f"))
+    assert "f" not in document
+    document.reindex()
+    assert document.path("f") == (2,)
+
+
+def test_duplicate_ids_rejected():
+    """Test that a document with repeated IDs fails on first lookup."""
+    document = Document([_paragraph("a"), _paragraph("a")])
+    with pytest.raises(ValueError, match="Duplicate block id 'a'"):
+        document.get("a")
+    with pytest.raises(TypeError, match="list of Block objects"):
+        Document("not a list")
+
+
+def test_converters():
+    """Test the conversion shortcuts and use with the plain converters."""
+    document = Document.from_markdown("# Title\n\n- one\n- two")
+    assert document.to_markdown() == blocks_to_markdown(document.blocks)
+    assert document.to_html() == blocks_to_html(document.blocks)
+    data, payload = document.to_dict(), document.to_json()
+    assert Document.from_dict(data).to_dict() == data
+    assert Document.from_json(payload).to_json() == payload
+    assert Document.from_html("<p>Hi</p>").to_html() == "<p>Hi</p>"
@@ -0,0 +1,138 @@
+import pytest
+from blocknote.converter.dict_to_blocknote import dict_to_blocks
+from blocknote.converter.fingerprint import (
+    _memoized_digest,
+    block_fingerprint,
+    document_fingerprint,
+)
+from blocknote.schema import Block, InlineContent
+
+
+def _paragraph(block_id, text, **styles):
+    return Block(
+        id=block_id,
+        type="paragraph",
+        content=[InlineContent(type="text", text=text, styles=styles)],
+    )
+
+
+def _tree(suffix=""):
+    return Block(
+        id=f"list{suffix}",
+        type="bulletListItem",
+        content=[InlineContent(type="text", text="Items")],
+        children=[
+            _paragraph(f"a{suffix}", "One", bold=True),
+            Block(
+                id=f"b{suffix}",
+                type="bulletListItem",
+                children=[_paragraph(f"c{suffix}", "Two")],
+            ),
+        ],
+    )
+
+
+def test_equal_content_equal_fingerprint():
+    """Test that fingerprints ignore block IDs and object identity."""
+    assert block_fingerprint(_tree()) == block_fingerprint(_tree("-copy"))
+    assert len(block_fingerprint(_tree())) == 32
+
+
+def test_fingerprint_is_stable():
+    """Test that the digest does not depend on the process or dict order."""
+    first = Block(
+        id="1", type="heading", props={"level": 2, "textAlignment": "left"}
+    )
+    second = Block(
+        id="2", type="heading", props={"textAlignment": "left", "level": 2}
+    )
+    assert block_fingerprint(first) == block_fingerprint(second)
+    # BLAKE2b-128 of '["heading",{"level":2,"textAlignment":"left"},[]]'
+    assert block_fingerprint(first) == "db425e0037c26315340e4d5a2aa53355"
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda tree: setattr(tree.children[1].children[0], "type", "quote"),
+        lambda tree: tree.children[0].content[0].styles.update(bold=False),
+        lambda tree: tree.children[1].children[0].props.update(level=1),
+        lambda tree: setattr(
+            tree.children[1].children[0].content[0], "text", "2"
+        ),
+        lambda tree: tree.children.reverse(),
+        lambda tree: tree.children.pop(),
+    ],
+)
+def test_any_change_changes_fingerprint(change):
+    """Test that type, style, prop, text and child changes are detected."""
+    tree = _tree()
+    before = block_fingerprint(tree)
+    change(tree)
+    assert block_fingerprint(tree) != before
+
+
+def test_int_and_bool_values_differ():
+    """Test that values comparing equal across types get distinct digests."""
+    one = _paragraph("p", "Text", bold=1)
+    true = _paragraph("p", "Text", bold=True)
+    assert block_fingerprint(one) != block_fingerprint(true)
+
+
+def test_unhashable_values_match_hashable_path():
+    """Test that blocks with list props hash like their JSON content."""
+    block = Block(id="t", type="table", props={"widths": [1, 2]})
+    assert block_fingerprint(block) == block_fingerprint(block.model_copy())
+    block.props["widths"].append(3)
+    assert block_fingerprint(block) != block_fingerprint(
+        Block(id="t", type="table", props={"widths": [1, 2]})
+    )
+
+
+def test_unchanged_subtrees_are_not_rehashed():
+    """Test that an edit only rehashes the changed block and its ancestors."""
+    tree = _tree()
+    block_fingerprint(tree)
+    misses = _memoized_digest.cache_info().misses
+
+    tree.children[1].children[0].content[0].text = "Changed"
+    block_fingerprint(tree)
+    # The leaf, its parent and the root; the sibling subtree is memoized.
+    assert _memoized_digest.cache_info().misses - misses == 3
+
+
+def test_fresh_objects_reuse_memoized_digests():
+    """Test that a revision loaded from dicts reuses memoized digests."""
+    data = [_tree().model_dump()]
+    document_fingerprint(dict_to_blocks(data))
+    misses = _memoized_digest.cache_info().misses
+    document_fingerprint(dict_to_blocks(data))
+    assert _memoized_digest.cache_info().misses == misses
+
+
+def test_document_fingerprint_is_ordered():
+    """Test that document fingerprints depend on block order."""
+    a, b = _paragraph("a", "A"), _paragraph("b", "B")
+    assert document_fingerprint([a, b]) != document_fingerprint([b, a])
+    assert document_fingerprint([a]) != block_fingerprint(a)
+    assert document_fingerprint([]) == document_fingerprint([])
+
+
+def test_deep_tree_does_not_recurse():
+    """Test that deeply nested trees are hashed without recursion."""
+    root = leaf = Block(id="0", type="bulletListItem")
+    for i in range(1, 5000):
+        child = Block(id=str(i), type="bulletListItem")
+        leaf.children.append(child)
+        leaf = child
+    assert len(block_fingerprint(root)) == 32
+
+
+def test_invalid_input():
+    """Test that non-Block input is rejected."""
+    with pytest.raises(TypeError, match="Block object"):
+        block_fingerprint({"type": "paragraph"})
+    with pytest.raises(TypeError, match="list of Block objects"):
+        document_fingerprint("not a list")
+    with pytest.raises(TypeError, match="index 1"):
+        document_fingerprint([_paragraph("a", "A"), "b"])
@@ -0,0 +1,251 @@
+import random
+import sys
+
+import pytest
+from blocknote.converter.block_ids import counter_ids
+from blocknote.converter.blocknote_to_html import blocks_to_html
+from blocknote.converter.html_to_blocknote import (
+    HTML_BACKENDS,
+    LXML_AVAILABLE,
+    html_to_blocks,
+)
+from blocknote.schema import Block, InlineContent
+
+BOLD = {"bold": True}
+
+# (html, expected blocks as (type, props, [(text, styles), ...]))
+CONFORMANCE_CASES = [
+    ("<p>Hello</p>", [("paragraph", {}, [("Hello", {})])]),
+    (
+        "<h1>One</h1><h3>Three</h3>",
+        [
+            ("heading", {"level": 1}, [("One", {})]),
+            ("heading", {"level": 3}, [("Three", {})]),
+        ],
+    ),
+    (
+        "<p>a <b>b</b> <strong><em>c</em></strong> <u>d</u> <s>e</s>"
+        " <code>f</code></p>",
+        [
+            (
+                "paragraph",
+                {},
+                [
+                    ("a ", {}),
+                    ("b", BOLD),
+                    (" ", {}),
+                    ("c", {"bold": True, "italic": True}),
+                    (" ", {}),
+                    ("d", {"underline": True}),
+                    (" ", {}),
+                    ("e", {"strike": True}),
+                    (" ", {}),
+                    ("f", {"code": True}),
+                ],
+            )
+        ],
+    ),
+    (
+        '<p><span style="color: red; background-color: yellow">x</span>'
+        '<span style="font-size: 12px">y</span></p>',
+        [
+            (
+                "paragraph",
+                {},
+                [
+                    ("x", {"textColor": "red", "backgroundColor": "yellow"}),
+                    ("y", {}),
+                ],
+            )
+        ],
+    ),
+    (
+        "<ul><li>a</li><li><b>b</b></li></ul><ol><li>c</li></ol>",
+        [
+            ("bulletListItem", {}, [("a", {})]),
+            ("bulletListItem", {}, [("b", BOLD)]),
+            ("numberedListItem", {}, [("c", {})]),
+        ],
+    ),
+    (
+        "<blockquote>quoted</blockquote><div>plain div</div>",
+        [
+            ("quote", {}, [("quoted", {})]),
+            ("paragraph", {}, [("plain div", {})]),
+        ],
+    ),
+    (
+        '<div class="blocknote-checkListItem">'
+        '<input type="checkbox" checked>done</div>'
+        '<div class="blocknote-unknown">x</div>',
+        [
+            ("checkListItem", {"checked": True}, [("done", {})]),
+            ("paragraph", {}, [("x", {})]),
+        ],
+    ),
+    (
+        "<p>AT&amp;T &lt;tag&gt; &quot;q&quot; &#x27;s&#39; &nbsp;&check;"
+        " &amp;lt;</p>",
+        [
+            (
+                "paragraph",
+                {},
+                [("AT&T <tag> \"q\" 's' \xa0✓ &lt;", {})],
+            )
+        ],
+    ),
+    (
+        "<p>one<!-- comment -->two</p><!-- between --><p></p>",
+        [("paragraph", {}, [("onetwo", {})]), ("paragraph", {}, [])],
+    ),
+    (
+        "outside <b>blocks</b><p>in</p> tail",
+        [("paragraph", {}, [("in", {})])],
+    ),
+    (
+        "<html><head><title>T</title></head><body><p>x</p></body></html>",
+        [("paragraph", {}, [("x", {})])],
+    ),
+    (
+        '<p class=MsoNormal><span lang=EN-US style="color: #333333">'
+        "Word<o:p></o:p></span><span> paste</span></p>",
+        [
+            (
+                "paragraph",
+                {},
+                [("Word", {"textColor": "#333333"}), (" paste", {})],
+            )
+        ],
+    ),
+    (
+        "<p>日本語 <b>太字</b> emoji \U0001f600</p>",
+        [
+            (
+                "paragraph",
+                {},
+                [("日本語 ", {}), ("太字", BOLD), (" emoji \U0001f600", {})],
+            )
+        ],
+    ),
+    (
+        "<p>line<br>break  and   spaces\n</p>",
+        [("paragraph", {}, [("linebreak  and   spaces\n", {})])],
+    ),
+    (
+        '<?xml version="1.0" encoding="utf-8"?><p>declared</p>',
+        [("paragraph", {}, [("declared", {})])],
+    ),
+]
+
+BACKENDS = [
+    "stdlib",
+    pytest.param(
+        "lxml",
+        marks=pytest.mark.skipif(
+            not LXML_AVAILABLE, reason="lxml is not installed"
+        ),
+    ),
+]
+
+
+def _summary(blocks):
+    return [
+        (
+            block.type,
+            block.props,
+            [(item.text, item.styles) for item in block.content],
+        )
+        for block in blocks
+    ]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("html,expected", CONFORMANCE_CASES)
+def test_html_backend_conformance(backend, html, expected):
+    """Test that each backend produces the expected blocks."""
+    assert _summary(html_to_blocks(html, backend=backend)) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("html,expected", CONFORMANCE_CASES)
+def test_html_backends_agree(backend, html, expected):
+    """Test that blocks, IDs included, match the stdlib backend."""
+    for merge_runs in (True, False):
+        assert html_to_blocks(
+            html, counter_ids(), merge_runs, backend
+        ) == html_to_blocks(html, counter_ids(), merge_runs, "stdlib")
+
+
+def _random_blocks(rng, count):
+    styles = [
+        {},
+        {},
+        BOLD,
+        {"italic": True, "underline": True},
+        {"code": True},
+        {"textColor": "red", "strike": True},
+        {"backgroundColor": "blue", "bold": True},
+    ]
+    types = ["paragraph", "heading", "bulletListItem", "quote"]
+    blocks = []
+    for i in range(count):
+        block_type = rng.choice(types)
+        props = {"level": rng.randint(1, 6)} if block_type == "heading" else {}
+        content = [
+            InlineContent(
+                type="text",
+                text=rng.choice(["word", "two words", " & <x> ", "é\"'"]),
+                styles=rng.choice(styles),
+            )
+            for _ in range(rng.randint(0, 5))
+        ]
+        blocks.append(
+            Block(id=str(i), type=block_type, props=props, content=content)
+        )
+    return blocks
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_html_backends_round_trip(backend):
+    """Test that rendered documents parse identically with each backend."""
+    rng = random.Random(7)
+    for _ in range(50):
+        html = blocks_to_html(_random_blocks(rng, 8))
+        assert html_to_blocks(html, counter_ids(), backend=backend) == (
+            html_to_blocks(html, counter_ids(), backend="stdlib")
+        )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_html_backend_deep_nesting(backend):
+    """Test nesting deeper than libxml2 allows (lxml falls back)."""
+    depth = 3000
+    html = "<p>" + "<i><span>" * depth + "x" + "</span></i>" * depth + "</p>"
+    blocks = html_to_blocks(html, backend=backend)
+
+    assert _summary(blocks) == [("paragraph", {}, [("x", {"italic": True})])]
+
+
+def test_html_backend_lxml_missing(monkeypatch):
+    """Test that the lxml backend falls back when lxml cannot be imported."""
+    monkeypatch.setitem(sys.modules, "lxml", None)
+    html = "<h2>Title</h2><p>a <b>b</b></p>"
+
+    assert html_to_blocks(html, counter_ids(), backend="lxml") == (
+        html_to_blocks(html, counter_ids())
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_html_backend_empty(backend):
+    """Test inputs without blocks."""
+    assert html_to_blocks("", backend=backend) == []
+    assert html_to_blocks("  \n", backend=backend) == []
+    assert html_to_blocks("<!-- only a comment -->", backend=backend) == []
+
+
+def test_html_backend_unknown():
+    """Test that an unknown backend raises ValueError."""
+    assert HTML_BACKENDS == ("stdlib", "lxml")
+    with pytest.raises(ValueError, match="Unknown HTML backend 'html5lib'"):
+        html_to_blocks("<p>x</p>", backend="html5lib")
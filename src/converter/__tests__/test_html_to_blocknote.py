@@ -1,5 +1,14 @@
+import io
+import random
+
 import pytest
-from blocknote.converter.html_to_blocknote import html_to_blocks
+from blocknote.converter import html_to_blocknote
+from blocknote.converter.block_ids import counter_ids
+from blocknote.converter.html_to_blocknote import (
+    BlockNoteHTMLParser,
+    html_to_blocks,
+    iter_html_blocks,
+)
 
 
 def test_html_to_blocks_basic():
@@ -130,6 +139,120 @@ def test_html_to_blocks_span_with_styles():
     assert content.styles.get("backgroundColor") == "yellow"
 
 
+def test_html_to_blocks_plain_span_keeps_outer_styles():
+    """Test that closing an unstyled span does not end the outer style."""
+    html = '<p><b><span>one</span> two<span style="">three</span></b></p>'
+    blocks = html_to_blocks(html, merge_runs=False)
+
+    assert [item.styles for item in blocks[0].content] == [{"bold": True}] * 3
+
+
+def test_html_to_blocks_deep_span_soup():
+    """Test styles through deeply nested spans, and the shared snapshots."""
+    depth = 500
+    html = (
+        "<p><b>"
+        + '<span style="color: red"><span>' * depth
+        + "deep"
+        + "</span></span>" * depth
+        + "</b> after</p>"
+    )
+    parser = BlockNoteHTMLParser()
+    parser.feed(html.split("deep")[0])
+    assert len(parser.style_stack) == 2 * depth + 2
+    assert len({id(styles) for styles in parser.style_stack}) == 3
+    parser.feed("deep" + html.split("deep")[1])
+
+    content = parser.get_blocks()[0].content
+    assert [(item.text, item.styles) for item in content] == [
+        ("deep", {"bold": True, "textColor": "red"}),
+        (" after", {}),
+    ]
+    assert parser.style_stack == [{}]
+
+
+def _random_span_soup(rng, depth, outer, html, expected):
+    """Append nested styled spans to html, and each text's styles."""
+    for _ in range(rng.randint(1, 3)):
+        text = f"t{len(expected)}"
+        if depth and rng.random() < 0.6:
+            tag, styles = rng.choice(
+                [
+                    ("b", {"bold": True}),
+                    ("span", {}),
+                    ("span", {"textColor": f"#{rng.randrange(8):06x}"}),
+                    ("span", {"backgroundColor": f"#{rng.randrange(8):06x}"}),
+                ]
+            )
+            css = "; ".join(
+                f"{'color' if name == 'textColor' else 'background-color'}: "
+                f"{value}"
+                for name, value in styles.items()
+                if tag == "span"
+            )
+            html.append(f'<{tag} style="{css}">' if css else f"<{tag}>")
+            _random_span_soup(
+                rng, depth - 1, {**outer, **styles}, html, expected
+            )
+            html.append(f"</{tag}>")
+        html.append(text)
+        expected.append((text, outer))
+
+
+def test_html_to_blocks_span_styles_across_cache_clears(monkeypatch):
+    """Test that every run is styled right while the merge cache churns."""
+    monkeypatch.setattr(html_to_blocknote, "_MAX_SNAPSHOTS", 3)
+    rng = random.Random(5)
+    for _ in range(200):
+        html, expected = ["<p>"], []
+        _random_span_soup(rng, 6, {}, html, expected)
+        html.append("</p>")
+
+        blocks = html_to_blocks("".join(html))
+        styled = [
+            (char, item.styles)
+            for item in blocks[0].content
+            for char in item.text
+        ]
+        assert styled == [
+            (char, styles) for text, styles in expected for char in text
+        ]
+
+
+def test_html_to_blocks_style_cache_keeps_recent_merges(monkeypatch):
+    """Test that the merge cache evicts the least recently used merge."""
+    monkeypatch.setattr(html_to_blocknote, "_MAX_SNAPSHOTS", 2)
+    parser = BlockNoteHTMLParser()
+    parser.feed(
+        '<p><b>a</b><span style="color: red">b</span><b>c</b>'
+        '<span style="color: blue">d</span><b>e</b></p>'
+    )
+
+    assert list(parser._snapshots) == [
+        ((), (("textColor", "blue"),)),
+        ((), (("bold", True),)),
+    ]
+    content = parser.get_blocks()[0].content
+    assert [(item.text, item.styles) for item in content] == [
+        ("a", {"bold": True}),
+        ("b", {"textColor": "red"}),
+        ("c", {"bold": True}),
+        ("d", {"textColor": "blue"}),
+        ("e", {"bold": True}),
+    ]
+
+
+def test_html_to_blocks_unbalanced_style_tags():
+    """Test that stray closing style tags are ignored."""
+    blocks = html_to_blocks("<p></b></span>a<i>b</i></code>c</p>")
+
+    assert [(item.text, item.styles) for item in blocks[0].content] == [
+        ("a", {}),
+        ("b", {"italic": True}),
+        ("c", {}),
+    ]
+
+
 def test_html_to_blocks_blockquote():
     """Test blockquote conversion."""
     html = "<blockquote>This is a quote</blockquote>"
@@ -250,3 +373,135 @@ def test_html_to_blocks_malformed_html():
     blocks = html_to_blocks(html)
 
     assert len(blocks) >= 1
+
+
+def test_html_to_blocks_id_factory():
+    """Test that the ID factory is used for every parsed block."""
+    from blocknote.converter.block_ids import counter_ids
+
+    html = "<h1>Title</h1><p>One</p><p>Two</p>"
+    factory = counter_ids(prefix="blk-")
+
+    blocks = html_to_blocks(html, id_factory=factory)
+    assert [b.id for b in blocks] == ["blk-1", "blk-2", "blk-3"]
+    assert html_to_blocks(html, id_factory=factory) == blocks
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "plain prose without entities",
+        "<a href=\"x\">Tom & Jerry's</a>",
+        "&amp;lt; already escaped &quot;",
+        "日本語 & 中文 <b>",
+        "",
+    ],
+)
+def test_unescape_html_reverses_escape_html(text):
+    """Test that unescaping is the exact inverse of escaping."""
+    from blocknote.converter.blocknote_to_html import _escape_html
+    from blocknote.converter.html_to_blocknote import _unescape_html
+
+    assert _unescape_html(_escape_html(text)) == text
+
+
+_STREAM_HTML = (
+    "<h1>Title &amp; more</h1>"
+    "<p>Plain text, <strong>bold <em>both</em></strong> and "
+    '<span style="color: red">red</span> AT&T a < b</p>'
+    "<ul><li>One</li><li>Two <code>x</code></li></ul>"
+    '<ol><li>Three</li></ol><div class="blocknote-quote">Quote</div>'
+    '<div><input type="checkbox" checked>Done</div>'
+    "<blockquote>Said &lt;this&gt;</blockquote>"
+)
+
+
+def _split(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 1000])
+def test_iter_html_blocks_matches_html_to_blocks(size):
+    """Test that every chunking yields the blocks of the batch parser."""
+    expected = html_to_blocks(_STREAM_HTML, id_factory=counter_ids())
+    blocks = list(
+        iter_html_blocks(_split(_STREAM_HTML, size), id_factory=counter_ids())
+    )
+    assert blocks == expected
+
+
+def test_iter_html_blocks_file_object():
+    """Test reading from a text file object in small chunks."""
+    expected = html_to_blocks(_STREAM_HTML, id_factory=counter_ids())
+    blocks = iter_html_blocks(
+        io.StringIO(_STREAM_HTML), id_factory=counter_ids(), chunk_size=5
+    )
+    assert list(blocks) == expected
+
+
+def test_iter_html_blocks_is_lazy():
+    """Test that blocks are yielded before the source is exhausted."""
+    read = []
+
+    def chunks():
+        for i in range(1_000):
+            read.append(i)
+            yield f"<p>Paragraph {i}</p>"
+
+    blocks = iter_html_blocks(chunks())
+    first = next(blocks)
+    assert first.content[0].text == "Paragraph 0"
+    assert len(read) < 3
+    assert sum(1 for _ in blocks) == 999
+
+
+def test_iter_html_blocks_parser_state_is_bounded():
+    """Test that void tags and distinct styles do not grow parser state."""
+    parser = html_to_blocknote.BlockNoteHTMLParser()
+
+    def chunks():
+        for i in range(5_000):
+            yield (
+                f'<ul><li>Item<br><img src="{i}.png"><br/>'
+                f'<span style="color: #{i:06x}"><b>{i}</b></span></li></ul>'
+            )
+
+    blocks = 0
+    for chunk in chunks():
+        blocks += len(html_to_blocknote._feed(parser, chunk))
+        assert parser.tag_stack == []
+        assert len(parser._snapshots) <= html_to_blocknote._MAX_SNAPSHOTS
+    assert blocks == 5_000
+
+    # A <br> left on the stack used to keep the <ol> open after </ol>.
+    blocks = html_to_blocks("<ol><li>a<br></li></ol><li>b</li>")
+    assert [block.type for block in blocks] == [
+        "numberedListItem",
+        "bulletListItem",
+    ]
+
+
+def test_iter_html_blocks_empty():
+    """Test that empty and whitespace-only sources yield no blocks."""
+    assert list(iter_html_blocks([])) == []
+    assert list(iter_html_blocks(io.StringIO("  \n"))) == []
+
+
+@pytest.mark.parametrize(
+    "source,error,message",
+    [
+        (123, TypeError, "file object or an iterable"),
+        (b"<p>x</p>", TypeError, "file object or an iterable"),
+        (io.StringIO("<p>x</p>"), ValueError, "chunk_size must be at least 1"),
+    ],
+)
+def test_iter_html_blocks_invalid_source(source, error, message):
+    """Test that bad sources fail before iteration starts."""
+    with pytest.raises(error, match=message):
+        iter_html_blocks(source, chunk_size=0 if error is ValueError else 1)
+
+
+def test_iter_html_blocks_non_str_chunk():
+    """Test that a binary chunk is rejected."""
+    with pytest.raises(TypeError, match="Chunks must be str"):
+        list(iter_html_blocks(["<p>x</p>", b"<p>y</p>"]))
@@ -0,0 +1,209 @@
+import random
+
+import pytest
+from blocknote.converter.blocknote_to_html import (
+    _convert_block_to_html,
+    _extract_content_html,
+    blocks_to_html,
+    register_html_renderer,
+)
+from blocknote.converter.incremental import FragmentPatch, IncrementalRenderer
+from blocknote.converter.traversal import longest_increasing_subsequence
+from blocknote.schema import Block, InlineContent
+
+
+def _paragraph(block_id, text):
+    return Block(
+        id=block_id,
+        type="paragraph",
+        content=[InlineContent(type="text", text=text)],
+    )
+
+
+def _apply(fragments, patches):
+    """Apply patches to a list of (block_id, html) like a frontend would."""
+    fragments = list(fragments)
+    for patch in patches:
+        if patch.op == "remove":
+            fragments = [f for f in fragments if f[0] != patch.block_id]
+        elif patch.op in ("insert", "move"):
+            if patch.op == "insert":
+                entry = (patch.block_id, patch.html)
+            else:
+                entry = next(f for f in fragments if f[0] == patch.block_id)
+                fragments.remove(entry)
+            ids = [f[0] for f in fragments]
+            position = 0 if patch.after is None else ids.index(patch.after) + 1
+            fragments.insert(position, entry)
+        else:
+            fragments = [
+                (f[0], patch.html) if f[0] == patch.block_id else f
+                for f in fragments
+            ]
+    return fragments
+
+
+def _expected(blocks):
+    return [(block.id, _convert_block_to_html(block)) for block in blocks]
+
+
+def test_first_render_inserts_everything():
+    """Test that the first revision is rendered in full."""
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(3)]
+    result = IncrementalRenderer().render(blocks)
+    assert result.html == blocks_to_html(blocks)
+    assert result.rendered == 3
+    assert [patch.op for patch in result.patches] == ["insert"] * 3
+
+
+def test_unchanged_revision_renders_nothing():
+    """Test that re-rendering the same blocks reuses every fragment."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(3)]
+    renderer.render(blocks)
+    result = renderer.render(blocks)
+    assert result.html == blocks_to_html(blocks)
+    assert result.patches == []
+    assert result.rendered == 0
+
+
+def test_in_place_edit_is_replaced():
+    """Test that a block mutated in place is detected and re-rendered."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(3)]
+    renderer.render(blocks)
+    blocks[1].content[0].text = "Edited"
+    result = renderer.render(blocks)
+    assert result.patches == [
+        FragmentPatch("replace", "1", html="<p>Edited</p>")
+    ]
+    assert result.rendered == 1
+
+
+def test_child_edit_replaces_top_level_block():
+    """Test that edits inside children re-render their top-level block."""
+    renderer = IncrementalRenderer()
+    blocks = [
+        Block(
+            id="list",
+            type="bulletListItem",
+            children=[_paragraph("a", "One"), _paragraph("b", "Two")],
+        )
+    ]
+    renderer.render(blocks)
+    blocks[0].children[1].content[0].text = "Three"
+    result = renderer.render(blocks)
+    assert [patch.op for patch in result.patches] == ["replace"]
+    assert "Three" in result.html
+
+
+def test_changed_hint_skips_comparison():
+    """Test that only blocks listed in changed are compared and re-rendered."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(3)]
+    renderer.render(blocks)
+    blocks[0].content[0].text = "Not reported"
+    blocks[2].content[0].text = "Reported"
+    blocks.append(_paragraph("3", "New"))
+
+    result = renderer.render(blocks, changed=["2"])
+    assert result.rendered == 2
+    assert [patch.op for patch in result.patches] == ["insert", "replace"]
+    assert "Not reported" not in result.html
+    assert "Reported" in result.html
+
+    # Without the hint the stale block is detected.
+    assert "Not reported" in renderer.render(blocks).html
+
+
+def test_move_is_reported_once():
+    """Test that moving one block yields a single move patch."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(5)]
+    renderer.render(blocks)
+    blocks.insert(0, blocks.pop(3))
+    result = renderer.render(blocks)
+    assert result.patches == [FragmentPatch("move", "3", None)]
+    assert result.rendered == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_patches_reproduce_new_revision(seed):
+    """Test random edits: patches turn the old fragments into the new."""
+    rng = random.Random(seed)
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph(str(i), f"Text {i}") for i in range(20)]
+    fragments = _apply([], renderer.render(blocks).patches)
+    next_id = 20
+
+    for _ in range(5):
+        for _ in range(rng.randint(1, 6)):
+            action = rng.choice(["insert", "remove", "move", "edit"])
+            if action == "insert" or not blocks:
+                blocks.insert(
+                    rng.randint(0, len(blocks)),
+                    _paragraph(str(next_id), f"New {next_id}"),
+                )
+                next_id += 1
+            elif action == "remove":
+                blocks.pop(rng.randrange(len(blocks)))
+            elif action == "move":
+                block = blocks.pop(rng.randrange(len(blocks)))
+                blocks.insert(rng.randint(0, len(blocks)), block)
+            else:
+                block = rng.choice(blocks)
+                block.content[0].text += " edited"
+
+        result = renderer.render(blocks)
+        fragments = _apply(fragments, result.patches)
+        assert fragments == _expected(blocks)
+        assert result.html == blocks_to_html(blocks)
+
+
+def test_empty_fragments_match_blocks_to_html():
+    """Test that blocks rendering to empty strings are skipped in html."""
+    blocks = [_paragraph("a", "A"), _paragraph("b", ""), _paragraph("c", "C")]
+    previous = register_html_renderer(
+        "paragraph", lambda block: _extract_content_html(block.content)
+    )
+    try:
+        result = IncrementalRenderer().render(blocks)
+    finally:
+        register_html_renderer("paragraph", previous)
+    assert result.html == "A\nC"
+    assert result.patches[1] == FragmentPatch("insert", "b", "a", "")
+
+
+def test_reset_forces_full_render():
+    """Test that reset() forgets the previous revision."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph("a", "A")]
+    renderer.render(blocks)
+    renderer.reset()
+    assert renderer.render(blocks).rendered == 1
+
+
+def test_invalid_input_keeps_previous_state():
+    """Test errors for bad input and that a failed render changes nothing."""
+    renderer = IncrementalRenderer()
+    blocks = [_paragraph("a", "A")]
+    renderer.render(blocks)
+    with pytest.raises(TypeError, match="list of Block objects"):
+        renderer.render("not a list")
+    with pytest.raises(ValueError, match="index 1"):
+        renderer.render([_paragraph("b", "B"), "not a block"])
+    with pytest.raises(ValueError, match="Duplicate block id 'a'"):
+        renderer.render([_paragraph("a", "A"), _paragraph("a", "B")])
+    assert renderer.render(blocks).patches == []
+
+
+@pytest.mark.parametrize(
+    "values,length",
+    [([], 0), ([3], 1), ([0, 1, 2], 3), ([2, 1, 0], 1), ([3, 0, 1, 4, 2], 3)],
+)
+def test_longest_increasing_subsequence(values, length):
+    """Test that the subsequence is increasing and of maximal length."""
+    indices = longest_increasing_subsequence(values)
+    assert len(indices) == length
+    picked = [values[i] for i in indices]
+    assert picked == sorted(set(picked))
@@ -0,0 +1,121 @@
+import pytest
+from blocknote.converter.html_to_blocknote import html_to_blocks
+from blocknote.converter.inline_runs import RunStats, normalize_runs
+from blocknote.converter.md_to_blocknote import (
+    MarkdownConverter,
+    markdown_to_blocks,
+)
+from blocknote.schema import Block, InlineContent
+
+
+def _run(text, **styles):
+    return InlineContent(type="text", text=text, styles=styles)
+
+
+def _texts(block):
+    return [(run.text, run.styles) for run in block.content]
+
+
+def test_normalize_runs_merges_and_drops():
+    """Test that equal-style neighbours merge and empty runs go."""
+    block = Block(
+        id="1",
+        type="paragraph",
+        content=[
+            _run("Hello"),
+            _run(", "),
+            _run(""),
+            _run("big", bold=True),
+            _run(" world", bold=True),
+            _run("!"),
+        ],
+    )
+    stats = normalize_runs([block])
+    assert stats == RunStats(merged=2, dropped=1, remaining=3)
+    assert stats.removed == 3
+    assert _texts(block) == [
+        ("Hello, ", {}),
+        ("big world", {"bold": True}),
+        ("!", {}),
+    ]
+
+
+def test_normalize_runs_keeps_distinct_style_values():
+    """Test that values comparing equal but of other classes are kept."""
+    content = [_run("a", bold=True), _run("b", bold=1), _run("c", bold=1)]
+    block = Block(id="1", type="paragraph", content=content)
+    assert normalize_runs([block]) == RunStats(1, 0, 2)
+    assert [run.text for run in block.content] == ["a", "bc"]
+
+
+def test_normalize_runs_unchanged_content_is_kept():
+    """Test that content without mergeable runs is left untouched."""
+    content = [_run("a"), _run("b", italic=True)]
+    block = Block(id="1", type="paragraph", content=content)
+    original = block.content
+    assert normalize_runs([block]) == RunStats(0, 0, 2)
+    assert block.content is original
+
+
+def test_normalize_runs_does_not_mutate_runs():
+    """Test that merged runs are new objects."""
+    first = _run("a")
+    block = Block(id="1", type="paragraph", content=[first, _run("b")])
+    normalize_runs([block])
+    assert first.text == "a"
+    assert block.content[0].text == "ab"
+
+
+def test_normalize_runs_children():
+    """Test that nested blocks are normalized too."""
+    child = Block(id="2", type="paragraph", content=[_run("x"), _run("y")])
+    parent = Block(
+        id="1", type="bulletListItem", content=[_run("")], children=[child]
+    )
+    assert normalize_runs([parent]) == RunStats(1, 1, 1)
+    assert parent.content == []
+    assert _texts(child) == [("xy", {})]
+
+
+@pytest.mark.parametrize(
+    "invalid_input,expected_error",
+    [
+        ("not a list", "Input must be a list of Block objects"),
+        ([{"id": "1"}], "Item at index 0 must be a Block object"),
+    ],
+)
+def test_normalize_runs_validation_errors(invalid_input, expected_error):
+    """Test that invalid input raises TypeError."""
+    with pytest.raises(TypeError, match=expected_error):
+        normalize_runs(invalid_input)
+
+
+def test_html_to_blocks_merges_runs_by_default():
+    """Test that runs split by the HTML parser are merged."""
+    html = "<p>one<!-- x -->two <b>three</b><b> four</b></p>"
+    assert _texts(html_to_blocks(html)[0]) == [
+        ("onetwo ", {}),
+        ("three four", {"bold": True}),
+    ]
+    unmerged = html_to_blocks(html, merge_runs=False)
+    assert len(unmerged[0].content) == 4
+    assert normalize_runs(unmerged) == RunStats(2, 0, 2)
+
+
+def test_markdown_to_blocks_merges_runs_by_default():
+    """Test that runs split by Markdown tokens are merged."""
+    markdown = "Use `code` here, *not* there"
+    assert _texts(markdown_to_blocks(markdown)[0]) == [
+        ("Use code here, ", {}),
+        ("not", {"italic": True}),
+        (" there", {}),
+    ]
+    unmerged = markdown_to_blocks(markdown, merge_runs=False)
+    assert normalize_runs(unmerged) == RunStats(2, 0, 3)
+
+
+def test_markdown_converter_merge_runs_setting():
+    """Test the converter default and the per-call override."""
+    converter = MarkdownConverter(merge_runs=False)
+    assert len(converter.convert("a `b` c")[0].content) == 3
+    assert len(converter.convert("a `b` c", merge_runs=True)[0].content) == 1
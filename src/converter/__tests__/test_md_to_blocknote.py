@@ -1,5 +1,16 @@
+import io
+import random
+import time
+
 import pytest
-from blocknote.converter.md_to_blocknote import markdown_to_blocks
+from blocknote.converter.block_ids import counter_ids
+from blocknote.converter.md_to_blocknote import (
+    MarkdownConverter,
+    _iter_lines,
+    _split_sections,
+    iter_markdown_blocks,
+    markdown_to_blocks,
+)
 
 
 @pytest.fixture
@@ -115,3 +126,218 @@ def test_markdown_to_blocks_unique_ids(sample_markdown):
     blocks = markdown_to_blocks(sample_markdown)
     ids = [block.id for block in blocks]
     assert len(ids) == len(set(ids))
+
+
+def test_markdown_converter_reuse(sample_markdown):
+    """Test that a converter can be reused across calls and threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    converter = MarkdownConverter()
+    expected = [b.type for b in markdown_to_blocks(sample_markdown)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(converter.convert, [sample_markdown] * 16)
+        )
+
+    for blocks in results:
+        assert [b.type for b in blocks] == expected
+
+
+def test_markdown_converter_options_and_plugins():
+    """Test that presets, options and plugins configure the parser."""
+    applied = []
+
+    def plugin(md):
+        applied.append(md)
+
+    converter = MarkdownConverter(
+        "commonmark", options={"typographer": True}, plugins=[plugin]
+    )
+
+    assert applied == [converter.parser]
+    assert converter.parser.options["typographer"] is True
+    assert converter.convert("") == []
+    with pytest.raises(TypeError, match="Input must be a string"):
+        converter.convert(123)
+
+
+def test_markdown_to_blocks_id_factory(complex_markdown):
+    """Test that a deterministic ID factory gives reproducible IDs."""
+    from blocknote.converter.block_ids import content_hash_ids, counter_ids
+
+    blocks = markdown_to_blocks(complex_markdown, id_factory=counter_ids())
+    assert [b.id for b in blocks] == [str(i + 1) for i in range(len(blocks))]
+
+    factory = content_hash_ids()
+    first = markdown_to_blocks(complex_markdown, id_factory=factory)
+    second = MarkdownConverter(id_factory=factory).convert(complex_markdown)
+    assert first == second
+
+
+_STREAM_MARKDOWN = """# Title *one*
+
+A paragraph with **bold** text
+over two lines.
+
+- item
+- loose item
+
+  continued
+1. numbered
+
+> quote
+>
+> more quote
+
+>
+
+Right after an empty quote.
+
+```python
+code
+
+not a new section
+```
+
+<!-- comment
+
+still a comment -->
+
+    indented code
+
+    more code
+
+See [the docs] and [missing].
+
+[the docs]: https://example.com "Docs"
+Setext heading
+==============
+"""
+
+# Lines of the constructs that decide where a document may be split.
+_LINES = [
+    "# Heading *em*", "para **bold** text", "", "", "", "- item",
+    "  continued", "1. one", "> quote", ">", "```", "~~~",
+    "    indented code", "<!-- c", "-->", "<script>", "</script>",
+    "[ref]: /url", "see [ref]", "---", "===", "text\r", " - sub",
+    "   ```", "<?php", "?>", "- ```", "  code", "+ plus",
+]
+
+
+def _split(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 64, 10_000])
+def test_iter_markdown_blocks_matches_markdown_to_blocks(size):
+    """Test that every chunking yields the blocks of the batch parser."""
+    expected = markdown_to_blocks(_STREAM_MARKDOWN, id_factory=counter_ids())
+    blocks = iter_markdown_blocks(
+        _split(_STREAM_MARKDOWN, size), counter_ids(), chunk_size=size
+    )
+    assert list(blocks) == expected
+
+
+def test_iter_markdown_blocks_random_documents():
+    """Test random mixes of fences, lists, quotes and HTML blocks."""
+    rng = random.Random(0)
+    for _ in range(300):
+        lines = [rng.choice(_LINES) for _ in range(rng.randint(1, 20))]
+        text = "\n".join(lines) + rng.choice(["", "\n", "\r\n"])
+        expected = markdown_to_blocks(text, id_factory=counter_ids())
+        blocks = iter_markdown_blocks(
+            _split(text, 3), counter_ids(), chunk_size=1
+        )
+        assert list(blocks) == expected, text
+
+
+def test_iter_markdown_blocks_file_object():
+    """Test reading a seekable file object from its current position."""
+    fp = io.StringIO("ignored\n" + _STREAM_MARKDOWN)
+    fp.readline()
+    expected = markdown_to_blocks(_STREAM_MARKDOWN, id_factory=counter_ids())
+    blocks = iter_markdown_blocks(fp, id_factory=counter_ids(), chunk_size=4)
+    assert list(blocks) == expected
+
+
+def test_iter_markdown_blocks_forward_reference():
+    """Test that a definition at the end applies to earlier sections."""
+    text = "[link]\n\n" + "Filler.\n\n" * 50 + "[link]: /url\n"
+    expected = markdown_to_blocks(text, id_factory=counter_ids())
+    assert expected[0].content[0].text == "link"
+    for source in (io.StringIO(text), iter(_split(text, 8))):
+        blocks = iter_markdown_blocks(source, counter_ids(), chunk_size=8)
+        assert list(blocks) == expected
+
+
+def test_iter_markdown_blocks_is_lazy():
+    """Test that sections are yielded before the file has been read."""
+
+    class CountingReader(io.StringIO):
+        consumed = 0
+
+        def read(self, size=-1):
+            text = super().read(size)
+            self.consumed += len(text)
+            return text
+
+    text = "".join(f"Paragraph {i}.\n\n" for i in range(1_000))
+    fp = CountingReader(text)
+    blocks = iter_markdown_blocks(fp, chunk_size=100)
+    assert next(blocks).content[0].text == "Paragraph 0."
+    # The first read scans for reference definitions, the second parses.
+    assert fp.consumed - len(text) < 500
+    assert sum(1 for _ in blocks) == 999
+
+
+def test_split_sections_only_at_top_level_boundaries():
+    """Test that sections end only before a new top-level block."""
+    converter = MarkdownConverter()
+    text = "```\na\n\nb\n```\n\n- x\n\n- y\n\nz\n\n> q\n\nw\n"
+    sections = _split_sections(
+        _iter_lines([text]), converter._parser({}), min_size=0
+    )
+    starts = [tokens[0].type for tokens in sections]
+    # Not before list markers, which may continue a loose list.
+    assert starts == [
+        "fence",
+        "paragraph_open",
+        "blockquote_open",
+        "paragraph_open",
+    ]
+
+
+def test_iter_markdown_blocks_reference_definitions_split():
+    """Test that definitions, which start no token, still end sections."""
+    text = "para\n\n" + "".join(f"[r{i}]: /u{i}\n\n" for i in range(2_000))
+    text += "[r1999] end\n"
+    converter = MarkdownConverter()
+    sections = _split_sections(
+        _iter_lines([text]), converter._parser({}), min_size=0
+    )
+    assert sum(1 for _ in sections) == 2_002
+
+    start = time.perf_counter()
+    expected = markdown_to_blocks(text, id_factory=counter_ids())
+    batch = time.perf_counter() - start
+    start = time.perf_counter()
+    blocks = list(iter_markdown_blocks(text, counter_ids(), chunk_size=64))
+    streamed = time.perf_counter() - start
+    assert blocks == expected
+    # Re-parsing the whole buffer at each candidate took minutes here.
+    assert streamed < 20 * batch + 1
+
+
+def test_iter_markdown_blocks_empty():
+    """Test that empty and whitespace-only sources yield no blocks."""
+    assert list(iter_markdown_blocks([])) == []
+    assert list(iter_markdown_blocks(io.StringIO(" \n\n"))) == []
+
+
+def test_iter_markdown_blocks_invalid_source():
+    """Test that bad sources fail before iteration starts."""
+    with pytest.raises(TypeError, match="file object or an iterable"):
+        iter_markdown_blocks(42)
+    with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+        iter_markdown_blocks(io.StringIO("# x"), chunk_size=0)
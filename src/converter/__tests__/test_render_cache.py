@@ -0,0 +1,214 @@
+import pytest
+from blocknote.converter.blocknote_to_html import (
+    blocks_to_html,
+    register_html_renderer,
+)
+from blocknote.converter.blocknote_to_md import blocks_to_markdown
+from blocknote.converter.render_cache import (
+    CacheBackend,
+    CacheStats,
+    RenderCache,
+    SqliteCacheBackend,
+)
+from blocknote.schema import Block, InlineContent
+
+
+def _paragraph(block_id, text, **styles):
+    return Block(
+        id=block_id,
+        type="paragraph",
+        content=[InlineContent(type="text", text=text, styles=styles)],
+    )
+
+
+def _document():
+    return [
+        Block(
+            id="h",
+            type="heading",
+            props={"level": 2},
+            content=[InlineContent(type="text", text="Title")],
+        ),
+        _paragraph("p1", "First", bold=True),
+        _paragraph("p2", "Second"),
+        Block(
+            id="l",
+            type="bulletListItem",
+            children=[_paragraph("c1", "One"), _paragraph("c2", "Two")],
+        ),
+    ]
+
+
+class DictBackend(CacheBackend):
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def clear(self):
+        self.data.clear()
+
+
+def test_cached_output_matches_uncached():
+    """Test that cached rendering produces identical HTML and Markdown."""
+    cache = RenderCache()
+    blocks = _document()
+    for _ in range(2):
+        assert blocks_to_html(blocks, cache=cache) == blocks_to_html(blocks)
+        assert blocks_to_markdown(blocks, cache=cache) == blocks_to_markdown(
+            blocks
+        )
+
+
+def test_hit_and_miss_counters():
+    """Test that the second render is served entirely from the cache."""
+    cache = RenderCache()
+    blocks = _document()
+    blocks_to_html(blocks, cache=cache)
+    assert cache.stats() == CacheStats(
+        hits=0, misses=4, evictions=0, entries=4, chars=cache.stats().chars
+    )
+    blocks_to_html(blocks, cache=cache)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (4, 4)
+
+
+def test_keys_ignore_block_ids():
+    """Test that an unchanged block under a new ID still hits the cache."""
+    cache = RenderCache()
+    blocks_to_html([_paragraph("a", "Same")], cache=cache)
+    blocks_to_html([_paragraph("b", "Same")], cache=cache)
+    assert cache.hits == 1
+
+
+def test_edit_misses_only_changed_block():
+    """Test that editing one block re-renders only that block."""
+    cache = RenderCache()
+    blocks = _document()
+    blocks_to_html(blocks, cache=cache)
+    blocks[3].children[1].content[0].text = "Changed"
+    html = blocks_to_html(blocks, cache=cache)
+    assert "Changed" in html
+    assert (cache.hits, cache.misses) == (3, 5)
+
+
+def test_formats_use_separate_keys():
+    """Test that HTML and Markdown fragments do not collide."""
+    cache = RenderCache()
+    blocks = [_paragraph("p", "Text", bold=True)]
+    assert blocks_to_html(blocks, cache=cache) == "<p><strong>Text</strong></p>"
+    assert blocks_to_markdown(blocks, cache=cache) == "**Text**"
+    assert cache.misses == 2
+
+
+def test_entry_bound_evicts_least_recently_used():
+    """Test LRU eviction by entry count."""
+    cache = RenderCache(max_entries=2)
+    a, b, c = (_paragraph(x, x) for x in "abc")
+    blocks_to_html([a, b], cache=cache)
+    blocks_to_html([a], cache=cache)  # b is now least recently used
+    blocks_to_html([c], cache=cache)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    blocks_to_html([a], cache=cache)
+    assert cache.hits == 2
+
+
+def test_size_bound():
+    """Test that the total fragment length stays within max_chars."""
+    cache = RenderCache(max_chars=30)
+    blocks_to_html(
+        [_paragraph(str(i), f"Paragraph {i}") for i in range(5)], cache=cache
+    )
+    assert cache.stats().chars <= 30
+    assert cache.evictions > 0
+
+    blocks_to_html([_paragraph("x", "x" * 100)], cache=cache)
+    assert cache.stats().chars <= 30
+
+
+def test_clear_resets_entries_and_counters():
+    """Test that clear() drops fragments after a renderer change."""
+    cache = RenderCache()
+    blocks = [_paragraph("p", "Text")]
+    blocks_to_html(blocks, cache=cache)
+
+    previous = register_html_renderer("paragraph", lambda block: "<p>new</p>")
+    try:
+        assert blocks_to_html(blocks, cache=cache) == "<p>Text</p>"
+        cache.clear()
+        assert cache.stats() == CacheStats(0, 0, 0, 0, 0)
+        assert blocks_to_html(blocks, cache=cache) == "<p>new</p>"
+    finally:
+        register_html_renderer("paragraph", previous)
+
+
+@pytest.mark.parametrize("kind", ["dict", "sqlite"])
+def test_backend_serves_memory_misses(kind, tmp_path):
+    """Test that a second cache sharing the backend hits on first render."""
+    if kind == "sqlite":
+        backend = SqliteCacheBackend(str(tmp_path / "fragments.db"))
+    else:
+        backend = DictBackend()
+    blocks = _document()
+    expected = blocks_to_html(blocks)
+
+    blocks_to_html(blocks, cache=RenderCache(backend=backend))
+    warm = RenderCache(backend=backend)
+    assert blocks_to_html(blocks, cache=warm) == expected
+    assert (warm.hits, warm.misses) == (4, 0)
+    backend.close()
+
+
+def test_invalid_bounds():
+    """Test that non-positive bounds are rejected."""
+    with pytest.raises(ValueError, match="max_entries"):
+        RenderCache(max_entries=0)
+    with pytest.raises(ValueError, match="max_chars"):
+        RenderCache(max_chars=0)
+
+
+def test_include_ids_for_renderers_that_emit_ids():
+    """Test that IDs are only part of the key with include_ids."""
+    blocks = [_paragraph("a", "Same"), _paragraph("b", "Same")]
+    previous = register_html_renderer(
+        "paragraph", lambda block: f'<p id="{block.id}"></p>'
+    )
+    try:
+        shared = blocks_to_html(blocks, cache=RenderCache())
+        assert shared == '<p id="a"></p>\n<p id="a"></p>'
+
+        backend = DictBackend()
+        cache = RenderCache(backend=backend, include_ids=True)
+        expected = '<p id="a"></p>\n<p id="b"></p>'
+        assert blocks_to_html(blocks, cache=cache) == expected
+        assert blocks_to_html(blocks, cache=cache) == expected
+        assert cache.stats().hits == 2
+        assert len(backend.data) == 2
+    finally:
+        register_html_renderer("paragraph", previous)
+
+
+def test_include_ids_covers_children():
+    """Test that child IDs are part of the key with include_ids."""
+    cache = RenderCache(include_ids=True)
+    first = Block(id="l", type="bulletListItem", children=[_paragraph("x", "")])
+    second = Block(id="l", type="bulletListItem", children=[_paragraph("y", "")])
+    blocks_to_html([first], cache=cache)
+    blocks_to_html([second], cache=cache)
+    assert cache.stats().misses == 2
+
+
+def test_incomplete_backend_fails_on_instantiation():
+    """Test that a backend must implement get and set."""
+
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        GetOnly()
@@ -0,0 +1,297 @@
+"""
+Diff and patch of Block trees, keyed by block ID.
+
+``diff_blocks(old, new)`` returns a list of ``Op`` tuples that
+``apply_patch`` replays to turn ``old`` into ``new``. Ops are
+NamedTuples of JSON-compatible values, so ``json.dumps(ops)`` stores each
+one as a short array such as ``["text", "p1", null, null, [0, 6, 5, "x"]]``
+and ``apply_patch`` accepts the decoded lists directly.
+
+Blocks are matched by ``id`` across the whole tree, so a block that
+changes parent is a move rather than a removal and an insertion. Within a
+list of siblings, the blocks that stay are one longest increasing
+subsequence of their old positions, found in O(n log n); only the others
+are reported as moves. Text edits within a run of inline content become
+splices instead of a copy of the whole content.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from blocknote.schema import Block
+
+from .dict_to_blocknote import dict_to_blocks
+from .traversal import (
+    block_position,
+    longest_increasing_subsequence,
+    update_block_fields,
+)
+
+
+class Op(NamedTuple):
+    """
+    One step of a patch.
+
+    ``op`` is one of:
+
+    - ``"insert"``: insert the block dict ``value`` (with its children)
+      under ``parent`` (None for the top level), right after the sibling
+      ``after`` (at the start when None)
+    - ``"move"``: move block ``id`` and its children under ``parent``,
+      right after ``after``
+    - ``"remove"``: remove block ``id`` and its children
+    - ``"update"``: set the fields in ``value`` (``type``, ``props`` and/or
+      ``content``) of block ``id``
+    - ``"text"``: splice the text of an inline content run; ``value`` is
+      ``[run, start, deleted, inserted]``
+    """
+
+    op: str
+    id: str
+    parent: Optional[str] = None
+    after: Optional[str] = None
+    value: Any = None
+
+
+def diff_blocks(old: List[Block], new: List[Block]) -> List[Op]:
+    """
+    Computes the ops that turn one revision of a document into another.
+
+    Args:
+        old: Previous revision
+        new: Current revision
+
+    Returns:
+        List of Op, to be applied in order with ``apply_patch``
+
+    Raises:
+        TypeError: If an input is not a list or contains non-Block objects
+        ValueError: If a block ID appears twice in one revision
+
+    Example:
+        >>> ops = diff_blocks(old, new)
+        >>> payload = json.dumps(ops)
+        >>> apply_patch(old, json.loads(payload)) == new
+        True
+    """
+    old_index = _index(old, "old")
+    new_index = _index(new, "new")
+    ops: List[Op] = []
+
+    # Blocks whose subtree contains a block from ``old`` cannot be
+    # inserted whole; their children are matched individually.
+    keeps_old = set()
+    for block_id in reversed(list(new_index)):
+        block, parent_id, _ = new_index[block_id]
+        if block_id in old_index or block_id in keeps_old:
+            if parent_id is not None:
+                keeps_old.add(parent_id)
+
+    # Inserts, moves and updates, parents before children.
+    pending: List[Tuple[Optional[str], List[Block]]] = [(None, new)]
+    while pending:
+        parent_id, children = pending.pop()
+        kept = [
+            child.id
+            for child in children
+            if child.id in old_index and old_index[child.id][1] == parent_id
+        ]
+        positions = [old_index[block_id][2] for block_id in kept]
+        if all(a < b for a, b in zip(positions, positions[1:])):
+            stable = set(kept)  # nothing moved, the common case
+        else:
+            stable = {
+                kept[i] for i in longest_increasing_subsequence(positions)
+            }
+
+        after = None
+        for child in children:
+            block_id = child.id
+            if block_id not in old_index:
+                if block_id in keeps_old:
+                    value = child.model_dump(exclude={"children"})
+                    ops.append(Op("insert", block_id, parent_id, after, value))
+                    pending.append((block_id, child.children))
+                else:
+                    value = _dump_tree(child)
+                    ops.append(Op("insert", block_id, parent_id, after, value))
+            else:
+                if block_id not in stable:
+                    ops.append(Op("move", block_id, parent_id, after))
+                _diff_fields(old_index[block_id][0], child, ops)
+                if child.children:
+                    pending.append((block_id, child.children))
+            after = block_id
+
+    # Removals last, so that surviving children have been moved out.
+    for block_id, (_, parent_id, _) in old_index.items():
+        if block_id not in new_index and (
+            parent_id is None or parent_id in new_index
+        ):
+            ops.append(Op("remove", block_id))
+    return ops
+
+
+def apply_patch(blocks: List[Block], ops: List[Any]) -> List[Block]:
+    """
+    Applies ops from ``diff_blocks`` to a list of blocks, in place.
+
+    Args:
+        blocks: Revision the ops were computed from; it is modified
+        ops: Op tuples, or the lists obtained by decoding them from JSON
+
+    Returns:
+        ``blocks``, now equal to the revision the ops were computed to
+
+    Raises:
+        TypeError: If blocks is not a list or contains non-Block objects
+        ValueError: If an op is malformed or refers to an unknown block
+    """
+    index: Dict[str, Tuple[Block, Optional[str]]] = {
+        block_id: (block, parent_id)
+        for block_id, (block, parent_id, _) in _index(blocks, "input").items()
+    }
+
+    def siblings(parent_id: Optional[str]) -> List[Block]:
+        return blocks if parent_id is None else index[parent_id][0].children
+
+    def place(block: Block, parent_id: Optional[str], after: Optional[str]):
+        target = siblings(parent_id)
+        position = 0
+        if after is not None:
+            position = block_position(target, index[after][0]) + 1
+        target.insert(position, block)
+
+    for i, raw in enumerate(ops):
+        try:
+            op = raw if isinstance(raw, Op) else Op(*raw)
+            if op.op == "insert":
+                block = dict_to_blocks([op.value])[0]
+                place(block, op.parent, op.after)
+                for block_id, entry in _index([block], "insert").items():
+                    if block_id in index:
+                        raise ValueError(f"Duplicate block id {block_id!r}")
+                    parent_id = op.parent if block_id == block.id else entry[1]
+                    index[block_id] = (entry[0], parent_id)
+            elif op.op == "move":
+                block, parent_id = index[op.id]
+                source = siblings(parent_id)
+                del source[block_position(source, block)]
+                place(block, op.parent, op.after)
+                index[op.id] = (block, op.parent)
+            elif op.op == "remove":
+                block, parent_id = index[op.id]
+                source = siblings(parent_id)
+                del source[block_position(source, block)]
+                for block_id in _index([block], "remove"):
+                    del index[block_id]
+            elif op.op == "update":
+                update_block_fields(index[op.id][0], op.value)
+            elif op.op == "text":
+                run, start, deleted, inserted = op.value
+                content = index[op.id][0].content
+                if isinstance(content, str):
+                    raise ValueError(f"block {op.id!r} has no content runs")
+                item = content[run]
+                text = item.text
+                item.text = text[:start] + inserted + text[start + deleted :]
+            else:
+                raise ValueError(f"unknown op {op.op!r}")
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Failed to apply op at index {i}: {e!r}")
+    return blocks
+
+
+def _index(
+    blocks: List[Block], name: str
+) -> Dict[str, Tuple[Block, Optional[str], int]]:
+    """
+    Map every block ID to (block, parent ID, position).
+
+    Sibling lists are walked with an explicit stack, so every block is
+    indexed after its parent.
+    """
+    if not isinstance(blocks, list):
+        raise TypeError(f"The {name} blocks must be a list of Block objects")
+
+    index: Dict[str, Tuple[Block, Optional[str], int]] = {}
+    stack: List[Tuple[List[Block], Optional[str]]] = [(blocks, None)]
+    while stack:
+        siblings, parent_id = stack.pop()
+        for position, block in enumerate(siblings):
+            if not isinstance(block, Block):
+                raise TypeError(
+                    f"Item at index {position} of the {name} blocks must be "
+                    f"a Block object, got {type(block)}"
+                )
+            block_id = block.id
+            if block_id in index:
+                raise ValueError(f"Duplicate block id {block_id!r}")
+            index[block_id] = (block, parent_id, position)
+            if block.children:
+                stack.append((block.children, block_id))
+    return index
+
+
+def _diff_fields(old: Block, new: Block, ops: List[Op]) -> None:
+    """Append update or text ops for a block present in both revisions."""
+    changed: Dict[str, Any] = {}
+    if old.type != new.type:
+        changed["type"] = new.type
+    if old.props != new.props:
+        changed["props"] = new.props
+
+    old_content, new_content = old.content, new.content
+    splices = []
+    if isinstance(old_content, str) or isinstance(new_content, str):
+        if old_content != new_content:
+            changed["content"] = _dump_content(new_content)
+    elif len(old_content) != len(new_content):
+        changed["content"] = _dump_content(new_content)
+    else:
+        for run, (a, b) in enumerate(zip(old_content, new_content)):
+            if a.styles != b.styles or a.type != b.type:
+                changed["content"] = _dump_content(new_content)
+                break
+            if a.text != b.text:
+                splices.append([run, *_splice(a.text, b.text)])
+
+    if changed:
+        ops.append(Op("update", new.id, value=changed))
+        if "content" in changed:
+            return
+    for splice in splices:
+        ops.append(Op("text", new.id, value=splice))
+
+
+def _splice(old: str, new: str) -> Tuple[int, int, str]:
+    """(start, deleted, inserted) replacing the middle of ``old``."""
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    return start, len(old) - start - end, new[start : len(new) - end]
+
+
+def _dump_tree(block: Block) -> Dict[str, Any]:
+    """``block.model_dump()`` with an explicit stack, for deep subtrees."""
+    root = block.model_dump(exclude={"children"})
+    root["children"] = []
+    stack = [(block.children, root["children"])]
+    while stack:
+        children, target = stack.pop()
+        for child in children:
+            value = child.model_dump(exclude={"children"})
+            value["children"] = []
+            target.append(value)
+            if child.children:
+                stack.append((child.children, value["children"]))
+    return root
+
+
+def _dump_content(content) -> Any:
+    if isinstance(content, str):
+        return content
+    return [item.model_dump() for item in content]
@@ -0,0 +1,171 @@
+"""
+Block ID generators for the Markdown and HTML parsers.
+
+The functions below are configured once, e.g. ``counter_ids(prefix="doc-")``,
+and return an ID factory: a zero-argument callable that the parsers call
+once per conversion. The factory returns an ID generator, which is called
+for every new block with the block's type, props and inline content and
+returns the block ID.
+Generators that keep per-document state (counters, seen digests) therefore
+start fresh for every document.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+from blocknote.schema import InlineContent
+
+IdGenerator = Callable[[str, Dict[str, Any], List[InlineContent]], str]
+IdFactory = Callable[[], IdGenerator]
+
+
+def uuid4_ids() -> IdFactory:
+    """Random UUID4 strings; the parsers' default."""
+
+    def generate(block_type, props, content) -> str:
+        return str(uuid.uuid4())
+
+    def factory() -> IdGenerator:
+        return generate
+
+    return factory
+
+
+def counter_ids(prefix: str = "", start: int = 1) -> IdFactory:
+    """
+    Sequential IDs such as ``"1"``, ``"2"`` or ``"doc-1"``, ``"doc-2"``.
+
+    The counter restarts at ``start`` for every document, so identical
+    input always produces identical IDs.
+
+    Args:
+        prefix: String prepended to every counter value
+        start: First counter value of each document
+    """
+
+    def factory() -> IdGenerator:
+        next_value = start
+
+        def generate(block_type, props, content) -> str:
+            nonlocal next_value
+            value = next_value
+            next_value += 1
+            return f"{prefix}{value}"
+
+        return generate
+
+    return factory
+
+
+def uuid7_ids(batch_size: int = 256) -> IdFactory:
+    """
+    Time-ordered UUID7 strings with batched randomness.
+
+    Random bits are read from ``os.urandom`` once per ``batch_size`` IDs
+    instead of once per ID. IDs generated within the same millisecond use
+    the 12-bit ``rand_a`` field as a counter, so they sort in creation order.
+
+    Args:
+        batch_size: Number of IDs served from one read of random bytes
+    """
+    generator = _Uuid7Generator(batch_size)
+
+    def factory() -> IdGenerator:
+        return generator
+
+    return factory
+
+
+class _Uuid7Generator:
+    """
+    Process-wide UUID7 state shared by every document of a factory.
+
+    Parsers sharing a factory may run in several threads, so the random
+    buffer, timestamp and sequence are updated under a lock.
+    """
+
+    def __init__(self, batch_size: int):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self._random = b""
+        self._offset = 0
+        self._last_ms = -1
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, block_type, props, content) -> str:
+        with self._lock:
+            if self._offset >= len(self._random):
+                self._random = os.urandom(8 * self.batch_size)
+                self._offset = 0
+            rand_b = int.from_bytes(
+                self._random[self._offset : self._offset + 8], "big"
+            )
+            self._offset += 8
+
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = rand_b >> 53  # 11 random bits: headroom
+            else:
+                self._sequence += 1
+                if self._sequence > 0xFFF:
+                    # Counter exhausted: borrow the next millisecond.
+                    self._last_ms += 1
+                    self._sequence = 0
+            last_ms, sequence = self._last_ms, self._sequence
+
+        value = (
+            (last_ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | sequence << 64
+            | 0b10 << 62
+            | rand_b & 0x3FFF_FFFF_FFFF_FFFF
+        )
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def content_hash_ids(length: int = 16) -> IdFactory:
+    """
+    Deterministic IDs derived from each block's type, props and content.
+
+    Identical input always yields identical IDs, which keeps downstream
+    caches warm. Repeated identical blocks in one document get ``-2``,
+    ``-3``, ... suffixes so IDs stay unique.
+
+    Args:
+        length: Number of hex characters kept from the BLAKE2b digest
+    """
+
+    def factory() -> IdGenerator:
+        seen: Counter = Counter()
+
+        def generate(block_type, props, content) -> str:
+            payload = json.dumps(
+                [
+                    block_type,
+                    props,
+                    [[item.type, item.text, item.styles] for item in content],
+                ],
+                sort_keys=True,
+                separators=(",", ":"),
+                default=str,
+            )
+            digest = hashlib.blake2b(
+                payload.encode("utf-8"), digest_size=(length + 1) // 2
+            ).hexdigest()[:length]
+            seen[digest] += 1
+            count = seen[digest]
+            return digest if count == 1 else f"{digest}-{count}"
+
+        return generate
+
+    return factory
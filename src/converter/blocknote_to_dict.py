@@ -1,23 +1,36 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from blocknote.schema import Block, InlineContent
+from blocknote.schema.types import BLOCK_LIST_ADAPTER
+from pydantic_core import PydanticSerializationError
 
+from .traversal import check_depth, check_max_depth, depth_error
 
-def blocks_to_dict(blocks: List[Block]) -> List[Dict[str, Any]]:
+
+def blocks_to_dict(
+    blocks: List[Block], max_depth: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Converts a list of Block objects to a list of dictionaries.
 
+    Children are walked with an explicit stack, so arbitrarily deep trees
+    convert without hitting Python's recursion limit.
+
     Args:
         blocks: List of Block objects to convert
+        max_depth: Optional maximum nesting depth (top-level blocks are at
+            depth 1)
 
     Returns:
         List of dictionaries representing the blocks
 
     Raises:
         TypeError: If input is not a list or contains non-Block objects
+        ValueError: If blocks are nested deeper than max_depth
     """
     if not isinstance(blocks, list):
         raise TypeError("Input must be a list of Block objects")
+    check_max_depth(max_depth)
 
     result = []
     for i, block in enumerate(blocks):
@@ -26,35 +39,117 @@ def blocks_to_dict(blocks: List[Block]) -> List[Dict[str, Any]]:
                 f"Item at index {i} must be a Block object, got {type(block)}"
             )
 
-        result.append(_block_to_dict(block))
+        result.append(_block_to_dict(block, max_depth))
 
     return result
 
 
-def _block_to_dict(block: Block) -> Dict[str, Any]:
+def blocks_to_json(
+    blocks: List[Block], max_depth: Optional[int] = None
+) -> bytes:
     """
-    Convert a single Block object to a dictionary.
+    Serializes a list of Block objects to JSON bytes.
+
+    Serialization is done by pydantic-core, without building the
+    intermediate dictionaries that ``blocks_to_dict`` returns. Trees
+    nested deeper than pydantic-core's recursion limit (a few hundred
+    levels) are serialized block by block with an explicit stack instead.
+
+    Args:
+        blocks: List of Block objects to serialize
+        max_depth: Optional maximum nesting depth (top-level blocks are at
+            depth 1)
+
+    Returns:
+        UTF-8 encoded JSON array of the blocks
+
+    Raises:
+        TypeError: If input is not a list or contains non-Block objects
+        ValueError: If blocks are nested deeper than max_depth
+    """
+    if not isinstance(blocks, list):
+        raise TypeError("Input must be a list of Block objects")
+
+    for i, block in enumerate(blocks):
+        if not isinstance(block, Block):
+            raise TypeError(
+                f"Item at index {i} must be a Block object, got {type(block)}"
+            )
+
+    if max_depth is not None:
+        check_depth(blocks, max_depth)
+    return _dump_json(blocks)
+
+
+def _dump_json(blocks: List[Block]) -> bytes:
+    """``BLOCK_LIST_ADAPTER.dump_json`` that also handles deep trees."""
+    try:
+        return BLOCK_LIST_ADAPTER.dump_json(blocks)
+    except PydanticSerializationError as e:
+        if "depth exceeded" not in str(e):
+            raise
+
+    # Serialize each block without its children, then splice the children
+    # arrays in while walking the tree with a stack of iterators.
+    parts = [b"["]
+    stack = [(iter(blocks), b"]")]
+    first = True
+    while stack:
+        block = next(stack[-1][0], None)
+        if block is None:
+            parts.append(stack.pop()[1])
+            first = False
+            continue
+        if not first:
+            parts.append(b",")
+        shallow = block.model_dump_json(exclude={"children"}).encode()
+        parts.append(shallow[:-1] + b',"children":[')
+        stack.append((iter(block.children), b"]}"))
+        first = True
+    return b"".join(parts)
+
+
+def _block_to_dict(
+    block: Block, max_depth: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Convert a single Block object and its children to a dictionary.
 
     Args:
         block: The Block object to convert
+        max_depth: Optional maximum nesting depth, counting ``block`` as 1
 
     Returns:
         Dictionary representation of the block
     """
-    block_dict = {
+    root = _shallow_dict(block)
+    stack = []
+    if block.children:
+        stack.append((block.children, root["children"], 2))
+    while stack:
+        children, target, depth = stack.pop()
+        if max_depth is not None and depth > max_depth:
+            raise depth_error(max_depth)
+        for child in children:
+            child_dict = _shallow_dict(child)
+            target.append(child_dict)
+            if child.children:
+                stack.append(
+                    (child.children, child_dict["children"], depth + 1)
+                )
+    return root
+
+
+def _shallow_dict(block: Block) -> Dict[str, Any]:
+    """Dictionary of a block with an empty ``children`` list."""
+    return {
         "id": block.id,
         "type": block.type,
         "props": block.props if block.props else {},
         "content": _content_to_dict(block.content),
-        "children": (
-            [_block_to_dict(child) for child in block.children]
-            if block.children
-            else []
-        ),
+        "children": [],
     }
 
-    return block_dict
-
 
 def _content_to_dict(content) -> List[Dict[str, Any]]:
     """
@@ -1,14 +1,37 @@
-from typing import List
+import html
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
 
 from blocknote.schema import Block
 
+from .streaming import DEFAULT_CHUNK_SIZE, check_iterable, join_chunked
 
-def blocks_to_html(blocks: List[Block]) -> str:
+if TYPE_CHECKING:  # annotations only; caches are used by duck typing
+    from .render_cache import RenderCache
+
+HtmlRenderer = Callable[[Block], str]
+
+
+def blocks_to_html(
+    blocks: List[Block], cache: Optional["RenderCache"] = None
+) -> str:
     """
     Converts a list of Block objects to an HTML string.
 
     Args:
         blocks: List of validated Block objects to convert
+        cache: Optional RenderCache reusing the HTML of unchanged blocks
 
     Returns:
         An HTML string representation of the blocks
@@ -31,11 +54,71 @@ def blocks_to_html(blocks: List[Block]) -> str:
     if not isinstance(blocks, list):
         raise TypeError("Input must be a list of Block objects")
 
-    if not blocks:
-        return ""
+    return "\n".join(_iter_html_elements(blocks, cache))
+
+
+def iter_blocks_html(
+    blocks: Iterable[Block],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional["RenderCache"] = None,
+) -> Iterator[str]:
+    """
+    Renders blocks to HTML incrementally, yielding chunks of text.
+
+    Blocks are converted one at a time and buffered until at least
+    ``chunk_size`` characters are ready, so memory stays bounded by the
+    chunk size plus the largest block. Joining the chunks gives exactly
+    the output of ``blocks_to_html``. Suitable for ``StreamingResponse``.
+
+    Args:
+        blocks: List or any iterable of Block objects
+        chunk_size: Minimum number of characters per yielded chunk (the
+            final chunk may be shorter)
+        cache: Optional RenderCache reusing the HTML of unchanged blocks
+
+    Returns:
+        Iterator of HTML text chunks
+
+    Raises:
+        TypeError: If input is not iterable or contains non-Block objects
+        ValueError: If a block cannot be converted, or chunk_size < 1
+
+    Example:
+        >>> return StreamingResponse(
+        ...     iter_blocks_html(blocks), media_type="text/html"
+        ... )
+    """
+    elements = _iter_html_elements(check_iterable(blocks), cache)
+    return join_chunked(elements, "\n", chunk_size)
+
 
-    html_elements = []
+def write_blocks_html(
+    blocks: Iterable[Block],
+    fp: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional["RenderCache"] = None,
+) -> None:
+    """
+    Renders blocks to HTML and writes it incrementally to a text file.
+
+    Args:
+        blocks: List or any iterable of Block objects
+        fp: Writable text file object
+        chunk_size: Number of characters buffered between writes
+        cache: Optional RenderCache reusing the HTML of unchanged blocks
 
+    Raises:
+        TypeError: If input is not iterable or contains non-Block objects
+        ValueError: If a block cannot be converted, or chunk_size < 1
+    """
+    for chunk in iter_blocks_html(blocks, chunk_size, cache):
+        fp.write(chunk)
+
+
+def _iter_html_elements(
+    blocks: Iterable[Block], cache: Optional["RenderCache"] = None
+) -> Iterator[str]:
+    """Yield the HTML of each block that renders to a non-empty string."""
     for i, block in enumerate(blocks):
         try:
             if not isinstance(block, Block):
@@ -44,15 +127,56 @@ def blocks_to_html(blocks: List[Block]) -> str:
                     f"got {type(block)}"
                 )
 
-            html_element = _convert_block_to_html(block)
-            if html_element:
-                html_elements.append(html_element)
+            if cache is None:
+                html_element = _convert_block_to_html(block)
+            else:
+                html_element = cache.render(
+                    block, "html", _convert_block_to_html
+                )
         except Exception as e:
             raise ValueError(
                 f"Failed to convert block at index {i} to HTML: {e}"
             )
+        if html_element:
+            yield html_element
+
 
-    return "\n".join(html_elements)
+def register_html_renderer(
+    block_type: str, renderer: Optional[HtmlRenderer]
+) -> Optional[HtmlRenderer]:
+    """
+    Registers the HTML renderer used for a block type.
+
+    Built-in block types can be overridden, and new types (e.g. blocks
+    loaded with ``dict_to_blocks(..., trusted=True)``) can be added without
+    touching the converter. Blocks of unregistered types are rendered as
+    ``<div class="blocknote-{type}">``.
+
+    A ``RenderCache`` keys fragments by block content, not by renderer or
+    block ID: call its ``clear()`` after changing a renderer, and use
+    ``RenderCache(include_ids=True)`` if the renderer outputs block IDs.
+
+    Args:
+        block_type: Block type name or ``BlockType`` member
+        renderer: Callable taking a Block and returning its HTML, or
+            None to unregister the type
+
+    Returns:
+        The renderer previously registered for the type, or None; passing
+        it back restores the previous state, unregistering a new type
+
+    Example:
+        >>> register_html_renderer(
+        ...     "paragraph",
+        ...     lambda block: f"<p class='lead'>{block.content[0].text}</p>",
+        ... )
+    """
+    key = getattr(block_type, "value", block_type)
+    if renderer is None:
+        return _HTML_RENDERERS.pop(key, None)
+    previous = _HTML_RENDERERS.get(key)
+    _HTML_RENDERERS[key] = renderer
+    return previous
 
 
 def _convert_block_to_html(block: Block) -> str:
@@ -65,54 +189,70 @@ def _convert_block_to_html(block: Block) -> str:
     Returns:
         HTML string for the block
     """
-    block_type = block.type
+    renderer = _HTML_RENDERERS.get(block.type, _render_unknown_html)
+    return renderer(block)
+
+
+def _render_heading_html(block: Block) -> str:
     content = _extract_content_html(block.content)
+    level = block.props.get("level", 1)
+    if not isinstance(level, int) or level < 1 or level > 6:
+        level = 1
+    return f"<h{level}>{content}</h{level}>"
 
-    if block_type == "heading":
-        level = block.props.get("level", 1)
-        if not isinstance(level, int) or level < 1 or level > 6:
-            level = 1
-        return f"<h{level}>{content}</h{level}>"
 
-    elif block_type == "paragraph":
-        return f"<p>{content}</p>"
+def _render_paragraph_html(block: Block) -> str:
+    return f"<p>{_extract_content_html(block.content)}</p>"
 
-    elif block_type == "bulletListItem":
-        if not block.children:
-            return f"<ul><li>{content}</li></ul>"
-        child_items = []
-        for child in block.children:
-            if child.type == "paragraph":
-                child_content = _extract_content_html(child.content)
-                child_items.append(f"<li>{child_content}</li>")
-        return f"<ul>{''.join(child_items)}</ul>"
 
-    elif block_type == "numberedListItem":
+def _render_list_html(tag: str) -> HtmlRenderer:
+    def render(block: Block) -> str:
         if not block.children:
-            return f"<ol><li>{content}</li></ol>"
+            content = _extract_content_html(block.content)
+            return f"<{tag}><li>{content}</li></{tag}>"
         child_items = []
         for child in block.children:
             if child.type == "paragraph":
                 child_content = _extract_content_html(child.content)
                 child_items.append(f"<li>{child_content}</li>")
-        return f"<ol>{''.join(child_items)}</ol>"
-
-    elif block_type == "checkListItem":
-        checked = block.props.get("checked", False)
-        checkbox_state = "checked" if checked else ""
-        return (
-            "<div><input type=\"checkbox\" "
-            f"{checkbox_state} disabled> {content}</div>"
-        )
+        return f"<{tag}>{''.join(child_items)}</{tag}>"
 
-    elif block_type == "quote":
-        return f"<blockquote>{content}</blockquote>"
+    return render
 
-    elif block_type == "table":
-        return f"<div class='table-placeholder'>{content}</div>"
 
-    else:
-        return f'<div class="blocknote-{block_type}">{content}</div>'
+def _render_check_list_item_html(block: Block) -> str:
+    content = _extract_content_html(block.content)
+    checked = block.props.get("checked", False)
+    checkbox_state = "checked" if checked else ""
+    return (
+        "<div><input type=\"checkbox\" "
+        f"{checkbox_state} disabled> {content}</div>"
+    )
+
+
+def _render_quote_html(block: Block) -> str:
+    return f"<blockquote>{_extract_content_html(block.content)}</blockquote>"
+
+
+def _render_table_html(block: Block) -> str:
+    content = _extract_content_html(block.content)
+    return f"<div class='table-placeholder'>{content}</div>"
+
+
+def _render_unknown_html(block: Block) -> str:
+    content = _extract_content_html(block.content)
+    return f'<div class="blocknote-{block.type}">{content}</div>'
+
+
+_HTML_RENDERERS: Dict[str, HtmlRenderer] = {
+    "heading": _render_heading_html,
+    "paragraph": _render_paragraph_html,
+    "bulletListItem": _render_list_html("ul"),
+    "numberedListItem": _render_list_html("ol"),
+    "checkListItem": _render_check_list_item_html,
+    "quote": _render_quote_html,
+    "table": _render_table_html,
+}
 
 
 def _extract_content_html(content) -> str:
@@ -132,30 +272,17 @@ def _extract_content_html(content) -> str:
         for item in content:
             if hasattr(item, "type") and item.type == "text":
                 text = _escape_html(item.text)
-                if item.styles.get("bold"):
-                    text = f"<strong>{text}</strong>"
-                if item.styles.get("italic"):
-                    text = f"<em>{text}</em>"
-                if item.styles.get("underline"):
-                    text = f"<u>{text}</u>"
-                if item.styles.get("strike"):
-                    text = f"<s>{text}</s>"
-                if item.styles.get("code"):
-                    text = f"<code>{text}</code>"
-
-                if "backgroundColor" in item.styles:
-                    bg_color = item.styles["backgroundColor"]
-                    text = (
-                        '<span style="background-color: {}">{}</span>'.format(
-                            bg_color,
-                            text,
+                styles = item.styles
+                if styles:
+                    try:
+                        opening, closing = _cached_style_plan(
+                            tuple(styles.items()),
+                            styles.get("textColor").__class__,
+                            styles.get("backgroundColor").__class__,
                         )
-                    )
-
-                if "textColor" in item.styles:
-                    color = item.styles["textColor"]
-                    text = f'<span style="color: {color}">{text}</span>'
-
+                    except TypeError:  # unhashable style value
+                        opening, closing = _build_style_plan(styles)
+                    text = opening + text + closing
                 result_parts.append(text)
             else:
                 result_parts.append(_escape_html(str(item)))
@@ -164,10 +291,67 @@ def _extract_content_html(content) -> str:
         return _escape_html(str(content))
 
 
+# Boolean styles and their tags, innermost first.
+_STYLE_TAGS = (
+    ("bold", "strong"),
+    ("italic", "em"),
+    ("underline", "u"),
+    ("strike", "s"),
+    ("code", "code"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _cached_style_plan(
+    items: Tuple[Tuple[str, Any], ...], text_color: type, background: type
+) -> Tuple[str, str]:
+    """
+    Memoized ``_build_style_plan`` keyed by the styles' items and the
+    classes of the two color values.
+
+    ``1``, ``1.0`` and ``True`` compare and hash equal, so the items alone
+    would let ``{"textColor": 1}`` reuse the plan of ``{"textColor": True}``
+    and render ``color: True``. The colors are the only values rendered as
+    text; the other styles only need to be truthy, which equal values are
+    alike, so tagging just the colors keeps the key cheap to build.
+    Documents reuse a handful of style combinations; the LRU bound keeps
+    adversarial inputs with many distinct styles from growing the cache.
+    """
+    return _build_style_plan(dict(items))
+
+
+def _build_style_plan(styles: Dict[str, Any]) -> Tuple[str, str]:
+    """Build the tags in the nesting order of the original wrappers."""
+    tags = []  # innermost first
+    for style, tag in _STYLE_TAGS:
+        if styles.get(style):
+            tags.append((f"<{tag}>", f"</{tag}>"))
+
+    if "backgroundColor" in styles:
+        bg_color = styles["backgroundColor"]
+        tags.append(
+            ('<span style="background-color: {}">'.format(bg_color), "</span>")
+        )
+
+    if "textColor" in styles:
+        color = styles["textColor"]
+        tags.append((f'<span style="color: {color}">', "</span>"))
+
+    opening = "".join(open_tag for open_tag, _ in reversed(tags))
+    closing = "".join(close_tag for _, close_tag in tags)
+    return opening, closing
+
+
 def _escape_html(text: str) -> str:
     """
     Escape HTML special characters in text.
 
+    ``html.escape`` replaces ``&``, ``<``, ``>``, ``"`` and ``'`` (as
+    ``&#x27;``). ``str.replace`` returns its input unchanged when there is
+    nothing to replace, so clean runs are scanned but never copied; in
+    CPython this is faster than a ``str.translate`` table
+    (see ``benchmarks/bench_html_escape.py``).
+
     Args:
         text: The text to escape
 
@@ -177,10 +361,4 @@ def _escape_html(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#x27;")
-    )
+    return html.escape(text)
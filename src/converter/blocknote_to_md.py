@@ -1,14 +1,33 @@
-from typing import List
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+)
 
 from blocknote.schema import Block
 
+from .streaming import DEFAULT_CHUNK_SIZE, check_iterable, join_chunked
 
-def blocks_to_markdown(blocks: List[Block]) -> str:
+if TYPE_CHECKING:  # annotations only; caches are used by duck typing
+    from .render_cache import RenderCache
+
+MarkdownRenderer = Callable[[Block], str]
+
+
+def blocks_to_markdown(
+    blocks: List[Block], cache: Optional["RenderCache"] = None
+) -> str:
     """
     Converts a list of Block objects to a Markdown string.
 
     Args:
         blocks: List of validated Block objects to convert
+        cache: Optional RenderCache reusing the Markdown of unchanged blocks
 
     Returns:
         A markdown string representation of the blocks
@@ -20,11 +39,64 @@ def blocks_to_markdown(blocks: List[Block]) -> str:
     if not isinstance(blocks, list):
         raise TypeError("Input must be a list of Block objects")
 
-    if not blocks:
-        return ""
+    return "\n\n".join(_iter_markdown_elements(blocks, cache))
+
+
+def iter_blocks_markdown(
+    blocks: Iterable[Block],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional["RenderCache"] = None,
+) -> Iterator[str]:
+    """
+    Renders blocks to Markdown incrementally, yielding chunks of text.
+
+    Joining the chunks gives exactly the output of ``blocks_to_markdown``,
+    while only one chunk and the current block are held in memory.
+
+    Args:
+        blocks: List or any iterable of Block objects
+        chunk_size: Minimum number of characters per yielded chunk (the
+            final chunk may be shorter)
+        cache: Optional RenderCache reusing the Markdown of unchanged blocks
+
+    Returns:
+        Iterator of Markdown text chunks
+
+    Raises:
+        TypeError: If input is not iterable or contains non-Block objects
+        ValueError: If a block cannot be converted, or chunk_size < 1
+    """
+    elements = _iter_markdown_elements(check_iterable(blocks), cache)
+    return join_chunked(elements, "\n\n", chunk_size)
+
+
+def write_blocks_markdown(
+    blocks: Iterable[Block],
+    fp: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional["RenderCache"] = None,
+) -> None:
+    """
+    Renders blocks to Markdown and writes it incrementally to a text file.
+
+    Args:
+        blocks: List or any iterable of Block objects
+        fp: Writable text file object, e.g. any ``io.TextIOBase``
+        chunk_size: Number of characters buffered between writes
+        cache: Optional RenderCache reusing the Markdown of unchanged blocks
+
+    Raises:
+        TypeError: If input is not iterable or contains non-Block objects
+        ValueError: If a block cannot be converted, or chunk_size < 1
+    """
+    for chunk in iter_blocks_markdown(blocks, chunk_size, cache):
+        fp.write(chunk)
 
-    markdown_lines = []
 
+def _iter_markdown_elements(
+    blocks: Iterable[Block], cache: Optional["RenderCache"] = None
+) -> Iterator[str]:
+    """Yield the Markdown of each block that renders to a non-empty string."""
     for i, block in enumerate(blocks):
         try:
             if not isinstance(block, Block):
@@ -33,15 +105,48 @@ def blocks_to_markdown(blocks: List[Block]) -> str:
                     f"got {type(block)}"
                 )
 
-            markdown_line = _convert_block_to_markdown(block)
-            if markdown_line:  # Only add non-empty lines
-                markdown_lines.append(markdown_line)
+            if cache is None:
+                markdown_line = _convert_block_to_markdown(block)
+            else:
+                markdown_line = cache.render(
+                    block, "markdown", _convert_block_to_markdown
+                )
         except Exception as e:
             raise ValueError(
                 f"Failed to convert block at index {i} to markdown: {e}"
             )
+        if markdown_line:  # Only add non-empty lines
+            yield markdown_line
+
+
+def register_markdown_renderer(
+    block_type: str, renderer: Optional[MarkdownRenderer]
+) -> Optional[MarkdownRenderer]:
+    """
+    Registers the Markdown renderer used for a block type.
+
+    Built-in block types can be overridden and new types added. Blocks of
+    unregistered types render to an empty string and are skipped.
+
+    A ``RenderCache`` keys fragments by block content, not by renderer or
+    block ID: call its ``clear()`` after changing a renderer, and use
+    ``RenderCache(include_ids=True)`` if the renderer outputs block IDs.
 
-    return "\n\n".join(markdown_lines)
+    Args:
+        block_type: Block type name or ``BlockType`` member
+        renderer: Callable taking a Block and returning its Markdown, or
+            None to unregister the type
+
+    Returns:
+        The renderer previously registered for the type, or None; passing
+        it back restores the previous state, unregistering a new type
+    """
+    key = getattr(block_type, "value", block_type)
+    if renderer is None:
+        return _MARKDOWN_RENDERERS.pop(key, None)
+    previous = _MARKDOWN_RENDERERS.get(key)
+    _MARKDOWN_RENDERERS[key] = renderer
+    return previous
 
 
 def _convert_block_to_markdown(block: Block) -> str:
@@ -54,43 +159,64 @@ def _convert_block_to_markdown(block: Block) -> str:
     Returns:
         Markdown string for the block
     """
-    block_type = block.type
+    renderer = _MARKDOWN_RENDERERS.get(block.type)
+    if renderer is None:
+        # Unsupported block types return empty string; consider warnings later
+        return ""
+    return renderer(block)
+
+
+def _render_heading_markdown(block: Block) -> str:
     content = _extract_content_text(block.content)
+    level = block.props.get("level", 1)
+    if not isinstance(level, int) or level < 1 or level > 6:
+        level = 1  # Default to level 1 for invalid levels
+    return f"{'#' * level} {content}"
 
-    if block_type == "heading":
-        level = block.props.get("level", 1)
-        if not isinstance(level, int) or level < 1 or level > 6:
-            level = 1  # Default to level 1 for invalid levels
-        return f"{'#' * level} {content}"
 
-    elif block_type == "paragraph":
-        return content
+def _render_paragraph_markdown(block: Block) -> str:
+    return _extract_content_text(block.content)
 
-    elif block_type == "bulletListItem":
-        if not block.children:
-            return f"* {content}"
-        # Convert children to list items
-        child_lines = []
-        for child in block.children:
-            if child.type == "paragraph":
-                child_content = _extract_content_text(child.content)
-                child_lines.append(f"* {child_content}")
-        return "\n".join(child_lines)
-
-    elif block_type == "numberedListItem":
-        if not block.children:
-            return f"1. {content}"
-        # Convert children to numbered list items
-        child_lines = []
-        for i, child in enumerate(block.children, 1):
-            if child.type == "paragraph":
-                child_content = _extract_content_text(child.content)
-                child_lines.append(f"{i}. {child_content}")
-        return "\n".join(child_lines)
 
-    else:
-        # Unsupported block types return empty string; consider warnings later
-        return ""
+def _render_bullet_list_item_markdown(block: Block) -> str:
+    if not block.children:
+        return f"* {_extract_content_text(block.content)}"
+    # Convert children to list items
+    child_lines = []
+    for child in block.children:
+        if child.type == "paragraph":
+            child_content = _extract_content_text(child.content)
+            child_lines.append(f"* {child_content}")
+    return "\n".join(child_lines)
+
+
+def _render_numbered_list_item_markdown(block: Block) -> str:
+    if not block.children:
+        return f"1. {_extract_content_text(block.content)}"
+    # Convert children to numbered list items
+    child_lines = []
+    for i, child in enumerate(block.children, 1):
+        if child.type == "paragraph":
+            child_content = _extract_content_text(child.content)
+            child_lines.append(f"{i}. {child_content}")
+    return "\n".join(child_lines)
+
+
+_MARKDOWN_RENDERERS: Dict[str, MarkdownRenderer] = {
+    "heading": _render_heading_markdown,
+    "paragraph": _render_paragraph_markdown,
+    "bulletListItem": _render_bullet_list_item_markdown,
+    "numberedListItem": _render_numbered_list_item_markdown,
+}
+
+
+# Opening markers keyed by (bold, italic); closing markers are reversed.
+_EMPHASIS_MARKERS = {
+    (False, False): "",
+    (True, False): "**",
+    (False, True): "*",
+    (True, True): "***",
+}
 
 
 def _extract_content_text(content) -> str:
@@ -109,13 +235,15 @@ def _extract_content_text(content) -> str:
         result_parts = []
         for item in content:
             if hasattr(item, "type") and item.type == "text":
-                text = item.text
-                # Apply styling if present
-                if item.styles.get("bold"):
-                    text = f"**{text}**"
-                if item.styles.get("italic"):
-                    text = f"*{text}*"
-                result_parts.append(text)
+                styles = item.styles
+                if styles:
+                    # Apply styling if present
+                    marker = _EMPHASIS_MARKERS[
+                        bool(styles.get("bold")), bool(styles.get("italic"))
+                    ]
+                    result_parts.append(marker + item.text + marker[::-1])
+                else:
+                    result_parts.append(item.text)
             else:
                 result_parts.append(str(item))
         return "".join(result_parts)
@@ -1,36 +1,79 @@
-from typing import List, Optional
+import os
+import pickle
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from blocknote.schema import Block
 
+from .blocknote_to_dict import blocks_to_json
 from .blocknote_to_html import blocks_to_html
+from .dict_to_blocknote import blocks_from_json
 
 try:
     from weasyprint import CSS, HTML
     from weasyprint.text.fonts import FontConfiguration
 
     WEASYPRINT_AVAILABLE = True
-except ImportError:
+except (ImportError, OSError):
+    # OSError: WeasyPrint is installed but its native libraries are missing
     WEASYPRINT_AVAILABLE = False
 
 
+PdfTarget = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def _require_weasyprint() -> None:
+    """Raise a helpful ImportError when WeasyPrint cannot be used."""
+    if not WEASYPRINT_AVAILABLE:
+        raise ImportError(
+            "WeasyPrint is required for PDF generation. "
+            "Install it with: pip install 'blocknote-py[pdf]'"
+        )
+
+
 def blocks_to_pdf(
     blocks: List[Block],
-    output_path: Optional[str] = None,
+    output_path: Optional[PdfTarget] = None,
     css_string: Optional[str] = None,
     font_config: Optional[object] = None,
     page_size: str = "A4",
     margin: str = "2cm",
-) -> bytes:
-    """Convert BlockNote blocks to PDF."""
-    if not WEASYPRINT_AVAILABLE:
-        raise ImportError(
-            "WeasyPrint is required for PDF generation. "
-            "Install it with: pip install 'blocknote-py[pdf]'"
-        )
+    return_bytes: bool = True,
+) -> Optional[bytes]:
+    """Convert BlockNote blocks to PDF.
+
+    The document is laid out once. With ``output_path`` (a path or a binary
+    file object) the PDF is written there; pass ``return_bytes=False`` to
+    stream it straight to the target and get ``None`` back.
+    """
+    _require_weasyprint()
 
     if not isinstance(blocks, list):
         raise TypeError("Input must be a list of Block objects")
 
+    _check_output_args(output_path, return_bytes)
+
     if not blocks:
         html_content = (
             "<!DOCTYPE html><html><head><title>Empty Document</title>"
@@ -54,25 +97,41 @@ def blocks_to_pdf(
         if css_string:
             css_objects.append(CSS(string=css_string))
 
-        html_doc = HTML(string=html_content)
-
-        if output_path:
-            html_doc.write_pdf(
-                output_path, stylesheets=css_objects, font_config=font_config
-            )
-            pdf_bytes = html_doc.write_pdf(
-                stylesheets=css_objects, font_config=font_config
-            )
-            return pdf_bytes
-        else:
-            return html_doc.write_pdf(
-                stylesheets=css_objects, font_config=font_config
-            )
+        document = HTML(string=html_content).render(
+            stylesheets=css_objects, font_config=font_config
+        )
+        return _write_document(document, output_path, return_bytes)
 
     except Exception as e:
         raise ValueError(f"Failed to generate PDF: {e}")
 
 
+def _check_output_args(
+    output_path: Optional[PdfTarget], return_bytes: bool
+) -> None:
+    """Reject calls that would render a PDF only to discard it."""
+    if not return_bytes and output_path is None:
+        raise ValueError("return_bytes=False requires an output_path")
+
+
+def _write_document(
+    document, output_path: Optional[PdfTarget], return_bytes: bool
+) -> Optional[bytes]:
+    """Serialize a rendered WeasyPrint document exactly once."""
+    if not return_bytes:
+        document.write_pdf(output_path)
+        return None
+
+    pdf_bytes = document.write_pdf()
+    if output_path is not None:
+        if hasattr(output_path, "write"):
+            output_path.write(pdf_bytes)
+        else:
+            with open(output_path, "wb") as f:
+                f.write(pdf_bytes)
+    return pdf_bytes
+
+
 def _create_html_document(
     body_content: str,
     custom_css: Optional[str] = None,
@@ -80,6 +139,27 @@ def _create_html_document(
     margin: str = "2cm",
 ) -> str:
     """Create complete HTML document with styling."""
+    css_content = _default_css(custom_css, page_size, margin)
+
+    html_template = (
+        f"<!DOCTYPE html><html lang='en'><head>"
+        f"<meta charset='UTF-8'>"
+        "<meta name='viewport' "
+        "content='width=device-width, initial-scale=1.0'>"
+        f"<title>BlockNote Document</title>"
+        f"<style>{css_content}</style></head>"
+        f"<body>{body_content}</body></html>"
+    )
+
+    return html_template
+
+
+def _default_css(
+    custom_css: Optional[str] = None,
+    page_size: str = "A4",
+    margin: str = "2cm",
+) -> str:
+    """Build the default stylesheet, followed by any custom CSS."""
     css_parts = [
         "@page {size: " + page_size + "; margin: " + margin + "; }",
         (
@@ -129,56 +209,340 @@ def _create_html_document(
     if custom_css:
         css_content += "\n\n" + custom_css
 
-    html_template = (
-        f"<!DOCTYPE html><html lang='en'><head>"
-        f"<meta charset='UTF-8'>"
-        "<meta name='viewport' "
-        "content='width=device-width, initial-scale=1.0'>"
-        f"<title>BlockNote Document</title>"
-        f"<style>{css_content}</style></head>"
-        f"<body>{body_content}</body></html>"
-    )
-
-    return html_template
+    return css_content
 
 
-def blocks_to_pdf_with_template(
-    blocks: List[Block],
-    template_path: str,
-    output_path: Optional[str] = None,
-    template_variables: Optional[dict] = None,
-) -> bytes:
-    """Convert blocks to PDF using custom HTML template."""
-    if not WEASYPRINT_AVAILABLE:
-        raise ImportError(
-            "WeasyPrint is required for PDF generation. "
-            "Install it with: pip install 'blocknote-py[pdf]'"
-        )
-
+def _load_template(
+    template_path: str, template_variables: Optional[dict] = None
+) -> str:
+    """Read a template file and substitute ``{{name}}`` variables."""
     try:
         with open(template_path, "r", encoding="utf-8") as f:
             template_content = f.read()
     except FileNotFoundError:
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
-    html_body = blocks_to_html(blocks)
-
     if template_variables:
         for key, value in template_variables.items():
             template_content = template_content.replace(
                 f"{{{{{key}}}}}", str(value)
             )
 
+    return template_content
+
+
+def blocks_to_pdf_with_template(
+    blocks: List[Block],
+    template_path: str,
+    output_path: Optional[PdfTarget] = None,
+    template_variables: Optional[dict] = None,
+    return_bytes: bool = True,
+) -> Optional[bytes]:
+    """Convert blocks to PDF using custom HTML template.
+
+    ``output_path`` and ``return_bytes`` behave as in ``blocks_to_pdf``.
+    """
+    _require_weasyprint()
+
+    _check_output_args(output_path, return_bytes)
+
+    template_content = _load_template(template_path, template_variables)
+    html_body = blocks_to_html(blocks)
     template_content = template_content.replace("{{content}}", html_body)
 
     try:
-        html_doc = HTML(string=template_content)
+        document = HTML(string=template_content).render()
+        return _write_document(document, output_path, return_bytes)
+
+    except Exception as e:
+        raise ValueError(f"Failed to generate PDF from template: {e}")
+
+
+class PdfRenderer:
+    """
+    Reusable PDF renderer for long-lived workers.
+
+    Everything that does not depend on the blocks is prepared once: the
+    font configuration, the compiled default and custom stylesheets, and
+    the template with its variables already substituted. Each ``render``
+    call then only converts blocks to HTML and lays out the document.
+
+    Args:
+        css_string: Extra CSS applied after the default stylesheet
+        font_config: WeasyPrint ``FontConfiguration`` to share
+        page_size: CSS page size, e.g. "A4" or "letter"
+        margin: CSS page margin
+        template_path: Optional HTML template containing ``{{content}}``;
+            when given, the default stylesheet is not applied
+        template_variables: Values substituted into the template once
+
+    Example:
+        >>> renderer = PdfRenderer(css_string="h1 { color: navy; }")
+        >>> pdf_bytes = renderer.render(blocks)
+    """
+
+    def __init__(
+        self,
+        css_string: Optional[str] = None,
+        font_config: Optional[object] = None,
+        page_size: str = "A4",
+        margin: str = "2cm",
+        template_path: Optional[str] = None,
+        template_variables: Optional[dict] = None,
+    ):
+        _require_weasyprint()
+
+        self.page_size = page_size
+        self.margin = margin
+        self.font_config = (
+            font_config if font_config is not None else FontConfiguration()
+        )
+
+        if template_path is not None:
+            template = _load_template(template_path, template_variables)
+            self._template_parts: Optional[List[str]] = template.split(
+                "{{content}}"
+            )
+            css = css_string
+        else:
+            self._template_parts = None
+            css = _default_css(css_string, page_size, margin)
 
-        if output_path:
-            html_doc.write_pdf(output_path)
-            return html_doc.write_pdf()
+        try:
+            self._stylesheets = (
+                [CSS(string=css, font_config=self.font_config)] if css else []
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to compile CSS: {e}")
+
+    def render(
+        self,
+        blocks: List[Block],
+        output_path: Optional[PdfTarget] = None,
+        return_bytes: bool = True,
+    ) -> Optional[bytes]:
+        """
+        Render blocks to PDF.
+
+        ``output_path`` and ``return_bytes`` behave as in ``blocks_to_pdf``.
+        """
+        if not isinstance(blocks, list):
+            raise TypeError("Input must be a list of Block objects")
+
+        _check_output_args(output_path, return_bytes)
+
+        try:
+            html_body = blocks_to_html(blocks)
+        except Exception as e:
+            raise ValueError(f"Failed to convert blocks to HTML: {e}")
+
+        if self._template_parts is not None:
+            html_content = html_body.join(self._template_parts)
         else:
-            return html_doc.write_pdf()
+            html_content = (
+                "<!DOCTYPE html><html lang='en'><head>"
+                "<meta charset='UTF-8'>"
+                "<title>BlockNote Document</title></head>"
+                f"<body>{html_body}</body></html>"
+            )
+
+        try:
+            document = HTML(string=html_content).render(
+                stylesheets=self._stylesheets, font_config=self.font_config
+            )
+            return _write_document(document, output_path, return_bytes)
+        except Exception as e:
+            raise ValueError(f"Failed to generate PDF: {e}")
+
+
+class PdfResult(NamedTuple):
+    """
+    Outcome of rendering one document with ``render_pdfs``.
 
+    ``position`` is the document's position in the input.
+    """
+
+    position: int
+    name: str
+    output_path: str
+    ok: bool
+    error: Optional[str]
+    seconds: float
+
+
+# Renderer owned by each worker process, built once by _init_pdf_worker.
+_worker_renderer: Optional[PdfRenderer] = None
+
+
+def _init_pdf_worker(renderer_options: Dict[str, Any]) -> None:
+    """Build the warm renderer of a worker process."""
+    global _worker_renderer
+    _worker_renderer = PdfRenderer(**renderer_options)
+
+
+def _render_pdf_job(
+    index: int, name: str, payload: bytes, output_path: str
+) -> PdfResult:
+    """Render one serialized document to disk inside a worker process."""
+    start = time.perf_counter()
+    try:
+        if _worker_renderer is None:
+            raise RuntimeError("PDF worker was not initialized")
+        blocks = blocks_from_json(payload)
+        _worker_renderer.render(
+            blocks, output_path=output_path, return_bytes=False
+        )
     except Exception as e:
-        raise ValueError(f"Failed to generate PDF from template: {e}")
+        elapsed = time.perf_counter() - start
+        return PdfResult(index, name, output_path, False, str(e), elapsed)
+    return PdfResult(
+        index, name, output_path, True, None, time.perf_counter() - start
+    )
+
+
+def render_pdfs(
+    documents: Union[
+        Mapping[str, List[Block]], Iterable[Tuple[str, List[Block]]]
+    ],
+    output_dir: str,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    **renderer_options: Any,
+) -> Iterator[PdfResult]:
+    """
+    Render many documents to PDF files in a pool of worker processes.
+
+    Each worker builds one ``PdfRenderer`` from ``renderer_options`` when it
+    starts and reuses it for every document it receives. One renderer is
+    also built up front, so bad options fail here rather than in every
+    worker. Documents are sent
+    to the workers as compact JSON, and the workers write their PDFs straight
+    to ``output_dir/<name>.pdf``. At most ``2 * workers`` documents are in
+    flight, so the input may be a lazy iterable of any length.
+
+    Args:
+        documents: Mapping or iterable of ``(name, blocks)`` pairs; names
+            are used as file names, so they must be unique and contain no
+            path separators or drive
+        output_dir: Directory the PDFs are written to (created if missing)
+        workers: Number of worker processes (defaults to the CPU count)
+        ordered: Yield results in input order; when False, results are
+            yielded as soon as each document finishes
+        **renderer_options: Keyword arguments for ``PdfRenderer``, except
+            ``font_config``: each worker makes its own
+
+    Returns:
+        Iterator of ``PdfResult`` with the status and render time of each
+        document. A failing document does not stop the batch: invalid or
+        duplicate names and blocks that cannot be serialized are reported
+        as failed results without being sent to a worker.
+
+    Raises:
+        ImportError: If WeasyPrint is not installed
+        TypeError: If renderer_options are not ``PdfRenderer`` arguments
+        FileNotFoundError: If the template file does not exist
+        ValueError: If renderer_options contain ``font_config``, cannot be
+            pickled, or the CSS cannot be compiled
+
+    Example:
+        >>> results = list(render_pdfs({"a": blocks_a}, "out", workers=4))
+        >>> [r.output_path for r in results if r.ok]
+        ['out/a.pdf']
+    """
+    _require_weasyprint()
+    if "font_config" in renderer_options:
+        raise ValueError(
+            "render_pdfs does not accept font_config: each worker process "
+            "builds its own FontConfiguration"
+        )
+    try:
+        pickle.dumps(renderer_options)
+    except Exception as e:
+        raise ValueError(f"renderer_options must be picklable: {e}")
+    # Workers build their renderer in the pool initializer, where a bad
+    # option would only surface as BrokenProcessPool.
+    PdfRenderer(**renderer_options)
+
+    if isinstance(documents, Mapping):
+        documents = documents.items()
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    seen: Set[str] = set()
+    jobs = (
+        _pdf_job(i, name, blocks, output_dir, seen)
+        for i, (name, blocks) in enumerate(documents)
+    )
+    return _run_pdf_jobs(jobs, workers, ordered, renderer_options)
+
+
+_PdfJob = Union[Tuple[int, str, bytes, str], PdfResult]
+
+
+def _pdf_job(
+    index: int, name: str, blocks: List[Block], output_dir: str, seen: Set[str]
+) -> _PdfJob:
+    """
+    Serialize one document for a worker, or return its failed result.
+
+    ``seen`` holds the file names of the batch so far.
+    """
+    file_name = f"{name}.pdf"
+    output_path = os.path.join(output_dir, file_name)
+    separators = [sep for sep in (os.sep, os.altsep, "/") if sep]
+    if (
+        any(separator in file_name for separator in separators)
+        or os.path.isabs(file_name)
+        or os.path.splitdrive(file_name)[0]
+    ):
+        error = f"Invalid document name {name!r}: must be a plain file name"
+        return PdfResult(index, name, output_path, False, error, 0.0)
+    key = os.path.normcase(file_name)
+    if key in seen:
+        error = f"Duplicate document name {name!r}"
+        return PdfResult(index, name, output_path, False, error, 0.0)
+    seen.add(key)
+
+    start = time.perf_counter()
+    try:
+        payload = blocks_to_json(blocks)
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        return PdfResult(index, name, output_path, False, str(e), elapsed)
+    return index, name, payload, output_path
+
+
+def _run_pdf_jobs(
+    jobs: Iterator[_PdfJob],
+    workers: int,
+    ordered: bool,
+    renderer_options: Dict[str, Any],
+) -> Iterator[PdfResult]:
+    """Feed jobs to the pool through a bounded window of pending futures."""
+    window = 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_pdf_worker,
+        initargs=(renderer_options,),
+    ) as executor:
+
+        def submit(job: _PdfJob) -> Future:
+            if isinstance(job, PdfResult):  # failed before rendering
+                future: Future = Future()
+                future.set_result(job)
+                return future
+            return executor.submit(_render_pdf_job, *job)
+
+        if ordered:
+            queue = deque(submit(job) for job in islice(jobs, window))
+            while queue:
+                result = queue.popleft().result()
+                queue.extend(submit(job) for job in islice(jobs, 1))
+                yield result
+        else:
+            waiting = {submit(job) for job in islice(jobs, window)}
+            while waiting:
+                done, waiting = wait(waiting, return_when=FIRST_COMPLETED)
+                waiting |= {submit(job) for job in islice(jobs, len(done))}
+                for future in done:
+                    yield future.result()
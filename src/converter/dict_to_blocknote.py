@@ -1,24 +1,69 @@
-from typing import Any, Dict, List
+import json
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from blocknote.schema import Block, BlockType, InlineContent, InlineContentType
+from blocknote.schema.types import BLOCK_LIST_ADAPTER
+from pydantic import ValidationError
 
+from .traversal import check_depth, check_max_depth
 
-def dict_to_blocks(data: List[Dict[str, Any]]) -> List[Block]:
+
+def dict_to_blocks(
+    data: List[Dict[str, Any]],
+    trusted: bool = False,
+    max_depth: Optional[int] = None,
+) -> List[Block]:
     """
     Converts a list of dictionaries to a list of Block objects.
 
+    The whole list is validated by pydantic-core in one pass. Trees nested
+    deeper than pydantic-core's recursion limit (a few hundred levels)
+    are validated block by block with an explicit stack instead.
+
     Args:
         data: List of dictionaries representing Blocknote blocks
+        trusted: Skip validation and build the tree with
+            ``model_construct``. Only use this for data known to be
+            valid, e.g. documents that were produced by ``blocks_to_dict``
+            and stored. ``props`` and ``styles`` dicts are copied
+            (shallowly), so editing the blocks does not change ``data``.
+            ``content`` must still be a str, a list or None.
+        max_depth: Optional maximum nesting depth (top-level blocks are at
+            depth 1), checked before any block is built
 
     Returns:
         List of validated Block objects
 
     Raises:
         TypeError: If input is not a list
-        ValueError: If any dictionary cannot be converted to a valid Block
+        ValueError: If any dictionary cannot be converted to a valid Block,
+            a trusted block has content of another type, or blocks are
+            nested deeper than max_depth
     """
     if not isinstance(data, list):
         raise TypeError("Input must be a list of dictionaries")
+    if max_depth is not None:
+        check_depth(data, max_depth)
+
+    if trusted:
+        return [_construct_block(item) for item in data]
+
+    for i, item in enumerate(data):
+        if not isinstance(item, dict):
+            raise ValueError(
+                f"Failed to convert dict at index {i} to Block: "
+                f"Item at index {i} must be a dictionary, got {type(item)}. "
+                f"Dict: {item}"
+            )
+
+    try:
+        return BLOCK_LIST_ADAPTER.validate_python(data)
+    except ValidationError as e:
+        if any(error["type"] == "recursion_loop" for error in e.errors()):
+            return _validate_deep(data)
+        # Re-run the per-item path to report which block failed and why.
 
     blocks = []
     for i, item in enumerate(data):
@@ -39,6 +84,56 @@ def dict_to_blocks(data: List[Dict[str, Any]]) -> List[Block]:
     return blocks
 
 
+def blocks_from_json(
+    data: Union[bytes, str], max_depth: Optional[int] = None
+) -> List[Block]:
+    """
+    Parses a JSON document directly into a list of Block objects.
+
+    The JSON is parsed and validated by pydantic-core in a single pass,
+    without building an intermediate tree of Python dictionaries. JSON
+    nested beyond pydantic-core's parser limit (about 60 levels of
+    blocks) is parsed by ``json.loads`` with a temporarily raised
+    recursion limit and validated block by block; documents nested more
+    than about 2,000 levels of blocks deep are rejected.
+
+    Args:
+        data: JSON array of Blocknote blocks, as bytes or str
+        max_depth: Optional maximum nesting depth (top-level blocks are at
+            depth 1)
+
+    Returns:
+        List of validated Block objects
+
+    Raises:
+        TypeError: If input is not bytes or str
+        ValueError: If the JSON is malformed, nested too deeply to parse
+            or does not describe valid blocks, or blocks are nested deeper
+            than max_depth
+    """
+    if not isinstance(data, (bytes, bytearray, str)):
+        raise TypeError("Input must be JSON bytes or str")
+    check_max_depth(max_depth)
+
+    try:
+        blocks = BLOCK_LIST_ADAPTER.validate_json(data)
+    except ValidationError as e:
+        if "recursion limit exceeded" not in str(e):
+            raise ValueError(f"Failed to convert JSON to blocks: {e}")
+        try:
+            if not isinstance(data, str):
+                data = bytes(data).decode("utf-8")
+            return dict_to_blocks(_loads_deep(data), max_depth=max_depth)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Failed to convert JSON to blocks: {e}")
+    if max_depth is not None:
+        try:
+            check_depth(blocks, max_depth)
+        except ValueError as e:
+            raise ValueError(f"Failed to convert JSON to blocks: {e}")
+    return blocks
+
+
 def _normalize_block_dict(block_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalizes a block dictionary to ensure it conforms to Blocknote schema.
@@ -106,3 +201,154 @@ def _normalize_block_dict(block_dict: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("children must be a list")
 
     return normalized
+
+
+def _validate_deep(data: List[Dict[str, Any]]) -> List[Block]:
+    """
+    Validate blocks one at a time, walking children with an explicit stack.
+
+    Used for trees nested beyond pydantic-core's recursion limit; each
+    block is validated without its children, which are then attached.
+    """
+    blocks: List[Block] = []
+    stack: List[Tuple[List[Any], List[Block], Optional[int]]] = [
+        (data, blocks, None)
+    ]
+    while stack:
+        dicts, target, index = stack.pop()
+        for i, item in enumerate(dicts):
+            top_index = i if index is None else index
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError(
+                        f"Block must be a dictionary, got {type(item)}"
+                    )
+                children = item.get("children", [])
+                if not isinstance(children, list):
+                    raise ValueError("children must be a list")
+                shallow = {**item, "children": []}
+                block = Block(**_normalize_block_dict(shallow))
+            except Exception as e:
+                block_id = item.get("id") if isinstance(item, dict) else None
+                raise ValueError(
+                    f"Failed to convert dict at index {top_index} to Block: "
+                    f"{e}. Block id: {block_id!r}"
+                )
+            target.append(block)
+            if children:
+                stack.append((children, block.children, top_index))
+    return blocks
+
+
+# Extra recursion allowed to ``json.loads`` for documents nested beyond
+# pydantic-core's parser limit. The C scanner takes about 100 bytes of C
+# stack per level, so this stays well inside a 512 KiB thread stack;
+# each level of blocks is two levels of JSON (the block and its
+# ``children`` list).
+_JSON_EXTRA_NESTING = 4_000
+_recursion_limit_lock = threading.Lock()
+
+
+def _loads_deep(text: str) -> Any:
+    """
+    ``json.loads`` with the recursion limit raised for deep documents.
+
+    The limit is raised by at most ``_JSON_EXTRA_NESTING`` and restored
+    afterwards; anything nested deeper is rejected with a ValueError.
+    """
+    try:
+        return json.loads(text)
+    except RecursionError:
+        pass
+    with _recursion_limit_lock:
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(limit + _JSON_EXTRA_NESTING)
+        try:
+            return json.loads(text)
+        except RecursionError:
+            raise ValueError(
+                "JSON is nested too deeply to parse (more than about "
+                f"{_JSON_EXTRA_NESTING // 2} levels of blocks)"
+            ) from None
+        finally:
+            sys.setrecursionlimit(limit)
+
+
+def _construct_block(block_dict: Dict[str, Any]) -> Block:
+    """
+    Build a Block tree from a trusted dictionary without validation.
+
+    Children are attached with an explicit stack, so deep trees do not
+    recurse.
+
+    Args:
+        block_dict: Dictionary representing a valid block
+
+    Returns:
+        Block object whose fields are assigned as provided
+    """
+    root = _construct_node(block_dict)
+    stack = [(block_dict.get("children", ()), root.children)]
+    while stack:
+        dicts, target = stack.pop()
+        for child_dict in dicts:
+            child = _construct_node(child_dict)
+            target.append(child)
+            if child_dict.get("children"):
+                stack.append((child_dict["children"], child.children))
+    return root
+
+
+def _construct_node(block_dict: Dict[str, Any]) -> Block:
+    """Construct one block with an empty children list."""
+    block_type = block_dict["type"]
+    content = block_dict.get("content")
+    if content is None:
+        content = []
+    elif not isinstance(content, (str, list)):
+        # Renderers and normalize_runs expect str or a list; fail here,
+        # where the bad data came in, rather than in a later render.
+        raise ValueError(
+            f"Invalid content type for block {block_dict['id']!r}: "
+            f"{type(content)}"
+        )
+    if block_type == "table":
+        pass
+    elif isinstance(content, str):
+        content = [
+            InlineContent.model_construct(**_inline_fields("text", content))
+        ]
+    else:
+        content = [
+            (
+                item
+                if isinstance(item, InlineContent)
+                else InlineContent.model_construct(
+                    **_inline_fields(
+                        item.get("type", "text"),
+                        item["text"],
+                        item.get("styles") or {},
+                    )
+                )
+            )
+            for item in content
+        ]
+
+    return Block.model_construct(
+        id=block_dict["id"],
+        type=block_type,
+        props=dict(block_dict.get("props") or {}),
+        content=content,
+        children=[],
+    )
+
+
+def _inline_fields(
+    type_: str, text: str, styles: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Field values for an InlineContent."""
+    return {
+        "type": type_,
+        "text": text,
+        "styles": {} if styles is None else dict(styles),
+    }
@@ -0,0 +1,306 @@
+"""
+A block list with an ID index for constant-time lookups.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from blocknote.schema import Block
+
+from .blocknote_to_dict import blocks_to_dict, blocks_to_json
+from .blocknote_to_html import blocks_to_html
+from .blocknote_to_md import blocks_to_markdown
+from .dict_to_blocknote import blocks_from_json, dict_to_blocks
+from .html_to_blocknote import html_to_blocks
+from .md_to_blocknote import markdown_to_blocks
+from .traversal import block_position, update_block_fields
+
+
+class Document:
+    """
+    Wraps a list of blocks with an index from block ID to block and parent.
+
+    The index is built on the first lookup, with an explicit stack rather
+    than recursion, and is kept up to date by ``insert``, ``move``,
+    ``delete`` and ``update``. Changes made to ``blocks`` or to a block's
+    ``children`` list directly are not seen by the index; call
+    ``reindex()`` after them.
+
+    ``blocks`` is a plain list, so the document works with every
+    converter, e.g. ``blocks_to_html(document.blocks)``; the ``from_*``
+    and ``to_*`` methods are shortcuts for the common ones.
+
+    Args:
+        blocks: Top-level blocks; the list is used as is, not copied
+
+    Raises:
+        TypeError: If blocks is not a list
+        ValueError: If a block ID appears twice (on the first lookup)
+
+    Example:
+        >>> document = Document.from_markdown("# Title\\n\\n- one\\n- two")
+        >>> block = document.get(block_id)
+        >>> document.parent(block_id), document.path(block_id)
+        (Block(id='...', type='bulletListItem', ...), (1, 0))
+    """
+
+    def __init__(self, blocks: Optional[List[Block]] = None):
+        if blocks is None:
+            blocks = []
+        if not isinstance(blocks, list):
+            raise TypeError("Input must be a list of Block objects")
+        self.blocks = blocks
+        self._index: Optional[Dict[str, Tuple[Block, Optional[Block]]]]
+        self._index = None
+
+    def __len__(self) -> int:
+        """Number of top-level blocks."""
+        return len(self.blocks)
+
+    def __iter__(self) -> Iterator[Block]:
+        """Iterate over the top-level blocks."""
+        return iter(self.blocks)
+
+    def __contains__(self, block_id: object) -> bool:
+        return block_id in self._get_index()
+
+    def get(self, block_id: str) -> Block:
+        """
+        Returns the block with the given ID, at any depth.
+
+        Raises:
+            KeyError: If no block has the ID
+        """
+        return self._entry(block_id)[0]
+
+    def parent(self, block_id: str) -> Optional[Block]:
+        """Returns the parent of a block, or None for top-level blocks."""
+        return self._entry(block_id)[1]
+
+    def siblings(self, block_id: str) -> List[Block]:
+        """Returns the list holding a block (its parent's children)."""
+        parent = self._entry(block_id)[1]
+        return self.blocks if parent is None else parent.children
+
+    def path(self, block_id: str) -> Tuple[int, ...]:
+        """
+        Returns the index path of a block, e.g. ``(2, 0)`` for the first
+        child of the third top-level block.
+
+        Positions are looked up when needed rather than stored, so edits
+        never have to renumber the index.
+        """
+        path = []
+        block, parent = self._entry(block_id)
+        while True:
+            siblings = self.blocks if parent is None else parent.children
+            path.append(block_position(siblings, block))
+            if parent is None:
+                break
+            block, parent = self._entry(parent.id)
+        return tuple(reversed(path))
+
+    def iter_depth_first(self) -> Iterator[Block]:
+        """Yields every block in document order (pre-order depth first)."""
+        stack = [iter(self.blocks)]
+        while stack:
+            block = next(stack[-1], None)
+            if block is None:
+                stack.pop()
+                continue
+            yield block
+            if block.children:
+                stack.append(iter(block.children))
+
+    def iter_breadth_first(self) -> Iterator[Block]:
+        """Yields every block level by level: top-level blocks first."""
+        queue = deque(self.blocks)
+        while queue:
+            block = queue.popleft()
+            yield block
+            queue.extend(block.children)
+
+    def insert(
+        self,
+        block: Union[Block, Dict[str, Any]],
+        parent_id: Optional[str] = None,
+        index: Optional[int] = None,
+    ) -> Block:
+        """
+        Inserts a block (with its children) into the document.
+
+        Args:
+            block: Block, or block dict to validate
+            parent_id: ID of the new parent, or None for the top level
+            index: Position among the siblings; appended when None
+
+        Returns:
+            The inserted Block
+
+        Raises:
+            KeyError: If the parent does not exist
+            ValueError: If an ID in the block's subtree is already in use
+        """
+        if not isinstance(block, Block):
+            block = dict_to_blocks([block])[0]
+        siblings = self._children_of(parent_id)
+        if self._index is not None:
+            parent = None if parent_id is None else self.get(parent_id)
+            added = _index_subtree([block], parent)
+            duplicates = added.keys() & self._index.keys()
+            if duplicates:
+                raise ValueError(f"Duplicate block id {min(duplicates)!r}")
+            self._index.update(added)
+        siblings.insert(len(siblings) if index is None else index, block)
+        return block
+
+    def move(
+        self,
+        block_id: str,
+        parent_id: Optional[str] = None,
+        index: Optional[int] = None,
+    ) -> Block:
+        """
+        Moves a block and its children to a new parent and/or position.
+
+        ``index`` is the position among the new siblings after the block
+        has been taken out of its old place; appended when None.
+
+        Raises:
+            KeyError: If the block or the parent does not exist
+            ValueError: If the new parent is the block or a descendant
+        """
+        block, parent = self._entry(block_id)
+        new_parent = None if parent_id is None else self.get(parent_id)
+        ancestor = new_parent
+        while ancestor is not None:
+            if ancestor is block:
+                raise ValueError(
+                    f"Cannot move block {block_id!r} into its own subtree"
+                )
+            ancestor = self._entry(ancestor.id)[1]
+
+        source = self.blocks if parent is None else parent.children
+        del source[block_position(source, block)]
+        target = self._children_of(parent_id)
+        target.insert(len(target) if index is None else index, block)
+        self._get_index()[block_id] = (block, new_parent)
+        return block
+
+    def delete(self, block_id: str) -> Block:
+        """
+        Removes a block and its children from the document.
+
+        Returns:
+            The removed Block
+
+        Raises:
+            KeyError: If the block does not exist
+        """
+        block, parent = self._entry(block_id)
+        siblings = self.blocks if parent is None else parent.children
+        del siblings[block_position(siblings, block)]
+        index = self._get_index()
+        for removed_id in _index_subtree([block], parent):
+            del index[removed_id]
+        return block
+
+    def update(self, block_id: str, **fields: Any) -> Block:
+        """
+        Sets ``type``, ``props`` and/or ``content`` of a block.
+
+        Content may be given as a string or as InlineContent objects or
+        dicts. Children are changed with ``insert``, ``move`` and
+        ``delete``.
+
+        Raises:
+            KeyError: If the block does not exist
+            ValueError: If another field is given or a value is invalid,
+                e.g. an unknown type; the block is then left unchanged
+        """
+        block = self.get(block_id)
+        if isinstance(fields.get("content"), list):
+            fields["content"] = [
+                item if isinstance(item, dict) else item.model_dump()
+                for item in fields["content"]
+            ]
+        update_block_fields(block, fields)
+        return block
+
+    def reindex(self) -> None:
+        """Drops the index; it is rebuilt on the next lookup."""
+        self._index = None
+
+    @classmethod
+    def from_dict(cls, data: List[Dict[str, Any]]) -> "Document":
+        """Builds a document with ``dict_to_blocks``."""
+        return cls(dict_to_blocks(data))
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Document":
+        """Builds a document with ``blocks_from_json``."""
+        return cls(blocks_from_json(data))
+
+    @classmethod
+    def from_html(cls, html: str) -> "Document":
+        """Builds a document with ``html_to_blocks``."""
+        return cls(html_to_blocks(html))
+
+    @classmethod
+    def from_markdown(cls, markdown: str) -> "Document":
+        """Builds a document with ``markdown_to_blocks``."""
+        return cls(markdown_to_blocks(markdown))
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """Converts the document with ``blocks_to_dict``."""
+        return blocks_to_dict(self.blocks)
+
+    def to_json(self) -> bytes:
+        """Serializes the document with ``blocks_to_json``."""
+        return blocks_to_json(self.blocks)
+
+    def to_html(self) -> str:
+        """Renders the document with ``blocks_to_html``."""
+        return blocks_to_html(self.blocks)
+
+    def to_markdown(self) -> str:
+        """Renders the document with ``blocks_to_markdown``."""
+        return blocks_to_markdown(self.blocks)
+
+    def _get_index(self) -> Dict[str, Tuple[Block, Optional[Block]]]:
+        if self._index is None:
+            self._index = _index_subtree(self.blocks, None, check=True)
+        return self._index
+
+    def _entry(self, block_id: str) -> Tuple[Block, Optional[Block]]:
+        try:
+            return self._get_index()[block_id]
+        except KeyError:
+            raise KeyError(f"No block with id {block_id!r}") from None
+
+    def _children_of(self, parent_id: Optional[str]) -> List[Block]:
+        if parent_id is None:
+            return self.blocks
+        return self.get(parent_id).children
+
+
+def _index_subtree(
+    blocks: List[Block], parent: Optional[Block], check: bool = False
+) -> Dict[str, Tuple[Block, Optional[Block]]]:
+    """Map the IDs of ``blocks`` and their descendants to (block, parent)."""
+    index: Dict[str, Tuple[Block, Optional[Block]]] = {}
+    stack = [(blocks, parent)]
+    while stack:
+        siblings, parent = stack.pop()
+        for i, block in enumerate(siblings):
+            if check and not isinstance(block, Block):
+                raise TypeError(
+                    f"Item at index {i} must be a Block object, "
+                    f"got {type(block)}"
+                )
+            if block.id in index:
+                raise ValueError(f"Duplicate block id {block.id!r}")
+            index[block.id] = (block, parent)
+            if block.children:
+                stack.append((block.children, block))
+    return index
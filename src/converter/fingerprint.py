@@ -0,0 +1,171 @@
+"""
+Stable structural fingerprints of Block trees.
+
+``block_fingerprint`` hashes a block bottom-up: the BLAKE2b digest of each
+block covers its type, props and inline content plus the digests of its
+children. Block IDs are not included, so two trees with the same content
+have the same fingerprint wherever they came from, and digests are stable
+across processes and Python versions.
+
+Digests of individual blocks are memoized by content. After an edit, only
+the changed block and its ancestors are hashed again; every unchanged
+subtree is a dictionary lookup, also when the new revision was validated
+from JSON into fresh Block objects.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from blocknote.schema import Block
+
+# Number of block digests kept by the memo.
+FINGERPRINT_CACHE_SIZE = 65536
+
+_DIGEST_SIZE = 16
+
+
+def block_fingerprint(block: Block) -> str:
+    """
+    Returns a stable digest of a block's type, props, content and children.
+
+    Args:
+        block: Block to fingerprint
+
+    Returns:
+        32 hex characters; equal for blocks with equal content
+
+    Raises:
+        TypeError: If input is not a Block object
+
+    Example:
+        >>> block_fingerprint(a) == block_fingerprint(b)
+        True
+    """
+    if not isinstance(block, Block):
+        raise TypeError("Input must be a Block object")
+    return _fingerprint(block)
+
+
+def document_fingerprint(blocks: List[Block]) -> str:
+    """
+    Returns a stable digest of a list of blocks, in order.
+
+    Args:
+        blocks: List of Block objects
+
+    Returns:
+        32 hex characters; equal for documents with equal content
+
+    Raises:
+        TypeError: If input is not a list or contains non-Block objects
+    """
+    if not isinstance(blocks, list):
+        raise TypeError("Input must be a list of Block objects")
+
+    digests = []
+    for i, block in enumerate(blocks):
+        if not isinstance(block, Block):
+            raise TypeError(
+                f"Item at index {i} must be a Block object, got {type(block)}"
+            )
+        digests.append(_fingerprint(block))
+    return _hash("document", digests)
+
+
+def shallow_key(block: Block) -> Tuple:
+    """
+    Hashable key of a block's type, props and inline content.
+
+    Non-string values are tagged with their class name so that ``1`` and
+    ``True``, which compare equal but render differently, get different
+    keys. Raises TypeError from ``hash()`` if a value is unhashable.
+    """
+    content = block.content
+    if isinstance(content, str):
+        return (block.type, _freeze(block.props), content)
+    runs = tuple(
+        (item.type, item.text, _freeze(item.styles)) for item in content
+    )
+    return (block.type, _freeze(block.props), runs)
+
+
+def shallow_json(block: Block) -> str:
+    """Canonical JSON of a block's type, props and inline content."""
+    content: Any = block.content
+    if not isinstance(content, str):
+        content = [[item.type, item.text, item.styles] for item in content]
+    return json.dumps(
+        [block.type, block.props, content],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def _freeze(mapping: Dict[str, Any]) -> Tuple:
+    if not mapping:
+        return ()
+    # Class names rather than classes keep the key free of GC-tracked
+    # objects, so CPython can untrack cached keys.
+    return tuple(
+        sorted(
+            (key, value) if value.__class__ is str
+            else (key, value.__class__.__name__, value)
+            for key, value in mapping.items()
+        )
+    )
+
+
+def _fingerprint(root: Block) -> str:
+    """Hash a tree in post-order with an explicit stack."""
+    digests: Dict[int, str] = {}
+    stack = [(root, False)]
+    while stack:
+        block, expanded = stack.pop()
+        children = block.children
+        if children and not expanded:
+            stack.append((block, True))
+            stack.extend((child, False) for child in children)
+            continue
+        child_digests = tuple(digests[id(child)] for child in children)
+        try:
+            digest = _memoized_digest(shallow_key(block), child_digests)
+        except TypeError:  # unhashable prop or style value
+            digest = _hash(shallow_json(block), child_digests)
+        digests[id(block)] = digest
+    return digests[id(root)]
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def _memoized_digest(key: Tuple, child_digests: Tuple[str, ...]) -> str:
+    return _hash(_key_json(key), child_digests)
+
+
+def _key_json(key: Tuple) -> str:
+    """``shallow_json`` rebuilt from a ``shallow_key``."""
+    block_type, props, content = key
+    if content.__class__ is not str:
+        content = [
+            [item_type, text, _thaw(styles)]
+            for item_type, text, styles in content
+        ]
+    return json.dumps(
+        [block_type, _thaw(props), content],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def _thaw(frozen: Tuple) -> Dict[str, Any]:
+    return {entry[0]: entry[-1] for entry in frozen}
+
+
+def _hash(payload: str, child_digests) -> str:
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=_DIGEST_SIZE)
+    for child_digest in child_digests:
+        digest.update(b"\0")
+        digest.update(child_digest.encode("ascii"))
+    return digest.hexdigest()
@@ -1,48 +1,260 @@
-import uuid
+from collections import OrderedDict
 from html.parser import HTMLParser
-from typing import Any, Dict, List
+from importlib.util import find_spec
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from blocknote.schema import Block, InlineContent
 
+from .block_ids import IdFactory, uuid4_ids
+from .inline_runs import merge_runs as _merge_runs
+from .streaming import DEFAULT_CHUNK_SIZE, read_chunks
 
-def html_to_blocks(html: str) -> List[Block]:
+HTML_BACKENDS = ("stdlib", "lxml")
+
+# lxml is an optional extra, imported on first use by the lxml backend.
+LXML_AVAILABLE = find_spec("lxml") is not None
+
+
+def html_to_blocks(
+    html: str,
+    id_factory: Optional[IdFactory] = None,
+    merge_runs: bool = True,
+    backend: str = "stdlib",
+) -> List[Block]:
     """
     Converts an HTML string to a list of Block objects.
 
+    The ``"lxml"`` backend tokenizes the HTML with libxml2, in C, and
+    replays the resulting tree on the same handlers as the pure Python
+    ``"stdlib"`` backend, so only block and run construction is left in
+    Python. It falls back to ``"stdlib"`` when lxml is not installed
+    (``pip install 'blocknote-py[lxml]'``) or rejects the input, e.g.
+    markup nested deeper than libxml2's limit of 2048 levels.
+
+    Both backends give the same blocks for well-formed HTML. libxml2
+    repairs malformed markup its own way (a ``<div>`` inside a ``<p>``
+    closes the paragraph, unclosed blocks are closed at the end), and it
+    turns ``\\r\\n`` into ``\\n`` in text as HTML5 parsers do.
+
     Args:
         html: The HTML string to convert
+        id_factory: Block ID factory from ``blocknote.converter.block_ids``;
+            defaults to random UUID4 strings
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs, as ``normalize_runs`` does
+        backend: ``"stdlib"`` (``html.parser``) or ``"lxml"``
 
     Returns:
         List of validated Block objects
 
     Raises:
-        ValueError: If HTML parsing fails or produces invalid blocks
+        ValueError: If HTML parsing fails or produces invalid blocks, or
+            the backend is unknown
         TypeError: If input is not a string
     """
     if not isinstance(html, str):
         raise TypeError("Input must be a string")
+    if backend not in HTML_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML backend {backend!r}, expected one of "
+            f"{', '.join(map(repr, HTML_BACKENDS))}"
+        )
 
     if not html.strip():
         return []
 
     try:
-        parser = BlockNoteHTMLParser()
-        parser.feed(html)
+        parser = BlockNoteHTMLParser(id_factory, merge_runs)
+        if backend != "lxml" or not _feed_lxml(parser, html):
+            parser.feed(html)
         return parser.get_blocks()
     except Exception as e:
         raise ValueError(f"Failed to parse HTML: {e}")
 
 
+def iter_html_blocks(
+    source: Union[TextIO, Iterable[str]],
+    id_factory: Optional[IdFactory] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    merge_runs: bool = True,
+) -> Iterator[Block]:
+    """
+    Parses HTML incrementally, yielding each block once it is closed.
+
+    The HTML is fed to the parser a chunk at a time, and the blocks closed
+    by each chunk are yielded before the next one is read, so memory is
+    bounded by the chunk size and the largest block rather than the whole
+    document. The blocks are the same as those of ``html_to_blocks`` on
+    the concatenated text, IDs included when ``id_factory`` is
+    deterministic.
+
+    Args:
+        source: Text file object, or any iterable of str chunks
+        id_factory: Block ID factory from ``blocknote.converter.block_ids``;
+            defaults to random UUID4 strings
+        chunk_size: Number of characters read from a file object at a time
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs, as ``normalize_runs`` does
+
+    Returns:
+        Iterator of validated Block objects
+
+    Raises:
+        TypeError: If source is neither a file object nor an iterable of
+            str chunks
+        ValueError: If HTML parsing fails or produces invalid blocks, or
+            chunk_size < 1
+
+    Example:
+        >>> with open("export.html", encoding="utf-8") as fp:
+        ...     for block in iter_html_blocks(fp):
+        ...         store(block)
+    """
+    chunks = read_chunks(source, chunk_size)
+    parser = BlockNoteHTMLParser(id_factory, merge_runs)
+
+    def generate() -> Iterator[Block]:
+        # Text is fed up to the last "<" seen so far: HTMLParser reports
+        # text that ends a feed right away, which would split a run that
+        # continues in the next chunk into two InlineContent items.
+        pending = ""
+        for chunk in chunks:
+            text = pending + chunk
+            cut = text.rfind("<")
+            if cut <= 0:
+                pending = text
+                continue
+            pending = text[cut:]
+            yield from _feed(parser, text[:cut])
+        if pending:
+            yield from _feed(parser, pending)
+
+    return generate()
+
+
+def _feed(parser: "BlockNoteHTMLParser", html: str) -> List[Block]:
+    """Feed HTML to the parser and take the blocks it completed."""
+    try:
+        parser.feed(html)
+    except Exception as e:
+        raise ValueError(f"Failed to parse HTML: {e}")
+    blocks = parser.blocks
+    parser.blocks = []
+    return blocks
+
+
+_TAG_STYLES = {
+    "strong": {"bold": True},
+    "b": {"bold": True},
+    "em": {"italic": True},
+    "i": {"italic": True},
+    "u": {"underline": True},
+    "s": {"strike": True},
+    "code": {"code": True},
+}
+
+# Elements without an end tag. HTMLParser reports ``<br>`` as a start tag
+# only, so they are kept off the tag stack, which would otherwise grow with
+# every one of them in the document.
+_VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "keygen",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Upper bound on cached style merges; the least recently used merge is
+# dropped when a document has more distinct span styles than this.
+_MAX_SNAPSHOTS = 1024
+
+
+def _feed_lxml(parser: "BlockNoteHTMLParser", html: str) -> bool:
+    """
+    Parse HTML with lxml and replay its tree on the parser's handlers.
+
+    Returns False, before calling any handler, when lxml cannot be
+    imported or cannot parse the whole document faithfully; the caller
+    then feeds the stdlib parser instead.
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        return False
+
+    lxml_parser = etree.HTMLParser(huge_tree=True)
+    try:
+        root = etree.fromstring(html, lxml_parser)
+    except ValueError:
+        # str input with an XML encoding declaration
+        return False
+    if any(
+        error.type == etree.ErrorTypes.ERR_RESOURCE_LIMIT
+        for error in lxml_parser.error_log
+    ):
+        # Nested too deep: libxml2 flattened the excess levels.
+        return False
+    if root is None:
+        return True
+
+    handle_starttag = parser.handle_starttag
+    handle_endtag = parser.handle_endtag
+    handle_data = parser.handle_data
+    events = ("start", "end", "comment", "pi")
+    for event, node in etree.iterwalk(root, events=events):
+        if event == "start":
+            handle_starttag(node.tag, node.items())
+            if node.text:
+                handle_data(node.text)
+            continue
+        if event == "end":
+            handle_endtag(node.tag)
+        if node.tail:
+            handle_data(node.tail)
+    return True
+
+
 class BlockNoteHTMLParser(HTMLParser):
     """Custom HTML parser for converting HTML to BlockNote blocks."""
 
-    def __init__(self):
+    def __init__(
+        self, id_factory: Optional[IdFactory] = None, merge_runs: bool = True
+    ):
         super().__init__()
-        self.blocks = []
-        self.current_block = None
-        self.content_stack = []
-        self.style_stack = []
-        self.tag_stack = []
+        self.next_id = (id_factory or uuid4_ids())()
+        self.merge_runs = merge_runs
+        self.blocks: List[Block] = []
+        self.current_block: Optional[Dict[str, Any]] = None
+        self.content_stack: List[Any] = []
+        # Merged styles of the open inline tags; the base entry is never
+        # popped. Snapshots are shared and must not be modified.
+        self.style_stack: List[Dict[str, Any]] = [{}]
+        self._snapshots: "OrderedDict[Tuple[tuple, tuple], Dict[str, Any]]" = (
+            OrderedDict()
+        )
+        self.tag_stack: List[str] = []
 
     def get_blocks(self) -> List[Block]:
         """Get the parsed blocks."""
@@ -50,7 +262,8 @@ class BlockNoteHTMLParser(HTMLParser):
 
     def handle_starttag(self, tag: str, attrs: List[tuple]):
         """Handle opening HTML tags."""
-        self.tag_stack.append(tag)
+        if tag not in _VOID_TAGS:
+            self.tag_stack.append(tag)
 
         if tag in ["h1", "h2", "h3", "h4", "h5", "h6"]:
             level = int(tag[1])
@@ -140,25 +353,16 @@ class BlockNoteHTMLParser(HTMLParser):
                         "content": [],
                         "styles": {},
                     }
-        elif tag in ["strong", "b"]:
-            self.style_stack.append({"bold": True})
-        elif tag in ["em", "i"]:
-            self.style_stack.append({"italic": True})
-        elif tag == "u":
-            self.style_stack.append({"underline": True})
-        elif tag == "s":
-            self.style_stack.append({"strike": True})
-        elif tag == "code":
-            self.style_stack.append({"code": True})
+        elif tag in _TAG_STYLES:
+            self._push_styles(_TAG_STYLES[tag])
         elif tag == "span":
             style_attr = self._get_attr_value(attrs, "style")
             styles = self._parse_style_attr(style_attr) if style_attr else {}
-            if styles:
-                self.style_stack.append(styles)
+            self._push_styles(styles)
 
     def handle_endtag(self, tag: str):
         """Handle closing HTML tags."""
-        if self.tag_stack:
+        if self.tag_stack and tag not in _VOID_TAGS:
             self.tag_stack.pop()
 
         if tag in [
@@ -176,9 +380,17 @@ class BlockNoteHTMLParser(HTMLParser):
             if self.current_block:
                 if not self.current_block["content"]:
                     self.current_block["content"] = []
+                elif self.merge_runs:
+                    self.current_block["content"] = _merge_runs(
+                        self.current_block["content"]
+                    )[0]
 
                 block = Block(
-                    id=str(uuid.uuid4()),
+                    id=self.next_id(
+                        self.current_block["type"],
+                        self.current_block["props"],
+                        self.current_block["content"],
+                    ),
                     type=self.current_block["type"],
                     props=self.current_block["props"],
                     content=self.current_block["content"],
@@ -186,22 +398,51 @@ class BlockNoteHTMLParser(HTMLParser):
                 )
                 self.blocks.append(block)
                 self.current_block = None
-        elif tag in ["strong", "b", "em", "i", "u", "s", "code", "span"]:
-            if self.style_stack:
+        elif tag in _TAG_STYLES or tag == "span":
+            if len(self.style_stack) > 1:
                 self.style_stack.pop()
 
     def handle_data(self, data: str):
         """Handle text data between HTML tags."""
         if self.current_block is not None and data:
-            combined_styles = {}
-            for style_dict in self.style_stack:
-                combined_styles.update(style_dict)
-
+            # InlineContent copies the dict, so the snapshot stays shared.
             inline_content = InlineContent(
-                type="text", text=data, styles=combined_styles
+                type="text", text=data, styles=self.style_stack[-1]
             )
             self.current_block["content"].append(inline_content)
 
+    def _push_styles(self, styles: Dict[str, Any]) -> None:
+        """
+        Push the styles in effect inside an inline tag.
+
+        Each stack entry is the merged styles of all open inline tags, so
+        text is styled with the top entry alone. Tags that change nothing
+        push the current entry again, and equal merges are looked up in
+        ``_snapshots``, so nested and repeated tags share one dict and a
+        tag seen before under the same styles costs one lookup. The cache
+        is an LRU of at most ``_MAX_SNAPSHOTS`` merges.
+
+        Merges are keyed by the parent's contents, not its ``id()``: once
+        a popped snapshot is freed, a new dict may be given its id.
+        """
+        current = self.style_stack[-1]
+        key = (tuple(current.items()), tuple(styles.items()))
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            self._snapshots.move_to_end(key)
+        else:
+            if all(
+                name in current and current[name] == value
+                for name, value in styles.items()
+            ):
+                snapshot = current
+            else:
+                snapshot = {**current, **styles}
+            if len(self._snapshots) >= _MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+            self._snapshots[key] = snapshot
+        self.style_stack.append(snapshot)
+
     def _get_parent_list_tag(self) -> str:
         """Get the parent list tag (ul or ol) from the tag stack."""
         for tag in reversed(self.tag_stack):
@@ -218,7 +459,7 @@ class BlockNoteHTMLParser(HTMLParser):
 
     def _parse_style_attr(self, style_attr: str) -> Dict[str, Any]:
         """Parse CSS style attribute into a dictionary."""
-        styles = {}
+        styles: Dict[str, Any] = {}
         if not style_attr:
             return styles
 
@@ -236,10 +477,22 @@ class BlockNoteHTMLParser(HTMLParser):
         return styles
 
 
+# "&amp;" is replaced last so that "&amp;lt;" becomes "&lt;", not "<".
+_UNESCAPE_TABLE = (
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&#x27;", "'"),
+    ("&amp;", "&"),
+)
+
+
 def _unescape_html(text: str) -> str:
     """
     Unescape HTML entities in text.
 
+    Exactly reverses ``_escape_html``. Text without ``&`` is returned as is.
+
     Args:
         text: The text to unescape
 
@@ -249,10 +502,9 @@ def _unescape_html(text: str) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    return (
-        text.replace("&amp;", "&")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&quot;", '"')
-        .replace("&#x27;", "'")
-    )
+    if "&" not in text:
+        return text
+
+    for entity, char in _UNESCAPE_TABLE:
+        text = text.replace(entity, char)
+    return text
@@ -0,0 +1,205 @@
+"""
+Incremental HTML rendering of successive revisions of a document.
+
+``IncrementalRenderer`` remembers the top-level blocks of the previous
+revision by ID, together with a JSON snapshot and the rendered HTML of
+each. When the next revision arrives, only blocks that were added or
+changed are rendered again, and a list of fragment patches describes how
+to turn the previous page into the new one.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from blocknote.schema import Block
+
+from .blocknote_to_dict import _dump_json
+from .blocknote_to_html import _convert_block_to_html
+from .traversal import longest_increasing_subsequence
+
+
+class FragmentPatch(NamedTuple):
+    """
+    One change to the rendered fragments of a document.
+
+    ``op`` is one of:
+
+    - ``"remove"``: delete the fragment of ``block_id``
+    - ``"insert"``: insert ``html`` for ``block_id`` right after the
+      fragment of ``after`` (at the start when ``after`` is None)
+    - ``"move"``: move the fragment of ``block_id`` right after ``after``
+    - ``"replace"``: replace the fragment of ``block_id`` with ``html``
+
+    Patches are ordered: removals first, then inserts and moves in the
+    order of the new document, then replacements, so applying them in
+    sequence yields the new document. Blocks that render to an empty
+    string still have an (empty) fragment.
+    """
+
+    op: str
+    block_id: str
+    after: Optional[str] = None
+    html: Optional[str] = None
+
+
+class IncrementalResult(NamedTuple):
+    """The full HTML of a revision and the patches from the previous one."""
+
+    html: str
+    patches: List[FragmentPatch]
+    rendered: int
+
+
+class IncrementalRenderer:
+    """
+    Renders successive revisions of a document, reusing unchanged blocks.
+
+    Blocks are matched by ``id``. By default a block is rendered again
+    when it is new or its JSON snapshot differs from the previous
+    revision, so blocks may be mutated in place. Serializing runs
+    in pydantic-core and costs about as much as the built-in renderers;
+    when the editor already knows which blocks changed, pass their IDs as
+    ``changed`` and unchanged blocks cost a dictionary lookup, so a save
+    scales with the size of the edit.
+
+    Call ``reset()`` after registering a different HTML renderer.
+
+    Example:
+        >>> renderer = IncrementalRenderer()
+        >>> renderer.render(blocks).html == blocks_to_html(blocks)
+        True
+        >>> blocks[3].content[0].text = "Edited"
+        >>> renderer.render(blocks).patches
+        [FragmentPatch(op='replace', block_id='4', after=None, html='<p>...')]
+    """
+
+    def __init__(self):
+        self._order: List[str] = []
+        self._fragments: Dict[str, str] = {}
+        self._snapshots: Dict[str, bytes] = {}
+
+    def render(
+        self, blocks: List[Block], changed: Optional[Iterable[str]] = None
+    ) -> IncrementalResult:
+        """
+        Renders a revision and diffs it against the previous one.
+
+        Args:
+            blocks: List of Block objects with unique top-level IDs
+            changed: Optional IDs of the top-level blocks modified since
+                the previous revision (including edits to their children).
+                Other known blocks are reused without being compared.
+
+        Returns:
+            IncrementalResult with the full HTML (identical to
+            ``blocks_to_html(blocks)``), the fragment patches and the
+            number of blocks that were rendered
+
+        Raises:
+            TypeError: If input is not a list
+            ValueError: If a block cannot be converted, is not a Block, or
+                its ID repeats
+        """
+        if not isinstance(blocks, list):
+            raise TypeError("Input must be a list of Block objects")
+
+        if changed is not None:
+            changed = set(changed)
+        order: List[str] = []
+        fragments: Dict[str, str] = {}
+        snapshots: Dict[str, bytes] = {}
+        replaced: List[str] = []
+        for i, block in enumerate(blocks):
+            try:
+                if not isinstance(block, Block):
+                    raise TypeError(
+                        f"Item at index {i} must be a Block object, "
+                        f"got {type(block)}"
+                    )
+                block_id = block.id
+                if block_id in fragments:
+                    raise ValueError(f"Duplicate block id {block_id!r}")
+
+                previous = self._snapshots.get(block_id)
+                if (
+                    previous is not None
+                    and changed is not None
+                    and block_id not in changed
+                ):
+                    snapshot = previous  # known and declared unchanged
+                else:
+                    snapshot = _dump_json([block])
+                if snapshot == previous:
+                    fragment = self._fragments[block_id]
+                else:
+                    fragment = _convert_block_to_html(block)
+                    if block_id in self._fragments:
+                        replaced.append(block_id)
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to convert block at index {i} to HTML: {e}"
+                )
+            order.append(block_id)
+            fragments[block_id] = fragment
+            snapshots[block_id] = snapshot
+
+        patches = self._diff(order, fragments, replaced)
+        rendered = len(replaced) + sum(
+            patch.op == "insert" for patch in patches
+        )
+
+        self._order = order
+        self._fragments = fragments
+        self._snapshots = snapshots
+        html = "\n".join(
+            fragments[block_id] for block_id in order if fragments[block_id]
+        )
+        return IncrementalResult(html, patches, rendered)
+
+    def reset(self) -> None:
+        """Forget the previous revision; the next render is a full one."""
+        self._order = []
+        self._fragments = {}
+        self._snapshots = {}
+
+    def _diff(
+        self,
+        order: List[str],
+        fragments: Dict[str, str],
+        replaced: List[str],
+    ) -> List[FragmentPatch]:
+        previous = self._fragments
+        patches = [
+            FragmentPatch("remove", block_id)
+            for block_id in self._order
+            if block_id not in fragments
+        ]
+
+        old_position = {
+            block_id: position
+            for position, block_id in enumerate(
+                block_id for block_id in self._order if block_id in fragments
+            )
+        }
+        kept = [block_id for block_id in order if block_id in previous]
+        stable = {
+            kept[i]
+            for i in longest_increasing_subsequence(
+                [old_position[block_id] for block_id in kept]
+            )
+        }
+
+        after = None
+        for block_id in order:
+            if block_id not in previous:
+                patches.append(
+                    FragmentPatch("insert", block_id, after, fragments[block_id])
+                )
+            elif block_id not in stable:
+                patches.append(FragmentPatch("move", block_id, after))
+            after = block_id
+
+        patches.extend(
+            FragmentPatch("replace", block_id, html=fragments[block_id])
+            for block_id in replaced
+        )
+        return patches
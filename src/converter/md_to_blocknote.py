@@ -1,16 +1,48 @@
-import uuid
-from typing import List, Tuple
+import io
+import re
+import tempfile
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
 
 from blocknote.schema import Block, InlineContent
 from markdown_it import MarkdownIt
+from markdown_it.rules_core import StateCore
 
+from .block_ids import IdFactory, IdGenerator, uuid4_ids
+from .inline_runs import merge_runs as _merge_runs
+from .streaming import DEFAULT_CHUNK_SIZE, read_chunks
 
-def markdown_to_blocks(markdown: str) -> List[Block]:
+
+def markdown_to_blocks(
+    markdown: str,
+    id_factory: Optional[IdFactory] = None,
+    merge_runs: bool = True,
+) -> List[Block]:
     """
     Converts a Markdown string to a list of Block objects.
 
+    Uses a shared ``MarkdownConverter`` with the default MarkdownIt
+    configuration, so the parser is only built once per process.
+
     Args:
         markdown: The markdown string to convert
+        id_factory: Block ID factory from ``blocknote.converter.block_ids``;
+            defaults to random UUID4 strings
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs, as ``normalize_runs`` does
 
     Returns:
         List of validated Block objects
@@ -19,54 +51,452 @@ def markdown_to_blocks(markdown: str) -> List[Block]:
         ValueError: If markdown parsing fails or produces invalid blocks
         TypeError: If input is not a string
     """
-    if not isinstance(markdown, str):
-        raise TypeError("Input must be a string")
+    return _default_converter().convert(markdown, id_factory, merge_runs)
+
+
+def iter_markdown_blocks(
+    source: Union[TextIO, Iterable[str]],
+    id_factory: Optional[IdFactory] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    merge_runs: bool = True,
+) -> Iterator[Block]:
+    """
+    Parses Markdown incrementally, yielding blocks section by section.
+
+    Uses the shared converter of ``markdown_to_blocks``; see
+    ``MarkdownConverter.iter_convert``.
+
+    Args:
+        source: Text file object, or any iterable of str chunks
+        id_factory: Block ID factory from ``blocknote.converter.block_ids``;
+            defaults to random UUID4 strings
+        chunk_size: Number of characters read from a file object at a time,
+            and the size from which a section may be split
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs, as ``normalize_runs`` does
+
+    Returns:
+        Iterator of validated Block objects
+
+    Raises:
+        TypeError: If source is neither a file object nor an iterable of
+            str chunks
+        ValueError: If markdown parsing fails or produces invalid blocks,
+            or chunk_size < 1
+
+    Example:
+        >>> with open("archive.md", encoding="utf-8") as fp:
+        ...     for block in iter_markdown_blocks(fp):
+        ...         store(block)
+    """
+    return _default_converter().iter_convert(
+        source, id_factory, chunk_size, merge_runs
+    )
+
+
+class MarkdownConverter:
+    """
+    Reusable Markdown to blocks converter.
+
+    Holds a configured ``MarkdownIt`` parser so that its rule chains are
+    built once instead of on every call. ``MarkdownIt.parse`` keeps all
+    per-call state in a fresh state object, so a configured converter can
+    be shared between threads.
+
+    Args:
+        preset: MarkdownIt preset name, e.g. "commonmark" or "gfm-like"
+        options: MarkdownIt options overriding the preset
+        plugins: markdown-it-py plugins applied with ``MarkdownIt.use``
+        id_factory: Block ID factory from ``blocknote.converter.block_ids``;
+            defaults to random UUID4 strings
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs, as ``normalize_runs`` does
+
+    Example:
+        >>> converter = MarkdownConverter("gfm-like")
+        >>> converter.convert("# Title")[0].type
+        'heading'
+    """
+
+    def __init__(
+        self,
+        preset: str = "commonmark",
+        options: Optional[Dict[str, Any]] = None,
+        plugins: Iterable[Callable[..., None]] = (),
+        id_factory: Optional[IdFactory] = None,
+        merge_runs: bool = True,
+    ):
+        self.parser = MarkdownIt(preset, options)
+        for plugin in plugins:
+            self.parser.use(plugin)
+        self.id_factory = id_factory or uuid4_ids()
+        self.merge_runs = merge_runs
+
+    def convert(
+        self,
+        markdown: str,
+        id_factory: Optional[IdFactory] = None,
+        merge_runs: Optional[bool] = None,
+    ) -> List[Block]:
+        """
+        Converts a Markdown string to a list of Block objects.
+
+        Args:
+            markdown: The markdown string to convert
+            id_factory: Overrides the converter's ID factory for this call
+            merge_runs: Overrides the converter's ``merge_runs`` setting
+
+        Returns:
+            List of validated Block objects
+
+        Raises:
+            ValueError: If markdown parsing fails or produces invalid blocks
+            TypeError: If input is not a string
+        """
+        if not isinstance(markdown, str):
+            raise TypeError("Input must be a string")
+
+        if not markdown.strip():
+            return []
+
+        try:
+            next_id = (id_factory or self.id_factory)()
+            if merge_runs is None:
+                merge_runs = self.merge_runs
+            return _tokens_to_blocks(
+                self.parser.parse(markdown), next_id, merge_runs
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to parse markdown: {e}")
+
+    def iter_convert(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        id_factory: Optional[IdFactory] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        merge_runs: Optional[bool] = None,
+    ) -> Iterator[Block]:
+        """
+        Parses Markdown incrementally, yielding blocks section by section.
 
-    if not markdown.strip():
-        return []
+        Once ``chunk_size`` characters are buffered, the input is split at
+        the next blank line followed by a line that starts a new top-level
+        block, i.e. outside fences, HTML blocks, lists and quotes. Each
+        section is parsed on its own and its blocks are yielded before the
+        next section is read, so memory scales with the largest section
+        rather than the file. The blocks are the same as those of
+        ``convert`` on the whole text, IDs included when ``id_factory`` is
+        deterministic.
 
-    try:
-        md = MarkdownIt()
-        tokens = md.parse(markdown)
-        blocks = []
+        Link reference definitions apply to the whole document, so input
+        containing ``]:`` is first scanned for them. Seekable file objects
+        are simply read twice; any other source is spooled to a temporary
+        file first, so its first block is only yielded once it has been
+        read to the end.
 
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
+        Args:
+            source: Text file object, or any iterable of str chunks
+            id_factory: Overrides the converter's ID factory
+            chunk_size: Number of characters read from a file object at
+                a time, and the size from which a section may be split
+            merge_runs: Overrides the converter's ``merge_runs`` setting
+
+        Returns:
+            Iterator of validated Block objects
+
+        Raises:
+            TypeError: If source is neither a file object nor an iterable
+                of str chunks
+            ValueError: If markdown parsing fails or produces invalid
+                blocks, or chunk_size < 1
+        """
+        if isinstance(source, str):
+            source = io.StringIO(source)
+        chunks = read_chunks(source, chunk_size)
+        seekable = hasattr(source, "seekable") and source.seekable()
+        if merge_runs is None:
+            merge_runs = self.merge_runs
+
+        def generate() -> Iterator[Block]:
+            spool: Optional[TextIO] = None
             try:
-                if token.type == "heading_open":
-                    block = _parse_heading(tokens, i)
-                    blocks.append(block)
-                    i += 3
-                elif token.type == "paragraph_open":
-                    block = _parse_paragraph(tokens, i)
-                    blocks.append(block)
-                    i += 3
-                elif (
-                    token.type == "bullet_list_open"
-                    or token.type == "ordered_list_open"
-                ):
-                    block, skip_count = _parse_list(tokens, i)
-                    blocks.append(block)
-                    i += skip_count
-                elif token.type == "blockquote_open":
-                    block = _parse_quote(tokens, i)
-                    blocks.append(block)
-                    i += 3
+                if seekable:
+                    fp = cast(TextIO, source)
                 else:
-                    i += 1
+                    fp = spool = tempfile.TemporaryFile(
+                        "w+", encoding="utf-8", newline=""
+                    )
+                    for chunk in chunks:
+                        spool.write(chunk)
+                    spool.seek(0)
+                env = self._collect_references(fp, chunk_size)
+                next_id = (id_factory or self.id_factory)()
+                lines = _iter_lines(read_chunks(fp, chunk_size))
+                offset = 0
+                parse = self._parser(env)
+                for tokens in _split_sections(lines, parse, chunk_size):
+                    blocks: List[Block] = []
+                    try:
+                        offset = _convert_tokens(
+                            tokens, offset, next_id, blocks, merge_runs
+                        )
+                    except Exception as e:
+                        raise ValueError(f"Failed to parse markdown: {e}")
+                    yield from blocks
+            finally:
+                if spool is not None:
+                    spool.close()
+
+        return generate()
+
+    def _parser(
+        self, env: Dict[str, Any], block_only: bool = False
+    ) -> Callable[[str], List]:
+        """Return a function parsing text to tokens with a shared ``env``."""
+        rules = list(
+            zip(
+                self.parser.core.ruler.get_active_rules(),
+                self.parser.core.ruler.getRules(""),
+            )
+        )
+
+        def parse(text: str) -> List:
+            try:
+                state = StateCore(text, self.parser, env)
+                for name, rule in rules:
+                    rule(state)
+                    if block_only and name == "block":
+                        break
+                return state.tokens
             except Exception as e:
-                raise ValueError(
-                    f"Failed to parse markdown token at position {i}: {e}"
-                )
+                raise ValueError(f"Failed to parse markdown: {e}")
+
+        return parse
+
+    def _collect_references(
+        self, fp: TextIO, chunk_size: int
+    ) -> Dict[str, Any]:
+        """
+        Collect the link reference definitions of a seekable file.
+
+        Only block rules are run, and only when the text contains ``]:``,
+        which ends every definition label. The file is rewound afterwards.
+        """
+        env: Dict[str, Any] = {}
+        start = fp.tell()
+        previous = ""
+        for chunk in read_chunks(fp, chunk_size):
+            if "]:" in previous + chunk[:1] or "]:" in chunk:
+                fp.seek(start)
+                lines = _iter_lines(read_chunks(fp, chunk_size))
+                parse = self._parser(env, block_only=True)
+                for _ in _split_sections(lines, parse, chunk_size):
+                    pass
+                break
+            previous = chunk[-1:]
+        fp.seek(start)
+        return env
+
+
+@lru_cache(maxsize=None)
+def _default_converter() -> MarkdownConverter:
+    """Return the process-wide converter used by ``markdown_to_blocks``."""
+    return MarkdownConverter()
 
-        return blocks
 
-    except Exception as e:
-        raise ValueError(f"Failed to parse markdown: {e}")
+def _tokens_to_blocks(
+    tokens: List, next_id: IdGenerator, merge_runs: bool = True
+) -> List[Block]:
+    """Convert a markdown-it token stream into Block objects."""
+    blocks: List[Block] = []
+    _convert_tokens(tokens, 0, next_id, blocks, merge_runs)
+    return blocks
+
+
+def _convert_tokens(
+    tokens: List,
+    start: int,
+    next_id: IdGenerator,
+    blocks: List[Block],
+    merge_runs: bool = True,
+) -> int:
+    """
+    Append the blocks of ``tokens`` from index ``start`` to ``blocks``.
+
+    Returns how far the last skip went past the end of ``tokens``, which
+    is where the next section of a stream starts (an empty blockquote is
+    two tokens but skips three).
+    """
+    i = start
+    while i < len(tokens):
+        token = tokens[i]
+        try:
+            if token.type == "heading_open":
+                block = _parse_heading(tokens, i, next_id, merge_runs)
+                blocks.append(block)
+                i += 3
+            elif token.type == "paragraph_open":
+                block = _parse_paragraph(tokens, i, next_id, merge_runs)
+                blocks.append(block)
+                i += 3
+            elif (
+                token.type == "bullet_list_open"
+                or token.type == "ordered_list_open"
+            ):
+                block, skip_count = _parse_list(tokens, i, next_id)
+                blocks.append(block)
+                i += skip_count
+            elif token.type == "blockquote_open":
+                block = _parse_quote(tokens, i, next_id, merge_runs)
+                blocks.append(block)
+                i += 3
+            else:
+                i += 1
+        except Exception as e:
+            raise ValueError(
+                f"Failed to parse markdown token at position {i}: {e}"
+            )
+
+    return i - len(tokens)
+
+
+_NEWLINE = re.compile(r"\r\n?|\n")
+_LIST_MARKER = re.compile(r"(?:[-+*]|\d{1,9}[.)])(?:[ \t]|$)")
+_FENCE_OPEN = re.compile(r" {0,3}(`{3,}|~{3,})(.*)")
+# Openers of the HTML blocks that blank lines do not end (CommonMark
+# types 1-5), in the order of the patterns that end them.
+_HTML_BLOCK_OPEN = re.compile(
+    r" {0,3}<(?:((?:script|pre|style|textarea)(?:[ \t>]|$))|(!--)|(\?)"
+    r"|(![A-Za-z])|(!\[CDATA\[))",
+    re.IGNORECASE,
+)
+_HTML_BLOCK_CLOSE = (
+    re.compile(r"</(?:script|pre|style|textarea)>", re.IGNORECASE),
+    re.compile(r"-->"),
+    re.compile(r"\?>"),
+    re.compile(r">"),
+    re.compile(r"\]\]>"),
+)
+
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split text chunks into lines ending with ``"\n"``.
+
+    Line endings are normalized the way markdown-it does it (``"\r\n"``
+    and ``"\r"`` become ``"\n"``), so line numbers in token maps match.
+    """
+    pending = ""
+    for chunk in chunks:
+        text = pending + chunk
+        held = ""
+        if text.endswith("\r"):  # may be the first half of "\r\n"
+            text, held = text[:-1], "\r"
+        lines = _NEWLINE.split(text)
+        pending = lines.pop() + held
+        for line in lines:
+            yield line + "\n"
+    lines = _NEWLINE.split(pending)
+    last = lines.pop()
+    for line in lines:
+        yield line + "\n"
+    if last:
+        yield last
 
 
-def _parse_heading(tokens: List, start_idx: int) -> Block:
+def _split_sections(
+    lines: Iterable[str], parse: Callable[[str], List], min_size: int
+) -> Iterator[List]:
+    """
+    Yield the tokens of consecutive top-level sections of a document.
+
+    Sections hold at least ``min_size`` characters where possible, which
+    keeps the number of parser calls low. A section may end before a line
+    at column 0 that follows a blank line, is not a list marker and is not
+    inside a fence or an HTML block that blank lines do not end. These
+    checks only rule candidates out: the split is made when parsing the
+    section plus that line shows the line starting a new top-level block,
+    since later lines cannot change how the lines before it were parsed.
+    """
+    buffer: List[str] = []
+    size = 0
+    has_content = False
+    blank = False
+    closer: Optional[Pattern] = None  # ends the open fence or HTML block
+    for line in lines:
+        size += len(line)
+        if closer is not None:
+            buffer.append(line)
+            if closer.search(line):
+                closer = None
+            blank = False
+            continue
+        if not line.strip():
+            buffer.append(line)
+            blank = True
+            continue
+
+        if (
+            blank
+            and size > min_size
+            and has_content
+            and line[0] not in " \t"
+            and not _LIST_MARKER.match(line)
+        ):
+            tokens = parse("".join(buffer) + line)
+            end = _section_end(tokens, len(buffer))
+            if end is not None:
+                yield tokens[:end]
+                buffer = []
+                size = len(line)
+        buffer.append(line)
+        has_content = True
+        blank = False
+        closer = _block_closer(line)
+
+    if has_content:
+        yield parse("".join(buffer))
+
+
+def _section_end(tokens: List, line: int) -> Optional[int]:
+    """
+    Index of the first token of the section starting at ``line``, or None
+    if the line continues a block before it.
+
+    A line that starts no token (a link reference definition) also ends
+    the section when no earlier block reaches it; otherwise the section
+    would never be split and every later candidate would parse it again.
+    """
+    for index, token in enumerate(tokens):
+        if token.level == 0 and token.map:
+            if token.map[0] >= line:
+                return index if token.map[0] == line else None
+            if token.map[1] > line:
+                return None
+    return len(tokens)
+
+
+def _block_closer(line: str) -> Optional[Pattern]:
+    """Pattern ending the fence or HTML block ``line`` opens, if any."""
+    fence = _FENCE_OPEN.match(line)
+    if fence:
+        marker, info = fence.groups()
+        if marker[0] == "`" and "`" in info:
+            return None  # not a fence
+        return re.compile(
+            "^ {0,3}" + re.escape(marker[0]) + "{%d,}[ \t]*$" % len(marker)
+        )
+    html = _HTML_BLOCK_OPEN.match(line)
+    if html and html.lastindex:  # each alternative is a group
+        closer = _HTML_BLOCK_CLOSE[html.lastindex - 1]
+        if not closer.search(line):
+            return closer
+    return None
+
+
+def _parse_heading(
+    tokens: List, start_idx: int, next_id: IdGenerator, merge_runs: bool
+) -> Block:
     """Parse a heading token sequence into a Block."""
     token = tokens[start_idx]
     level = int(token.tag[1])
@@ -77,20 +507,25 @@ def _parse_heading(tokens: List, start_idx: int) -> Block:
         and hasattr(content_token, "children")
         and content_token.children
     ):
-        content = _parse_inline_content(content_token.children)
+        content = _parse_inline_content(
+            content_token.children, merge_runs
+        )
     else:
         content = []
 
+    props = {"level": level}
     return Block(
-        id=str(uuid.uuid4()),
+        id=next_id("heading", props, content),
         type="heading",
-        props={"level": level},
+        props=props,
         content=content,
         children=[],
     )
 
 
-def _parse_paragraph(tokens: List, start_idx: int) -> Block:
+def _parse_paragraph(
+    tokens: List, start_idx: int, next_id: IdGenerator, merge_runs: bool
+) -> Block:
     """Parse a paragraph token sequence into a Block."""
     content_token = tokens[start_idx + 1]
     if (
@@ -98,16 +533,23 @@ def _parse_paragraph(tokens: List, start_idx: int) -> Block:
         and hasattr(content_token, "children")
         and content_token.children
     ):
-        content = _parse_inline_content(content_token.children)
+        content = _parse_inline_content(
+            content_token.children, merge_runs
+        )
     else:
         content = []
 
     return Block(
-        id=str(uuid.uuid4()), type="paragraph", content=content, children=[]
+        id=next_id("paragraph", {}, content),
+        type="paragraph",
+        content=content,
+        children=[],
     )
 
 
-def _parse_list(tokens: List, start_idx: int) -> Tuple[Block, int]:
+def _parse_list(
+    tokens: List, start_idx: int, next_id: IdGenerator
+) -> Tuple[Block, int]:
     """
     Parse a list token sequence into a Block.
 
@@ -120,12 +562,19 @@ def _parse_list(tokens: List, start_idx: int) -> Tuple[Block, int]:
         else "numberedListItem"
     )
     return (
-        Block(id=str(uuid.uuid4()), type=list_type, content=[], children=[]),
+        Block(
+            id=next_id(list_type, {}, []),
+            type=list_type,
+            content=[],
+            children=[],
+        ),
         3,
     )
 
 
-def _parse_quote(tokens: List, start_idx: int) -> Block:
+def _parse_quote(
+    tokens: List, start_idx: int, next_id: IdGenerator, merge_runs: bool
+) -> Block:
     """Parse a blockquote token sequence into a Block."""
     paragraph_token = tokens[start_idx + 1]
     if paragraph_token.type == "paragraph_open":
@@ -135,23 +584,32 @@ def _parse_quote(tokens: List, start_idx: int) -> Block:
             and hasattr(content_token, "children")
             and content_token.children
         ):
-            content = _parse_inline_content(content_token.children)
+            content = _parse_inline_content(
+                content_token.children, merge_runs
+            )
         else:
             content = []
     else:
         content = []
 
     return Block(
-        id=str(uuid.uuid4()), type="quote", content=content, children=[]
+        id=next_id("quote", {}, content),
+        type="quote",
+        content=content,
+        children=[],
     )
 
 
-def _parse_inline_content(children: List) -> List[InlineContent]:
+def _parse_inline_content(
+    children: List, merge_runs: bool = True
+) -> List[InlineContent]:
     """
     Parse markdown-it inline content tokens into InlineContent objects.
 
     Args:
         children: List of inline tokens from markdown-it
+        merge_runs: Merge adjacent runs with equal styles and drop empty
+            runs
 
     Returns:
         List of InlineContent objects
@@ -200,4 +658,6 @@ def _parse_inline_content(children: List) -> List[InlineContent]:
         else:
             i += 1
 
+    if merge_runs:
+        content = _merge_runs(content)[0]
     return content
@@ -0,0 +1,283 @@
+"""
+Content-addressed cache of rendered block fragments.
+
+``blocks_to_html`` and ``blocks_to_markdown`` accept a ``RenderCache`` and
+reuse the fragment of every top-level block whose type, props, content and
+children were rendered before. Keys are built from that content, not from
+the block ID, so an unchanged block hits the cache across edits, documents
+and, through a persistent backend keyed by ``block_fingerprint``,
+processes.
+
+Fragments are kept in an in-memory LRU bounded by entry count and total
+characters. An optional ``CacheBackend`` acts as a second level, e.g.
+``SqliteCacheBackend`` for a cache shared by worker processes.
+
+Renderers are not part of the key: after ``register_html_renderer`` or
+``register_markdown_renderer`` changes the output of a block type, call
+``RenderCache.clear()``. Block IDs are not part of it either, so blocks
+with the same content share a fragment; renderers whose output includes
+block IDs (e.g. anchors) need ``RenderCache(include_ids=True)``.
+"""
+
+import hashlib
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional, Tuple
+
+from blocknote.schema import Block
+
+from .fingerprint import block_fingerprint, shallow_json, shallow_key
+
+
+class CacheStats(NamedTuple):
+    """Counters of a ``RenderCache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    chars: int
+
+
+class CacheBackend(ABC):
+    """
+    Second-level store for rendered fragments.
+
+    Subclasses must implement ``get`` and ``set``; ``clear`` and ``close``
+    are optional. Keys and values are strings.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the fragment stored under ``key``, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a fragment under ``key``."""
+
+    def clear(self) -> None:
+        """Remove every stored fragment."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Fragment store in a SQLite database file.
+
+    Args:
+        path: Database file, created if missing (``":memory:"`` also works)
+    """
+
+    def __init__(self, path: str):
+        # Imported here so that the in-memory cache does not load sqlite3.
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fragments "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM fragments WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fragments (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM fragments")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class RenderCache:
+    """
+    LRU cache of rendered fragments keyed by block content.
+
+    One cache can serve both converters; HTML and Markdown fragments are
+    stored under separate keys. The cache is safe to share between
+    threads.
+
+    Keys leave out block IDs, so by default a block gets the fragment of
+    any block with the same content. That is right for the built-in
+    renderers, which never output IDs; set ``include_ids`` when a custom
+    renderer does.
+
+    Args:
+        max_entries: Maximum number of fragments kept in memory
+        max_chars: Maximum total length of the fragments kept in memory,
+            or None for no limit
+        backend: Optional second-level store consulted on memory misses
+            and written on every render
+        include_ids: Also key fragments by the IDs of the block and its
+            descendants
+
+    Example:
+        >>> cache = RenderCache(max_entries=10_000)
+        >>> html = blocks_to_html(blocks, cache=cache)
+        >>> cache.stats()
+        CacheStats(hits=0, misses=12, evictions=0, entries=12, chars=845)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_chars: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        include_ids: bool = False,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_chars is not None and max_chars < 1:
+            raise ValueError("max_chars must be at least 1")
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.backend = backend
+        self.include_ids = include_ids
+        self._fragments: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(
+        self, block: Block, fmt: str, renderer: Callable[[Block], str]
+    ) -> str:
+        """
+        Return the cached ``fmt`` fragment of ``block``, rendering it with
+        ``renderer`` on a miss.
+
+        Args:
+            block: Block to render
+            fmt: Output format name used to separate keys, e.g. ``"html"``
+            renderer: Callable producing the fragment of the block
+
+        Returns:
+            The rendered fragment
+        """
+        ids = _subtree_ids(block) if self.include_ids else ()
+        key: Hashable
+        try:
+            key = (fmt, _content_key(block), ids)
+            hash(key)
+        except TypeError:  # unhashable prop or style value
+            key = (fmt, _json_key(block), ids)
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+
+        backend = self.backend
+        backend_key = None
+        if backend is not None:
+            backend_key = f"{fmt}:{block_fingerprint(block)}"
+            if ids:
+                backend_key += f":{_ids_digest(ids)}"
+            fragment = backend.get(backend_key)
+        if fragment is not None:
+            with self._lock:
+                self.hits += 1
+                self._store(key, fragment)
+            return fragment
+
+        fragment = renderer(block)
+        if backend is not None and backend_key is not None:
+            backend.set(backend_key, fragment)
+        with self._lock:
+            self.misses += 1
+            self._store(key, fragment)
+        return fragment
+
+    def stats(self) -> CacheStats:
+        """Return the hit, miss and eviction counters and the cache size."""
+        with self._lock:
+            return CacheStats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._fragments),
+                self._chars,
+            )
+
+    def clear(self) -> None:
+        """Drop every fragment, including the backend's, and the counters."""
+        with self._lock:
+            self._fragments.clear()
+            self._chars = 0
+            self.hits = self.misses = self.evictions = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def _store(self, key: Hashable, fragment: str) -> None:
+        """Insert a fragment and evict LRU entries; caller holds the lock."""
+        if self.max_chars is not None and len(fragment) > self.max_chars:
+            return  # would evict everything and still not fit
+        previous = self._fragments.pop(key, None)
+        if previous is not None:
+            self._chars -= len(previous)
+        self._fragments[key] = fragment
+        self._chars += len(fragment)
+        while len(self._fragments) > self.max_entries or (
+            self.max_chars is not None and self._chars > self.max_chars
+        ):
+            _, evicted = self._fragments.popitem(last=False)
+            self._chars -= len(evicted)
+            self.evictions += 1
+
+
+def _content_key(block: Block) -> Tuple:
+    """
+    Hashable key of a block's type, props, content and children.
+
+    Children are covered by the block's fingerprint, which is computed
+    without recursion, so deeply nested blocks get a fixed-size key.
+    """
+    return (
+        shallow_key(block),
+        block_fingerprint(block) if block.children else (),
+    )
+
+
+def _json_key(block: Block) -> str:
+    """Key for blocks whose props or styles hold unhashable values."""
+    children = block_fingerprint(block) if block.children else ""
+    return f"{shallow_json(block)}[{children}]"
+
+
+def _subtree_ids(block: Block) -> Tuple[str, ...]:
+    """IDs of a block and its descendants in pre-order, without recursion."""
+    ids = []
+    stack = [block]
+    while stack:
+        node = stack.pop()
+        ids.append(node.id)
+        stack.extend(reversed(node.children))
+    return tuple(ids)
+
+
+def _ids_digest(ids: Tuple[str, ...]) -> str:
+    payload = json.dumps(ids, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
@@ -0,0 +1,91 @@
+"""
+Helpers shared by the streaming HTML and Markdown converters.
+
+``check_iterable`` and ``read_chunks`` take ``Any``: they are the runtime
+checks of inputs that the public converters annotate precisely.
+"""
+
+from typing import Any, Iterable, Iterator, List
+
+from blocknote.schema import Block
+
+# Characters buffered per chunk by the streaming renderers.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def check_iterable(blocks: Any) -> Iterable[Block]:
+    """Reject strings and non-iterables before streaming starts."""
+    if isinstance(blocks, (str, bytes)) or not hasattr(blocks, "__iter__"):
+        raise TypeError("Input must be an iterable of Block objects")
+    return blocks
+
+
+def read_chunks(
+    source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Iterate over the text of a file object or an iterable of chunks.
+
+    Objects with a ``read`` method are read ``chunk_size`` characters at a
+    time; other iterables are passed through and a single ``str`` is one
+    chunk.
+
+    Raises:
+        TypeError: If source is neither readable nor iterable (raised
+            immediately), or a chunk is not a str (raised on iteration)
+        ValueError: If chunk_size < 1 (raised immediately)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(source, str):
+        chunks: Iterable[str] = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), "")
+    elif isinstance(source, bytes) or not hasattr(source, "__iter__"):
+        raise TypeError(
+            "Input must be a text file object or an iterable of str chunks"
+        )
+    else:
+        chunks = source
+
+    def generate() -> Iterator[str]:
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError(f"Chunks must be str, got {type(chunk)}")
+            yield chunk
+
+    return generate()
+
+
+def join_chunked(
+    elements: Iterator[str], separator: str, chunk_size: int
+) -> Iterator[str]:
+    """
+    Join elements with ``separator``, yielding the text in chunks.
+
+    Each chunk except the last holds at least ``chunk_size`` characters;
+    concatenating the chunks equals ``separator.join(elements)``.
+
+    Raises:
+        ValueError: If chunk_size < 1 (raised immediately, not on iteration)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    def generate() -> Iterator[str]:
+        buffer: List[str] = []
+        size = 0
+        for index, element in enumerate(elements):
+            if index:
+                buffer.append(separator)
+                size += len(separator)
+            buffer.append(element)
+            size += len(element)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    return generate()
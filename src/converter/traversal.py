@@ -0,0 +1,125 @@
+"""
+Helpers shared by the converters that walk nested blocks.
+
+Block trees are walked with explicit stacks rather than recursion, so
+nesting depth is not limited by ``sys.getrecursionlimit()``. Converters
+that accept ``max_depth`` use the depth checks to reject pathologically
+nested input up front. ``longest_increasing_subsequence`` tells moved
+siblings apart from shifted ones for ``diff_blocks`` and
+``IncrementalRenderer``, and ``block_position`` and
+``update_block_fields`` are the in-place edits shared by ``apply_patch``
+and ``Document``.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from blocknote.schema import Block
+
+
+def depth_error(max_depth: int) -> ValueError:
+    """Error raised when blocks are nested deeper than ``max_depth``."""
+    return ValueError(f"Blocks are nested deeper than max_depth={max_depth}")
+
+
+def check_max_depth(max_depth: Optional[int]) -> None:
+    """Reject a ``max_depth`` argument below 1."""
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be at least 1")
+
+
+def check_depth(blocks: Sequence[Union[Block, Any]], max_depth: int) -> None:
+    """
+    Raise ``depth_error`` if ``blocks`` nest deeper than ``max_depth``.
+
+    Accepts Block objects or block dictionaries; top-level blocks are at
+    depth 1. Malformed ``children`` values are skipped and left for
+    validation to report.
+
+    Raises:
+        ValueError: If max_depth < 1 or the blocks nest deeper
+    """
+    check_max_depth(max_depth)
+    stack = [(blocks, 1)]
+    while stack:
+        siblings, depth = stack.pop()
+        if depth > max_depth:
+            raise depth_error(max_depth)
+        for block in siblings:
+            if isinstance(block, dict):
+                children = block.get("children")
+            else:
+                children = getattr(block, "children", None)
+            if children and isinstance(children, list):
+                stack.append((children, depth + 1))
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> List[int]:
+    """
+    Indices of one longest strictly increasing subsequence of ``values``.
+
+    Elements outside it are the fewest that must move to sort the sequence,
+    which is how moved blocks are told apart from blocks that merely
+    shifted. Runs in O(n log n).
+    """
+    tails: List[int] = []  # smallest tail value of each subsequence length
+    tail_indices: List[int] = []
+    predecessors: List[int] = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[length] = value
+            tail_indices[length] = i
+        predecessors[i] = tail_indices[length - 1] if length else -1
+
+    result = []
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        result.append(i)
+        i = predecessors[i]
+    result.reverse()
+    return result
+
+
+def block_position(siblings: List[Block], block: Block) -> int:
+    """
+    Index of ``block`` among ``siblings`` by identity (Block equality
+    compares fields, so ``list.index`` could find an equal twin).
+
+    Raises:
+        ValueError: If the block is not in the list
+    """
+    for position, sibling in enumerate(siblings):
+        if sibling is block:
+            return position
+    raise ValueError(f"block {block.id!r} is not among its parent's children")
+
+
+def update_block_fields(block: Block, fields: Dict[str, Any]) -> None:
+    """
+    Set ``type``, ``props`` and/or ``content`` of a block in place.
+
+    The new values are validated together with the fields that are kept,
+    as ``Block`` would validate them, before any of them is assigned;
+    content may be a string or InlineContent objects or dicts.
+
+    Raises:
+        ValueError: If another field is given or a value is invalid
+    """
+    for field in fields:
+        if field not in ("type", "props", "content"):
+            raise ValueError(f"cannot update field {field!r}")
+    validated = Block.model_validate(
+        {
+            "id": block.id,
+            "type": block.type,
+            "props": block.props,
+            "content": block.content,
+            **fields,
+        }
+    )
+    for field in fields:
+        setattr(block, field, getattr(validated, field))
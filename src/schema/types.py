@@ -9,7 +9,14 @@ working with Blocknote data structures.
 from enum import Enum
 from typing import Any, Dict, List, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+)
 
 
 class TextAlignment(str, Enum):
@@ -54,6 +61,8 @@ class InlineContent(BaseModel):
         styles: Dictionary of styling properties (e.g., {"bold": True})
     """
 
+    model_config = ConfigDict(use_enum_values=True)
+
     type: InlineContentType = Field(
         ..., description="The type of inline content"
     )
@@ -62,9 +71,6 @@ class InlineContent(BaseModel):
         default_factory=dict, description="Styling properties"
     )
 
-    class Config:
-        use_enum_values = True
-
 
 class Block(BaseModel):
     """
@@ -82,6 +88,8 @@ class Block(BaseModel):
         children: List of child blocks
     """
 
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str = Field(..., description="Unique identifier for the block")
     type: BlockType = Field(..., description="The type of block")
     props: Dict[str, Any] = Field(
@@ -95,11 +103,12 @@ class Block(BaseModel):
         default_factory=list, description="Child blocks"
     )
 
-    @validator("content")
-    def validate_content(cls, v, values):
+    @field_validator("content")
+    @classmethod
+    def validate_content(cls, v, info: ValidationInfo):
         """Validate that content format matches the block type."""
-        if "type" in values:
-            block_type = values["type"]
+        if "type" in info.data:
+            block_type = info.data["type"]
             text_block_types = [
                 BlockType.HEADING,
                 BlockType.PARAGRAPH,
@@ -125,8 +134,9 @@ class Block(BaseModel):
                 pass
         return v
 
-    class Config:
-        use_enum_values = True
-
 
 Block.model_rebuild()
+
+# Compiled once and shared by the converters so that a whole document is
+# validated in a single pydantic-core pass.
+BLOCK_LIST_ADAPTER: TypeAdapter[List[Block]] = TypeAdapter(List[Block])